@@ -0,0 +1,254 @@
+"""
+Micro-benchmarks of the :mod:`buttons:buttons` template tags and filters
+
+Each tag of :mod:`buttons.templatetags.buttons_tags`, the :func:`buttons.templatetags.buttons_tags.expand_data` filter
+and the :func:`buttons.templatetags.querystring_tags.query_string` tag are measured separately, at parse and at render
+time, on a small and on a large page. Memory allocations are measured with :mod:`tracemalloc`.
+
+The benchmarks run offline, with a minimal in-memory django configuration:
+
+.. code::
+
+    $ python benchmarks/bench_tags.py --output bench.json
+    $ python benchmarks/bench_tags.py --output new.json --compare bench.json --threshold 1.2
+
+:creationdate: 17/10/2026 14:20
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: benchmarks.bench_tags
+
+"""
+
+import argparse
+import datetime
+import gc
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+# Loads the package from the sources
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+#: Benchmarked cases: name, template source of a single call, context
+CASES: List[Tuple[str, str, Dict[str, Any]]] = [
+    ("btn_button", "{% btn_button text='Button' url=url %}", {}),
+    ("btn_copy", "{% btn_copy url %}", {}),
+    ("btn_download", "{% btn_download url %}", {}),
+    ("btn_back", "{% btn_back %}", {}),
+    ("btn_link", "{% btn_link url %}", {}),
+    ("btn_home", "{% btn_home %}", {}),
+    ("btn_submit", "{% btn_submit %}", {}),
+    ("btn_list", "{% btn_list url %}", {}),
+    ("btn_detail", "{% btn_detail url %}", {}),
+    ("btn_create", "{% btn_create url %}", {}),
+    ("btn_search", "{% btn_search %}", {}),
+    ("btn_close", "{% btn_close 'Close' %}", {}),
+    ("btn_login", "{% btn_login url %}", {}),
+    ("btn_logout", "{% btn_logout url %}", {}),
+    ("btn_update", "{% btn_update url %}", {}),
+    ("btn_delete", "{% btn_delete url %}", {}),
+    ("btn_next", "{% btn_next url %}", {}),
+    ("btn_previous", "{% btn_previous url %}", {}),
+    ("btn_switch", "{% btn_switch True 'Yes,No' switch_url=url btn_id='switch' data_pk=1 %}", {}),
+    ("btn_single", "{% btn_single 'home' 'primary' 'Home' %}", {}),
+    ("expand_data", "{{ data|expand_data }}", {"data": {"pk": 1, "toggle": "modal", "active": True}}),
+    ("query_string", "{% query_string qs page=2 tag+'c' tag-'a' %}", {"qs": "?tag=a&tag=b&year=2011&page=1"}),
+]
+
+#: Benchmarked variants: name, settings overrides
+VARIANTS: List[Tuple[str, Dict[str, Any]]] = [
+    ("template", {}),
+    ("fast", {"BUTTONS_FAST_RENDERER": True}),
+    ("cache", {"BUTTONS_CACHE_SIZE": 1024}),
+]
+
+
+def setup_django() -> str:
+    """
+    Configures a minimal django project, with the available fontawesome application
+
+    :return: Fontawesome application name
+    """
+    fontawesome_app = "fontawesome_5" if importlib.util.find_spec("fontawesome_5") else "fontawesome"
+    settings.configure(
+        DEBUG=False,
+        SECRET_KEY="benchmarks",
+        INSTALLED_APPS=["buttons", fontawesome_app],
+        TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates", "APP_DIRS": True}],
+        BUTTONS_FONTAWESOME_VERSION=5 if fontawesome_app == "fontawesome_5" else 4,
+    )
+    django.setup()
+    return fontawesome_app
+
+
+def _timed(func, repeat: int) -> float:
+    """
+    Runs the function `repeat` times, and returns the best time
+
+    :param func: Function to run
+    :param repeat: Number of runs
+    :return: Best time, in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _allocations(func) -> Tuple[int, int]:
+    """
+    Measures the memory allocations of the function
+
+    :param func: Function to run
+    :return: Peak allocated size and number of allocated blocks still alive at the end of the run
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        func()
+        after = tracemalloc.take_snapshot()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return peak, blocks
+
+
+def bench_case(name: str, source: str, extra_context: Dict[str, Any], size: int, repeat: int) -> Dict[str, Any]:
+    """
+    Benchmarks a page made of `size` calls of the same tag
+
+    :param name: Case name
+    :param source: Template source of a single call
+    :param extra_context: Additional context
+    :param size: Number of calls in the page
+    :param repeat: Number of runs
+    :return: Measures
+    """
+    from django.template import Context, Template
+
+    page = "{% load buttons_tags querystring_tags %}" + source * size
+    context_data = {"url": "/objects/1/", **extra_context}
+
+    parse = _timed(lambda: Template(page), repeat)
+    template = Template(page)
+    render = _timed(lambda: template.render(Context(context_data)), repeat)
+    peak, blocks = _allocations(lambda: template.render(Context(context_data)))
+    return {
+        "name": name,
+        "size": size,
+        "parse_s": parse,
+        "render_s": render,
+        "parse_per_call_us": parse / size * 1e6,
+        "render_per_call_us": render / size * 1e6,
+        "render_peak_bytes": peak,
+        "render_peak_bytes_per_call": peak / size,
+        "render_alive_blocks": blocks,
+    }
+
+
+def run(sizes: List[int], repeat: int, only: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Runs all the benchmarks
+
+    :param sizes: Page sizes
+    :param repeat: Number of runs of each measure
+    :param only: Names of the cases to run, all if empty
+    :return: Measures
+    """
+    from django.test.utils import override_settings
+
+    results = []
+    for variant, overrides in VARIANTS:
+        with override_settings(**overrides):
+            for name, source, extra_context in CASES:
+                if only and name not in only:
+                    continue
+                for size in sizes:
+                    result = bench_case(name, source, extra_context, size, repeat)
+                    result["variant"] = variant
+                    results.append(result)
+                    print(
+                        f"{variant:>8} {name:>14} x{size:<6} "
+                        f"parse {result['parse_per_call_us']:9.2f} us/call  "
+                        f"render {result['render_per_call_us']:9.2f} us/call  "
+                        f"peak {result['render_peak_bytes_per_call']:9.1f} B/call"
+                    )
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline_file: str, threshold: float) -> bool:
+    """
+    Compares the results with a baseline file
+
+    :param results: Measures
+    :param baseline_file: Baseline JSON file, as written by `--output`
+    :param threshold: Maximum allowed ratio between the measures and the baseline
+    :return: True if no regression has been found
+    """
+    with open(baseline_file) as stream:
+        baseline = {(r["variant"], r["name"], r["size"]): r for r in json.load(stream)["results"]}
+
+    ok = True
+    for result in results:
+        reference = baseline.get((result["variant"], result["name"], result["size"]))
+        if reference is None:
+            continue
+        for measure in ("parse_s", "render_s"):
+            ratio = result[measure] / reference[measure]
+            if ratio > threshold:
+                ok = False
+                print(f"REGRESSION {result['variant']} {result['name']} x{result['size']} {measure}: {ratio:.2f}x")
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 10000], help="Number of calls per page")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs of each measure")
+    parser.add_argument("--only", nargs="*", help="Names of the cases to run")
+    parser.add_argument("--output", default="bench.json", help="JSON output file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Maximum allowed slowdown ratio")
+    args = parser.parse_args(argv)
+
+    fontawesome_app = setup_django()
+    from buttons import __version__
+
+    results = run(args.sizes, args.repeat, args.only)
+    with open(args.output, "w") as stream:
+        json.dump(
+            {
+                "meta": {
+                    "date": datetime.datetime.now().isoformat(),
+                    "buttons": __version__,
+                    "django": django.get_version(),
+                    "python": platform.python_version(),
+                    "fontawesome": fontawesome_app,
+                    "repeat": args.repeat,
+                },
+                "results": results,
+            },
+            stream,
+            indent=2,
+        )
+    print(f"Results written to {args.output}")
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,7 @@ Django application config
 import logging
 
 from django.apps import AppConfig
+from django.conf import settings
 
 __author__ = "fguerin"
 logger = logging.getLogger("buttons.apps")
@@ -18,4 +19,20 @@ class ButtonsAppConfig(AppConfig):
     name = "buttons"
 
     def ready(self):
+        from buttons import cache  # noqa -- Connects the `setting_changed` receiver
+        from buttons import signals
         from buttons.conf import ButtonsAppConf  # noqa
+
+        if signals.logger.isEnabledFor(logging.DEBUG):
+            signals.post_render.connect(signals.log_render)
+
+        from buttons.icons import warm_icons
+        from buttons.presets import load_presets
+
+        load_presets()
+        warm_icons()
+
+        if settings.BUTTONS_WARMUP:
+            from buttons.templatetags.buttons_tags import warm_templates
+
+            warm_templates()
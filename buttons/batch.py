@@ -0,0 +1,175 @@
+"""
+Batch rendering of the row action buttons, for list views
+
+The actions are described once for all the rows, as a list of ``(tag name, kwargs)`` pairs. The callable values of
+the kwargs are evaluated for each row, the other ones are shared by all rows:
+
+.. code::
+
+    actions = [
+        ("btn_detail", {"url": lambda obj: obj.get_absolute_url()}),
+        ("btn_delete", {"url": lambda obj: reverse("delete", args=[obj.pk]), "btn_id": lambda obj: f"del-{obj.pk}"}),
+    ]
+    rows = render_row_actions(object_list, actions)
+
+Large exports are streamed, the rows being rendered into chunks of HTML while the response is sent:
+
+.. code::
+
+    def render_row(row_actions):
+        return format_html("<tr><td>{}</td><td>{}</td></tr>\n", row_actions.row, row_actions.html)
+
+    chunks = stream_row_actions(Article.objects.all(), actions, render_row=render_row)
+    return StreamingHttpResponse(chunks)
+
+Each action is compiled into a :class:`buttons.stamps.ButtonStamp`, whose holes are the per-row values: the button is
+rendered only once, the settings, context values and defaults being resolved once for the whole batch, and the holes
+are filled with the row values. The rows whose values cannot fill the holes, *ie.* empty values, are rendered with the
+tag, see :mod:`buttons.stamps`.
+
+:creationdate: 17/10/2026 15:40
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.batch
+
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from django.db.models import QuerySet
+from django.template import Context
+from django.utils.safestring import SafeText, mark_safe
+
+from buttons.stamps import ButtonStamp
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.batch")
+
+ActionSpec = Tuple[str, Dict[str, Any]]
+
+#: Number of rows fetched at once from the database, and rendered into a single chunk, by :func:`stream_row_actions`
+STREAM_CHUNK_SIZE = 200
+
+
+class RowActions(NamedTuple):
+    """
+    Rendered action buttons of a row
+    """
+
+    row: Any
+    buttons: List[SafeText]
+
+    @property
+    def html(self) -> SafeText:
+        return mark_safe("".join(self.buttons))
+
+
+class CompiledAction:
+    """
+    Action of the batch: a button stamp, whose holes are the per-row values
+    """
+
+    __slots__ = ("name", "row_kwargs", "stamp")
+
+    def __init__(self, name: str, kwargs: Dict[str, Any], context: Context):
+        self.name = name
+        self.row_kwargs: Dict[str, Callable[[Any], Any]] = {
+            key: value for key, value in kwargs.items() if callable(value)
+        }
+        static_kwargs = {key: value for key, value in kwargs.items() if not callable(value)}
+        self.stamp = ButtonStamp(name, list(self.row_kwargs), static_kwargs, context)
+
+    def render(self, row: Any) -> SafeText:
+        """
+        Renders the button for the row
+
+        :param row: Row
+        :return: Rendered button
+        """
+        return self.stamp.render(**{key: func(row) for key, func in self.row_kwargs.items()})
+
+
+def compile_actions(actions: Sequence[ActionSpec], context: Context) -> List[CompiledAction]:
+    """
+    Compiles the actions specification
+
+    :param actions: Actions specification, as ``(tag name, kwargs)`` pairs
+    :param context: Rendering context
+    :return: Compiled actions
+    """
+    return [CompiledAction(name, kwargs, context) for name, kwargs in actions]
+
+
+def _get_context(context: Union[Context, Dict[str, Any], None]) -> Context:
+    if isinstance(context, Context):
+        return context
+    return Context(context or {})
+
+
+def iter_row_actions(
+    rows: Iterable[Any],
+    actions: Sequence[ActionSpec],
+    context: Union[Context, Dict[str, Any], None] = None,
+) -> Iterator[RowActions]:
+    """
+    Renders the action buttons of the rows, one row at a time
+
+    :param rows: Iterable of rows
+    :param actions: Actions specification, as ``(tag name, kwargs)`` pairs
+    :param context: Rendering context, or context data
+    :return: Iterator of :class:`RowActions`
+    """
+    context = _get_context(context)
+    compiled = compile_actions(actions, context)
+    for row in rows:
+        yield RowActions(row, [action.render(row) for action in compiled])
+
+
+def render_row_actions(
+    rows: Iterable[Any],
+    actions: Sequence[ActionSpec],
+    context: Union[Context, Dict[str, Any], None] = None,
+) -> List[RowActions]:
+    """
+    Renders the action buttons of all the rows
+
+    :param rows: Iterable of rows
+    :param actions: Actions specification, as ``(tag name, kwargs)`` pairs
+    :param context: Rendering context, or context data
+    :return: List of :class:`RowActions`
+    """
+    return list(iter_row_actions(rows, actions, context))
+
+
+def stream_row_actions(
+    rows: Iterable[Any],
+    actions: Sequence[ActionSpec],
+    context: Union[Context, Dict[str, Any], None] = None,
+    render_row: Optional[Callable[[RowActions], str]] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Renders the action buttons of the rows into chunks of HTML, for a :class:`django.http.StreamingHttpResponse`
+
+    The rows are rendered one at a time, and only a chunk of rows is held in memory: the querysets are iterated with
+    :meth:`django.db.models.query.QuerySet.iterator`, without filling their result cache.
+
+    :param rows: Iterable of rows, or queryset
+    :param actions: Actions specification, as ``(tag name, kwargs)`` pairs
+    :param context: Rendering context, or context data
+    :param render_row: Renders a row, with its :class:`RowActions`, default its buttons
+    :param chunk_size: Number of rows of each chunk
+    :return: Iterator of HTML chunks
+    """
+    if isinstance(rows, QuerySet) and rows._result_cache is None:
+        rows = rows.iterator(chunk_size=chunk_size)
+    render_row = render_row or (lambda row_actions: row_actions.html)
+
+    chunk: List[str] = []
+    for row_actions in iter_row_actions(rows, actions, context):
+        chunk.append(render_row(row_actions))
+        if len(chunk) >= chunk_size:
+            yield "".join(chunk)
+            chunk.clear()
+    if chunk:
+        yield "".join(chunk)
@@ -0,0 +1,184 @@
+"""
+In-process cache of the rendered buttons
+
+The rendered HTML of the buttons is stored in a bounded LRU cache, keyed on the fully resolved button data, the active
+language and the ``BUTTONS_*`` settings. Its size is set with the ``BUTTONS_CACHE_SIZE`` setting, ``0`` disables it.
+
+The button groups, see :func:`buttons.templatetags.buttons_tags.btn_group`, are stored into a django cache backend,
+with the keys made by :func:`make_group_key`.
+
+:creationdate: 17/10/2026 10:05
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.cache
+
+"""
+
+import enum
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import Promise
+from django.utils.translation import get_language
+
+from buttons.icons import clear_icons
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.cache")
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+#: Types of the button data values the keys are made of, *ie.* strings, numbers, lazy translations and icon positions:
+#: the other objects, *ie.* model instances, may be equal while their texts differ
+KEY_TYPES = (str, int, float, Promise, enum.Enum)
+
+
+class ButtonCache:
+    """
+    Thread-safe bounded LRU cache of rendered buttons
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Gets a rendered button from the cache
+
+        :param key: Cache key
+        :return: Rendered button, or ``None`` if not cached
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: str) -> None:
+        """
+        Stores a rendered button into the cache, evicting the least recently used ones if needed
+
+        :param key: Cache key
+        :param value: Rendered button
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Clears the cache and its statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Gets the cache statistics
+
+        :return: Cache statistics, as :func:`functools.lru_cache` does
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+_button_cache: Optional[ButtonCache] = None
+_settings_key: Optional[Tuple[Tuple[str, str], ...]] = None
+
+
+def get_button_cache() -> ButtonCache:
+    """
+    Gets the process-wide button cache, sized with the ``BUTTONS_CACHE_SIZE`` setting
+
+    :return: Button cache
+    """
+    global _button_cache
+    if _button_cache is None:
+        _button_cache = ButtonCache(settings.BUTTONS_CACHE_SIZE)
+    return _button_cache
+
+
+def _get_settings_key() -> Tuple[Tuple[str, str], ...]:
+    global _settings_key
+    if _settings_key is None:
+        _settings_key = tuple(
+            (name, repr(getattr(settings, name))) for name in dir(settings) if name.startswith("BUTTONS_")
+        )
+    return _settings_key
+
+
+def make_key(template_name: Any, output: Dict[str, Any], context) -> Optional[Tuple]:
+    """
+    Makes the cache key of a button
+
+    :param template_name: Template used to render the button
+    :param output: Button data, as returned by the tag function
+    :param context: Rendering context
+    :return: Cache key, or ``None`` if the button data are not made of :data:`KEY_TYPES` values
+    """
+    if not all(value is None or isinstance(value, KEY_TYPES) for value in output.values()):
+        return None
+    # The value type is part of the key: `True` and `1`, or `str` and `SafeString` do not render the same way
+    key = (
+        template_name,
+        get_language(),
+        context.autoescape,
+        context.use_l10n,
+        _get_settings_key(),
+        tuple((name, type(value), value) for name, value in output.items()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def make_group_key(name: str, vary_on: Iterable[Any], context) -> str:
+    """
+    Makes the cache key of a button group, as :func:`django.core.cache.utils.make_template_fragment_key` does, also
+    varying on the active language, the ``BUTTONS_*`` settings and the version of the application
+
+    :param name: Group name
+    :param vary_on: Values the group depends on
+    :param context: Rendering context
+    :return: Cache key
+    """
+    from buttons import __version__
+
+    digest = hashlib.md5()
+    for value in (__version__, get_language(), context.autoescape, context.use_l10n, _get_settings_key(), *vary_on):
+        digest.update(str(value).encode("utf-8"))
+        digest.update(b":")
+    return f"buttons.group.{hashlib.md5(str(name).encode('utf-8')).hexdigest()}.{digest.hexdigest()}"
+
+
+@receiver(setting_changed)
+def clear_button_cache(**kwargs) -> None:
+    """
+    Drops the button cache when a setting changes: the templates, the icons or the ``BUTTONS_*`` defaults may differ
+    """
+    global _button_cache, _settings_key
+    _button_cache = None
+    _settings_key = None
+    clear_icons()
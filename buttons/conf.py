@@ -31,5 +31,47 @@ class ButtonsAppConf(AppConf):
 
     DEFAULT_TEMPLATE_PATH: str = "buttons/{package}/button.html"
 
+    # Renders the buttons with :mod:`buttons.renderers` instead of the template engine
+    FAST_RENDERER: bool = False
+
+    # Size of the in-process LRU cache of the rendered buttons, `0` to disable it
+    CACHE_SIZE: int = 0
+
+    # Additional button presets, as `{name: ButtonPreset kwargs}`, see :mod:`buttons.presets`
+    PRESETS: dict = {}
+
+    # Icons rendered as webfont glyphs (`"font"`) or as references to an SVG sprite (`"sprite"`)
+    ICON_MODE: str = "font"
+
+    # Static path of the SVG sprite, as built by the `buttons_sprite` management command
+    ICON_SPRITE: str = ""
+
+    # The SVG sprite is inlined into the pages with `{% btn_icon_sprite %}`, else referenced by its static url
+    ICON_SPRITE_INLINE: bool = True
+
+    # JSON store of the precompiled buttons, as built by the `buttons_precompile` command, see :mod:`buttons.fragments`
+    FRAGMENTS: str = ""
+
+    # The templates of the buttons are loaded and parsed when the application is ready, see `warm_templates()`
+    WARMUP: bool = True
+
+    # The buttons are rendered without the comments and the attributes repeating their visible text
+    LEAN_MARKUP: bool = False
+
+    # Cache backend of the `{% btn_group %}` tags given a timeout
+    GROUP_CACHE: str = "default"
+
+    # Long query strings built by `query_string` are replaced by a state token, see :mod:`buttons.querystate`
+    QUERY_STATE: bool = False
+
+    # Minimum length of the query strings replaced by a state token
+    QUERY_STATE_MIN_LENGTH: int = 512
+
+    # Name of the state token parameter
+    QUERY_STATE_PARAM: str = "_qs"
+
+    # Maximum length of an expanded state token
+    QUERY_STATE_MAX_LENGTH: int = 65536
+
     class Meta:
         prefix = "buttons"
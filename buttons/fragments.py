@@ -0,0 +1,321 @@
+"""
+Ahead-of-time compiled buttons
+
+The ``buttons_precompile`` management command scans the project templates for button tags whose arguments are all
+literals, *ie.* ``{% btn_delete "/objects/delete/" btn_id="delete" %}``, and renders them once for each language into
+a JSON fragment store, set with the ``BUTTONS_FRAGMENTS`` setting. At runtime, those tags are read from the store
+instead of being rendered.
+
+A tag may read some context variables, *ie.* ``text`` or ``btn_id`` when they are not given as arguments: the names of
+those variables are recorded with the fragment, which is not used if one of them is defined into the context.
+
+The store is bound to the ``BUTTONS_*`` settings, the ``DEBUG`` setting and the version of the application: it is
+ignored if one of them has changed since it has been built. It must be rebuilt when the templates change.
+
+.. code::
+
+    $ python manage.py buttons_precompile
+
+:creationdate: 18/10/2026 16:20
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.fragments
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import Context, TemplateSyntaxError, engines
+from django.template.base import FilterExpression, Variable
+from django.utils import translation
+from django.utils.safestring import SafeText, mark_safe
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.fragments")
+
+#: Version of the store format
+STORE_VERSION = 1
+
+_LITERAL_NAMES = ("True", "False", "None")
+
+
+class Fragment(NamedTuple):
+    """
+    Precompiled button
+    """
+
+    html: SafeText
+    context_keys: FrozenSet[str]
+
+
+class Skipped(NamedTuple):
+    """
+    Button tag which cannot be precompiled
+    """
+
+    template: str
+    line: int
+    contents: str
+    reason: str
+
+
+class _RecordingContext(Context):
+    """
+    Context recording the names of the variables read by the tag functions
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.keys = set()
+
+    def __getitem__(self, key):
+        self.keys.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.keys.add(key)
+        return super().__contains__(key)
+
+    def get(self, key, otherwise=None):
+        self.keys.add(key)
+        return super().get(key, otherwise)
+
+
+def get_fingerprint() -> str:
+    """
+    Gets the fingerprint of the settings the rendered buttons depend on
+
+    :return: Fingerprint
+    """
+    from buttons import __version__
+    from buttons.templatetags.buttons_tags import get_filename
+
+    values = {name: getattr(settings, name) for name in dir(settings) if name.startswith("BUTTONS_")}
+    values.pop("BUTTONS_FRAGMENTS", None)
+    values.update({"DEBUG": settings.DEBUG, "version": __version__, "package": get_filename("{package}")})
+    with translation.override(None):
+        dump = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.md5(dump.encode("utf-8")).hexdigest()
+
+
+class FragmentStore:
+    """
+    Precompiled buttons, by language and tag contents
+    """
+
+    def __init__(self, fragments: Optional[Dict[str, Dict[str, Fragment]]] = None):
+        self.fragments = fragments or {}
+
+    def __len__(self) -> int:
+        return sum(len(fragments) for fragments in self.fragments.values())
+
+    @classmethod
+    def load(cls, filename: str) -> "FragmentStore":
+        """
+        Loads the store from a JSON file, as written by :meth:`dump`
+
+        :param filename: Store file
+        :return: Fragment store, empty if the file does not match the current settings
+        """
+        try:
+            with open(filename, encoding="utf-8") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError) as exception:
+            logger.warning("FragmentStore.load() unable to load %s: %s", filename, exception)
+            return cls()
+
+        if data.get("version") != STORE_VERSION or data.get("fingerprint") != get_fingerprint():
+            logger.warning("FragmentStore.load() %s does not match the current settings, it is ignored", filename)
+            return cls()
+
+        return cls(
+            {
+                language: {
+                    contents: Fragment(mark_safe(fragment["html"]), frozenset(fragment["context_keys"]))
+                    for contents, fragment in fragments.items()
+                }
+                for language, fragments in data["fragments"].items()
+            }
+        )
+
+    def dump(self, filename: str) -> None:
+        """
+        Writes the store into a JSON file
+
+        :param filename: Store file
+        """
+        data = {
+            "version": STORE_VERSION,
+            "fingerprint": get_fingerprint(),
+            "fragments": {
+                language: {
+                    contents: {"html": str(fragment.html), "context_keys": sorted(fragment.context_keys)}
+                    for contents, fragment in sorted(fragments.items())
+                }
+                for language, fragments in sorted(self.fragments.items())
+            },
+        }
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename, "w", encoding="utf-8") as stream:
+            json.dump(data, stream, indent=1, ensure_ascii=False)
+
+    def get(self, node, context) -> Optional[SafeText]:
+        """
+        Gets the precompiled button of a tag
+
+        :param node: Button node
+        :param context: Rendering context
+        :return: Rendered button, or ``None`` if the tag has not been precompiled for this context
+        """
+        if not self.fragments or not context.autoescape or context.use_l10n is not None:
+            return None
+        fragments = self.fragments.get(translation.get_language())
+        token = getattr(node, "token", None)
+        if fragments is None or token is None:
+            return None
+        fragment = fragments.get(token.contents)
+        if fragment is None:
+            return None
+        for key in fragment.context_keys:
+            if key in context:
+                return None
+        return fragment.html
+
+
+_fragment_store: Optional[FragmentStore] = None
+
+
+def get_fragment_store() -> FragmentStore:
+    """
+    Gets the process-wide fragment store, loaded from the ``BUTTONS_FRAGMENTS`` file
+
+    :return: Fragment store
+    """
+    global _fragment_store
+    if _fragment_store is None:
+        filename = settings.BUTTONS_FRAGMENTS
+        _fragment_store = FragmentStore.load(filename) if filename else FragmentStore()
+    return _fragment_store
+
+
+@receiver(setting_changed)
+def clear_fragment_store(**kwargs) -> None:
+    """
+    Drops the fragment store when a setting changes: it is reloaded, and checked against the new settings
+    """
+    global _fragment_store
+    _fragment_store = None
+
+
+def _is_literal(expression: FilterExpression) -> bool:
+    if expression.filters or expression.token.startswith("_("):
+        return False
+    var = expression.var
+    return not isinstance(var, Variable) or var.lookups is None or var.var in _LITERAL_NAMES
+
+
+def get_non_literal(node) -> Optional[str]:
+    """
+    Gets the first argument of the node which is not a literal
+
+    :param node: Button node
+    :return: Argument source, or ``None`` if all the arguments are literals
+    """
+    for expression in [*node.args, *node.kwargs.values()]:
+        if not _is_literal(expression):
+            return expression.token
+    return None
+
+
+def precompile_node(node, template=None) -> Fragment:
+    """
+    Renders a button node whose arguments are all literals, with the active language
+
+    :param node: Button node
+    :param template: Template of the node, which gives the template engine
+    :return: Precompiled button
+    """
+    context = Context(autoescape=True)
+    resolved_args, resolved_kwargs = node.get_resolved_arguments(context)
+    if node.takes_context:
+        recording_context = _RecordingContext(autoescape=True)
+        resolved_args[0] = recording_context
+    output = node.func(*resolved_args, **resolved_kwargs)
+    if template is None:
+        html = node.render_uncached(output, context)
+    else:
+        with context.bind_template(template):
+            html = node.render_uncached(output, context)
+    keys = frozenset(recording_context.keys) if node.takes_context else frozenset()
+    return Fragment(html, keys)
+
+
+def iter_templates(dirs: Optional[Iterable[str]] = None) -> Iterable[Tuple[Any, str]]:
+    """
+    Iterates over the templates of the django template engines
+
+    :param dirs: Templates directories, default the directories of the engines
+    :return: Iterator of (engine, template filename) pairs
+    """
+    for backend in engines.all():
+        engine = getattr(backend, "engine", None)
+        if engine is None:
+            # Not a django template engine, *ie.* jinja2
+            continue
+        for directory in dirs if dirs is not None else backend.template_dirs:
+            for root, _dirs, files in os.walk(directory):
+                for filename in sorted(files):
+                    if filename.endswith((".html", ".htm", ".txt")):
+                        yield engine, os.path.join(root, filename)
+
+
+def precompile(languages: Sequence[str], dirs: Optional[Iterable[str]] = None) -> Tuple[FragmentStore, List[Skipped]]:
+    """
+    Precompiles the button tags of the templates whose arguments are all literals
+
+    :param languages: Language codes
+    :param dirs: Templates directories, default the directories of the template engines
+    :return: Fragment store, and the tags which could not be precompiled
+    """
+    from buttons.templatetags.buttons_tags import ButtonNode
+
+    nodes: Dict[str, Any] = {}
+    skipped: List[Skipped] = []
+    for engine, filename in iter_templates(dirs):
+        with open(filename, encoding="utf-8", errors="replace") as stream:
+            source = stream.read()
+        if "buttons_tags" not in source:
+            continue
+        try:
+            template = engine.from_string(source)
+        except TemplateSyntaxError as exception:
+            skipped.append(Skipped(filename, 0, "", f"template error: {exception}"))
+            continue
+        for node in template.nodelist.get_nodes_by_type(ButtonNode):
+            non_literal = get_non_literal(node)
+            if non_literal is not None:
+                reason = f"non-literal argument: {non_literal}"
+                skipped.append(Skipped(filename, node.token.lineno, node.token.contents, reason))
+            else:
+                nodes.setdefault(node.token.contents, (filename, template, node))
+
+    store = FragmentStore()
+    for language in languages:
+        fragments = store.fragments.setdefault(language, {})
+        with translation.override(language):
+            for contents, (filename, template, node) in nodes.items():
+                try:
+                    fragments[contents] = precompile_node(node, template)
+                except Exception as exception:
+                    if language == languages[0]:
+                        reason = f"render error: {exception.__class__.__name__}: {exception}"
+                        skipped.append(Skipped(filename, node.token.lineno, contents, reason))
+    return store, skipped
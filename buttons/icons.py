@@ -0,0 +1,185 @@
+"""
+Process-wide cache of the rendered icons
+
+The icons used by the buttons are few, and always rendered the same way: their HTML is cached, keyed on the icon name,
+its style and its additional args (classes, title...). The cache can be warmed at startup with the icons of the
+presets, see :func:`warm_icons`.
+
+When ``BUTTONS_ICON_MODE`` is ``"sprite"``, the icons are rendered as references to the symbols of an SVG sprite,
+``<svg><use href="#icon-trash"/></svg>``, instead of webfont glyphs. The sprite is built by the ``buttons_sprite``
+management command, see :mod:`buttons.sprite`.
+
+:creationdate: 18/10/2026 11:15
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.icons
+
+"""
+
+import logging
+from functools import lru_cache
+from typing import Iterable, Set
+
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import escape
+from django.utils.safestring import SafeText, mark_safe
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.icons")
+
+#: Maximum number of cached icons
+ICON_CACHE_SIZE = 1024
+
+#: Prefix of the ids of the sprite symbols
+SPRITE_ID_PREFIX = "icon-"
+
+#: Fontawesome 5 style prefixes, which have no meaning for the sprite icons
+FA5_STYLE_PREFIXES = ("fas", "far", "fab", "fal")
+
+#: Fontawesome 5 icon keyword args rendered as classes
+FA5_CLASSES = {"border": "fa-border", "class": "{}", "fixed_width": "fa-fw", "size": "{}", "spin": "fa-spin"}
+
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def _cached_fa5_icon(icon, style_prefix, kwargs) -> SafeText:
+    from fontawesome_5 import Icon
+
+    return Icon(icon, style_prefix, **dict(kwargs)).as_html()
+
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def _cached_fa4_icon(icon, kwargs) -> SafeText:
+    from fontawesome.templatetags.fontawesome import fontawesome_icon
+
+    return fontawesome_icon(icon, **dict(kwargs))
+
+
+def get_sprite_href(icon: str) -> str:
+    """
+    Gets the reference of the icon symbol: local to the page if the sprite is inlined, else into the sprite file
+
+    :param icon: Icon name
+    :return: Symbol reference
+    """
+    if settings.BUTTONS_ICON_SPRITE and not settings.BUTTONS_ICON_SPRITE_INLINE:
+        return f"{static(settings.BUTTONS_ICON_SPRITE)}#{SPRITE_ID_PREFIX}{icon}"
+    return f"#{SPRITE_ID_PREFIX}{icon}"
+
+
+@lru_cache(maxsize=ICON_CACHE_SIZE)
+def _cached_svg_icon(icon, classes, title) -> SafeText:
+    if not icon:
+        return mark_safe("")
+    css_class = escape(" ".join(["btn-icon", f"{SPRITE_ID_PREFIX}{icon}", *classes]))
+    href = escape(get_sprite_href(icon))
+    if title:
+        return mark_safe(
+            f'<svg class="{css_class}" role="img" aria-label="{escape(title)}">'
+            f'<title>{escape(title)}</title><use href="{href}"/></svg>'
+        )
+    return mark_safe(f'<svg class="{css_class}" aria-hidden="true"><use href="{href}"/></svg>')
+
+
+def svg_icon(icon, classes: Iterable[str] = (), title: str = "") -> SafeText:
+    """
+    Renders the icon as a reference to a symbol of the SVG sprite
+
+    :param icon: Icon name
+    :param classes: Additional css classes
+    :param title: Icon title
+    :return: Icon HTML
+    """
+    return _cached_svg_icon(icon, tuple(classes), title)
+
+
+def _use_sprite() -> bool:
+    return settings.BUTTONS_ICON_MODE == "sprite"
+
+
+def fa5_icon(icon, style_prefix: str = "fas", **kwargs) -> SafeText:
+    """
+    Renders the icon as ``{% fa5_icon icon style_prefix **kwargs %}`` does, from the cache if available
+
+    :param icon: Icon name
+    :param style_prefix: Icon style prefix, *ie.* ``fas``
+    :param kwargs: Additional icon keyword args, *ie.* ``title``
+    :return: Icon HTML
+    """
+    if _use_sprite():
+        classes = [css_class for css_class in style_prefix.split() if css_class not in FA5_STYLE_PREFIXES]
+        classes += [FA5_CLASSES[key].format(value) for key, value in kwargs.items() if key in FA5_CLASSES and value]
+        return svg_icon(icon, classes, kwargs.get("title", ""))
+    try:
+        return _cached_fa5_icon(icon, style_prefix, tuple(kwargs.items()))
+    except TypeError:
+        # Unhashable args
+        from fontawesome_5 import Icon
+
+        return Icon(icon, style_prefix, **kwargs).as_html()
+
+
+def fa4_icon(icon, **kwargs) -> SafeText:
+    """
+    Renders the icon as ``{% fontawesome_icon icon **kwargs %}`` does, from the cache if available
+
+    :param icon: Icon name
+    :param kwargs: Additional icon keyword args, *ie.* ``title`` or ``fixed``
+    :return: Icon HTML
+    """
+    if _use_sprite():
+        classes = [css_class for key, css_class in (("large", "fa-lg"), ("fixed", "fa-fw")) if kwargs.get(key)]
+        return svg_icon(icon, classes, kwargs.get("title", ""))
+    try:
+        return _cached_fa4_icon(icon, tuple(kwargs.items()))
+    except TypeError:
+        # Unhashable args
+        from fontawesome.templatetags.fontawesome import fontawesome_icon
+
+        return fontawesome_icon(icon, **kwargs)
+
+
+def clear_icons() -> None:
+    """
+    Clears the icons cache
+    """
+    _cached_fa5_icon.cache_clear()
+    _cached_fa4_icon.cache_clear()
+    _cached_svg_icon.cache_clear()
+
+
+def get_preset_icons() -> Set[str]:
+    """
+    Gets the icons used by the presets and the ``BUTTONS_ICON`` default
+
+    :return: Icon names
+    """
+    from buttons.presets import presets
+
+    icons = {preset.icon for preset in presets if preset.icon}
+    icons.add(settings.BUTTONS_ICON)
+    return icons
+
+
+def warm_icons(icons: Iterable[str] = None) -> None:
+    """
+    Renders the icons of the button templates into the cache
+
+    :param icons: Icon names, default the icons of the presets
+    """
+    from buttons.templatetags.buttons_tags import get_filename
+
+    if icons is None:
+        icons = get_preset_icons()
+    if _use_sprite():
+        for icon in icons:
+            svg_icon(icon)
+        return
+    try:
+        if get_filename("{package}") == "fontawesome-5":
+            for icon in icons:
+                fa5_icon(icon, "fas")
+        else:
+            for icon in icons:
+                fa4_icon(icon)
+    except ImportError:
+        logger.warning("warm_icons() the fontawesome application is not installed")
@@ -0,0 +1,104 @@
+"""
+Jinja2 support for the :mod:`buttons:buttons` application
+
+The :class:`ButtonsExtension` extension exposes every button tag as a global function, the `expand_data` filter and a
+`query_string` global function. The buttons are rendered with the :mod:`buttons.renderers`, which are bound once per
+environment, so the output is the same as with the django template engine.
+
+.. code::
+
+    TEMPLATES = [
+        {
+            "BACKEND": "django.template.backends.jinja2.Jinja2",
+            "APP_DIRS": True,
+            "OPTIONS": {"extensions": ["buttons.jinja2ext.ButtonsExtension"]},
+        },
+    ]
+
+.. code::
+
+    {{ btn_delete(object.get_delete_url(), btn_id="delete") }}
+    {{ data|expand_data }}
+    {{ query_string(request.GET, ("tag", "+", "python"), ("tag", "-", "java"), page=2) }}
+
+:creationdate: 17/10/2026 17:10
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.jinja2ext
+
+"""
+
+import logging
+from typing import Any, Callable, Dict
+
+from django.template import Context
+from django.utils.safestring import SafeText, mark_safe
+from jinja2 import pass_context
+from jinja2.ext import Extension
+
+from buttons.renderers import get_fast_renderer
+from buttons.templatetags.buttons_tags import BUTTON_TAGS, ButtonNode, ButtonTag, expand_data
+from buttons.templatetags.querystring_tags import build_query_string
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.jinja2ext")
+
+
+class JinjaButtonNode(ButtonNode):
+    """
+    Button node rendered with the fast renderers whatever the ``BUTTONS_FAST_RENDERER`` setting is
+
+    .. note::
+
+        Buttons with custom templates, which have no fast renderer, are rendered with the django template engine
+    """
+
+    def render_uncached(self, output: Dict[str, Any], context) -> SafeText:
+        renderer = get_fast_renderer(self.filename)
+        if renderer is None:
+            return super().render_uncached(output, context)
+        return renderer(output, context)
+
+
+def make_button_function(tag: ButtonTag) -> Callable[..., SafeText]:
+    """
+    Makes a jinja2 global function from a button tag
+
+    :param tag: Button tag
+    :return: Jinja2 function
+    """
+    node = JinjaButtonNode(tag.func, tag.takes_context, [], {}, tag.filename)
+
+    @pass_context
+    def render_button(jinja_context, *args, **kwargs) -> SafeText:
+        context = Context(autoescape=jinja_context.eval_ctx.autoescape)
+        resolved_args = [jinja_context, *args] if tag.takes_context else list(args)
+        return node.render_call(resolved_args, kwargs, context)
+
+    render_button.__name__ = render_button.__qualname__ = tag.func.__name__
+    render_button.__doc__ = tag.func.__doc__
+    return render_button
+
+
+def query_string(query_dict=None, *modifiers, **replacements) -> SafeText:
+    """
+    Builds a query string, as the :func:`buttons.templatetags.querystring_tags.query_string` tag does
+
+    :param query_dict: Base query string, dict or QueryDict
+    :param modifiers: Modifiers, as ``(name, op, value)`` tuples, with `op` in {=, +, -, ^}
+    :param replacements: Replaced values, as the ``=`` modifier, applied after the other modifiers
+    :return: Query string
+    """
+    modifiers = [*modifiers, *((name, "=", value) for name, value in replacements.items())]
+    return mark_safe(build_query_string(query_dict, modifiers))
+
+
+class ButtonsExtension(Extension):
+    """
+    Jinja2 extension exposing the buttons tags, the `expand_data` filter and the `query_string` function
+    """
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.globals.update({name: make_button_function(tag) for name, tag in BUTTON_TAGS.items()})
+        environment.globals["query_string"] = query_string
+        environment.filters["expand_data"] = expand_data
@@ -0,0 +1,176 @@
+"""
+JavaScript render functions of the buttons, for the client-side grids
+
+The ``buttons_jsmodule`` command writes an ES module, one for each language, into the static files. Its functions
+render the same HTML as the tags, from the same params, in the browser:
+
+.. code::
+
+    $ python manage.py buttons_jsmodule
+    $ python manage.py buttons_jsmodule --all-languages --check
+
+.. code::
+
+    import {btnButton, btnSwitch, presets} from "/static/buttons/js/buttons.fr.js";
+
+    cell.innerHTML = presets.delete(row.delete_url, {btn_id: `delete-${row.pk}`});
+
+The render functions are written once, in the `buttons/js/module.js` template, after the fast renderers of
+:mod:`buttons.renderers`. Everything else is taken from the python side when the module is built: the version of the
+application, the ``BUTTONS_*`` settings, the translated defaults of the presets and of the switches, and the markup
+of the icons, rendered with markers in place of the icon names and titles. The module must be rebuilt with the
+static files, *ie.* at deployment time: ``--check`` fails if it is not up to date.
+
+.. note::
+
+    The module does not honor any project-level override of the buttons templates, as the fast renderers.
+
+:creationdate: 21/10/2026 14:30
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.jsmodule
+
+"""
+
+import inspect
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Union
+
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.functional import Promise
+from django.utils.safestring import mark_safe
+
+from buttons import __version__
+from buttons.icons import fa4_icon, fa5_icon, get_preset_icons
+from buttons.presets import presets
+from buttons.stamps import Part, join_holes, split_holes
+from buttons.templatetags.buttons_tags import IconPosition, btn_switch, get_filename
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.jsmodule")
+
+#: Static path of the modules, formatted with their language
+MODULE_PATH = "buttons/js/buttons.{language}.js"
+
+#: Template of the modules
+MODULE_TEMPLATE = "buttons/js/module.js"
+
+#: Icons of the buttons, of the switches and of the single buttons, as rendered by the templates, by package
+ICON_RENDERERS: Dict[str, Dict[str, Callable[..., str]]] = {
+    "fontawesome-5": {
+        "button": lambda icon: fa5_icon(icon, "fas"),
+        "switch": lambda icon, title: fa5_icon(icon, "fa-2x fa-fw", title=title),
+        "single": lambda icon: fa5_icon(icon, "fa-fw"),
+    },
+    "fontawesome-4": {
+        "button": lambda icon: fa4_icon(icon),
+        "switch": lambda icon, title: fa4_icon(icon, large=True, fixed=True, title=title),
+        "single": lambda icon: fa4_icon(icon, fixed=True),
+    },
+}
+
+
+def _parts_to_json(parts: List[Part]) -> List[Union[str, Dict[str, Any]]]:
+    # The holes are read as `{"hole": name, "escape": bool}` objects by the module
+    return [part if isinstance(part, str) else part._asdict() for part in parts]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, IconPosition):
+        # Rendered as `IconPosition.LEFT` into the additional attributes
+        return {"IconPosition": value.value}
+    if isinstance(value, Promise):
+        return str(value)
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    raise ValueError(f"Unsupported value: {value!r}")
+
+
+def get_module_data() -> Dict[str, Any]:
+    """
+    Gets the data of the module, for the active language
+
+    :return: Module data
+    """
+    renderers = ICON_RENDERERS[get_filename("{package}")]
+    parts = {
+        "button": split_holes(renderers["button"], ["icon"]),
+        "switch": split_holes(renderers["switch"], ["icon", "title"]),
+        "single": split_holes(renderers["single"], ["icon"]),
+    }
+
+    # Icons whose markup is not the generic one, *ie.* the brand icons
+    icons = {}
+    for icon in sorted(get_preset_icons() | {settings.BUTTONS_ICON}):
+        html = str(renderers["button"](icon))
+        if html != join_holes(parts["button"], {"icon": icon}):
+            icons[icon] = html
+
+    switch_defaults = {
+        name: _to_json(parameter.default)
+        for name, parameter in inspect.signature(btn_switch).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    return {
+        "version": __version__,
+        "debug": settings.DEBUG,
+        "lean": settings.BUTTONS_LEAN_MARKUP,
+        "defaults": {
+            "icon": settings.BUTTONS_ICON,
+            "icon_position": settings.BUTTONS_ICON_POSITION,
+            "btn_css_color": settings.BUTTONS_BTN_CSS_COLOR,
+            "btn_css_extra": settings.BUTTONS_BTN_CSS_EXTRA,
+        },
+        "presets": {
+            preset.name: {key: _to_json(value) for key, value in presets[preset.name].defaults.items()}
+            for preset in presets
+        },
+        "switch": switch_defaults,
+        "parts": {name: _parts_to_json(fragment) for name, fragment in parts.items()},
+        "icons": icons,
+    }
+
+
+def build_module(language: str) -> str:
+    """
+    Builds the module of a language
+
+    :param language: Language code
+    :return: Module source
+    """
+    with translation.override(language):
+        data = get_module_data()
+    return render_to_string(
+        MODULE_TEMPLATE, {"version": __version__, "language": language, "data": mark_safe(json.dumps(data))}
+    )
+
+
+def get_module_filename(output_dir: str, language: str) -> str:
+    """
+    Gets the file name of the module of a language
+
+    :param output_dir: Static files directory
+    :param language: Language code
+    :return: File name
+    """
+    return os.path.join(output_dir, MODULE_PATH.format(language=language))
+
+
+def write_module(content: str, output_dir: str, language: str) -> str:
+    """
+    Writes the module of a language into the static files directory
+
+    :param content: Module source
+    :param output_dir: Static files directory
+    :param language: Language code
+    :return: Static path of the module
+    """
+    filename = get_module_filename(output_dir, language)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as stream:
+        stream.write(content)
+    logger.info("write_module() %s written", filename)
+    return MODULE_PATH.format(language=language)
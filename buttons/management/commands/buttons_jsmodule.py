@@ -0,0 +1,67 @@
+"""
+Builds the JavaScript render functions of the buttons
+
+:creationdate: 21/10/2026 15:10
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.management.commands.buttons_jsmodule
+
+"""
+
+import logging
+
+from django.conf import global_settings, settings
+from django.core.management import BaseCommand, CommandError
+
+from buttons.jsmodule import build_module, get_module_filename, write_module
+from buttons.management.commands.buttons_sprite import get_output_dir
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.management.commands.buttons_jsmodule")
+
+
+class Command(BaseCommand):
+    help = "Builds the ES modules rendering the buttons in the browser, for the given languages, into the static files"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output-dir", help="Static files directory, default the first of STATICFILES_DIRS")
+        parser.add_argument("--language", action="append", help="Language code, may be repeated, default LANGUAGE_CODE")
+        parser.add_argument("--all-languages", action="store_true", help="Build the modules of all the LANGUAGES")
+        parser.add_argument("--check", action="store_true", help="Exit with an error if the modules are not up to date")
+
+    def handle(self, *args, **options):
+        output_dir = options["output_dir"] or get_output_dir()
+        languages = options["language"]
+        if not languages and options["all_languages"] and settings.USE_I18N:
+            if settings.LANGUAGES == global_settings.LANGUAGES:
+                raise CommandError(
+                    "LANGUAGES is not set in the settings, the Django default would build "
+                    f"{len(settings.LANGUAGES)} modules: set LANGUAGES, or give the --language option"
+                )
+            languages = [code for code, _name in settings.LANGUAGES]
+        if not languages:
+            languages = [settings.LANGUAGE_CODE]
+
+        outdated = []
+        for language in languages:
+            try:
+                content = build_module(language)
+            except (ImportError, ValueError) as exception:
+                raise CommandError(f"The module cannot be built: {exception}") from exception
+
+            if options["check"]:
+                try:
+                    with open(get_module_filename(output_dir, language), encoding="utf-8") as stream:
+                        current = stream.read()
+                except FileNotFoundError:
+                    current = None
+                if current != content:
+                    outdated.append(language)
+                continue
+
+            path = write_module(content, output_dir, language)
+            self.stdout.write(self.style.SUCCESS(f"Module written to {path} ({len(content)} bytes)"))
+
+        if outdated:
+            raise CommandError(f"Modules not up to date for {', '.join(outdated)}: run `manage.py buttons_jsmodule`")
+        if options["check"]:
+            self.stdout.write(self.style.SUCCESS(f"Modules up to date for {', '.join(languages)}"))
@@ -0,0 +1,50 @@
+"""
+Precompiles the button tags of the templates whose arguments are all literals
+
+:creationdate: 18/10/2026 16:55
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.management.commands.buttons_precompile
+
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from buttons.fragments import precompile
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.management.commands.buttons_precompile")
+
+
+class Command(BaseCommand):
+    help = "Precompiles the button tags whose arguments are all literals, for each language, into BUTTONS_FRAGMENTS"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="Fragment store file, default the BUTTONS_FRAGMENTS setting")
+        parser.add_argument("--language", action="append", help="Language code, may be repeated, default LANGUAGES")
+        parser.add_argument("--templates-dir", action="append", help="Templates directory, default all of them")
+
+    def handle(self, *args, **options):
+        output = options["output"] or settings.BUTTONS_FRAGMENTS
+        if not output:
+            raise CommandError("No fragment store file: set BUTTONS_FRAGMENTS, or give the --output option")
+
+        languages = options["language"]
+        if not languages:
+            languages = [code for code, _name in settings.LANGUAGES] if settings.USE_I18N else [settings.LANGUAGE_CODE]
+
+        store, skipped = precompile(languages, options["templates_dir"])
+        store.dump(output)
+
+        for item in skipped:
+            tag = f" {{% {item.contents} %}}" if item.contents else ""
+            self.stdout.write(self.style.WARNING(f"{item.template}:{item.line}{tag}: {item.reason}"))
+        count = len(store.fragments.get(languages[0], {}))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{count} button tags precompiled for {len(languages)} languages into {output}, "
+                f"{len(skipped)} skipped"
+            )
+        )
@@ -0,0 +1,58 @@
+"""
+Builds the SVG sprite of the icons used by the buttons
+
+:creationdate: 18/10/2026 14:40
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.management.commands.buttons_sprite
+
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from buttons.sprite import build_sprite, collect_icons, write_sprite
+from buttons.templatetags.buttons_tags import get_filename
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.management.commands.buttons_sprite")
+
+
+def get_output_dir() -> str:
+    """
+    Gets the default output directory: the first static files directory, else the static root
+
+    :return: Output directory
+    """
+    for directory in getattr(settings, "STATICFILES_DIRS", []):
+        # Prefixed directories are given as (prefix, path) pairs
+        return directory if isinstance(directory, str) else directory[1]
+    if settings.STATIC_ROOT:
+        return settings.STATIC_ROOT
+    raise CommandError("No static files directory found, please give the --output-dir option")
+
+
+class Command(BaseCommand):
+    help = "Builds the SVG sprite of the icons used by the presets, BUTTONS_ICON and the templates"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output-dir", help="Static files directory, default the first of STATICFILES_DIRS")
+        parser.add_argument("--icon", action="append", default=[], help="Additional icon, may be repeated")
+        parser.add_argument("--no-scan", action="store_true", help="Do not scan the templates for icons")
+
+    def handle(self, *args, **options):
+        output_dir = options["output_dir"] or get_output_dir()
+        icons = collect_icons(options["icon"], scan=not options["no_scan"])
+        try:
+            content, missing = build_sprite(icons, get_filename("{package}"))
+        except ImportError:
+            raise CommandError("The fontawesome application is not installed") from None
+
+        for icon in missing:
+            self.stderr.write(self.style.WARNING(f"Icon not found: {icon}"))
+        path = write_sprite(content, output_dir)
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(icons) - len(missing)} icons written to {path} ({len(content)} bytes)")
+        )
+        self.stdout.write(f'Set BUTTONS_ICON_MODE = "sprite" and BUTTONS_ICON_SPRITE = "{path}" in your settings')
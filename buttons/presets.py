@@ -0,0 +1,346 @@
+"""
+Declarative button presets
+
+A preset is declared once, as an immutable :class:`ButtonPreset`, and compiled at
+:meth:`buttons.apps.ButtonsAppConfig.ready` into a :class:`CompiledPreset`, with its defaults already merged. Each
+compiled preset which is not a built-in tag is registered as a ``btn_<name>`` tag. The built-in tags, *ie.*
+``btn_delete``, render their compiled preset, declared in :data:`BUILTIN_PRESETS`: a preset registered under the
+same name overrides their defaults. A preset named after another tag, *ie.* ``group`` for ``btn_group``, is rejected.
+
+Presets can be declared in the settings:
+
+.. code::
+
+    BUTTONS_PRESETS = {
+        "archive": {"text": _("Archive"), "icon": "archive", "btn_css_color": "btn-warning"},
+        "export": {"text": _("Export"), "icon": "file-export", "icon_position": "LEFT"},
+    }
+
+or registered from the code, *ie.* in an :meth:`django.apps.AppConfig.ready` method:
+
+.. code::
+
+    from buttons.presets import ButtonPreset, register_preset
+
+    register_preset(ButtonPreset("archive", text=_("Archive"), icon="archive", btn_css_color="btn-warning"))
+
+.. code::
+
+    {% load buttons_tags %}
+    {% btn_archive object.get_archive_url %}
+
+:creationdate: 18/10/2026 09:30
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.presets
+
+"""
+
+import logging
+from typing import Any, Dict, Iterator, Mapping, Optional, Set, Tuple, Union
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.safestring import SafeText
+
+from buttons.templatetags.buttons_tags import (
+    BUTTON_TAGS,
+    CONTEXT_PARAMS,
+    OUTPUT_FIELDS,
+    ButtonText,
+    IconPosition,
+    btn_button,
+    button_tag,
+    get_button_settings,
+    register,
+)
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.presets")
+
+
+class ButtonPreset:
+    """
+    Immutable button preset
+    """
+
+    __slots__ = ("name", "text", "icon", "icon_position", "btn_css_color", "url", "btn_type", "attrs")
+
+    def __init__(
+        self,
+        name: str,
+        text: Optional[str] = None,
+        icon: Optional[str] = None,
+        icon_position: Union[IconPosition, str] = IconPosition.RIGHT,
+        btn_css_color: Optional[str] = None,
+        url: Optional[str] = None,
+        btn_type: Optional[str] = None,
+        attrs: Optional[Mapping[str, Any]] = None,
+    ):
+        """
+        Initializes the preset
+
+        :param name: Preset name, the tag is named ``btn_<name>``
+        :param text: Button text
+        :param icon: Button icon
+        :param icon_position: Button icon position
+        :param btn_css_color: Button css color class, default from the settings
+        :param url: Default target url
+        :param btn_type: Button type, for ``button`` tags
+        :param attrs: Additional keyword args passed to :func:`buttons.templatetags.buttons_tags.btn_button`
+        """
+        for slot, value in (
+            ("name", name),
+            ("text", text),
+            ("icon", icon),
+            ("icon_position", icon_position),
+            ("btn_css_color", btn_css_color),
+            ("url", url),
+            ("btn_type", btn_type),
+            ("attrs", tuple((attrs or {}).items())),
+        ):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.name}>"
+
+    @property
+    def tag_name(self) -> str:
+        return f"btn_{self.name}"
+
+    def get_defaults(self) -> Dict[str, Any]:
+        """
+        Gets the keyword args passed to :func:`buttons.templatetags.buttons_tags.btn_button`
+
+        :return: Defaults
+        """
+        defaults = {
+            "text": self.text,
+            "icon": self.icon,
+            "icon_position": self.icon_position,
+            "btn_css_color": self.btn_css_color,
+            "url": self.url,
+            "btn_type": self.btn_type,
+            **dict(self.attrs),
+        }
+        return {key: value for key, value in defaults.items() if value is not None}
+
+
+class CompiledPreset:
+    """
+    Preset compiled into a callable, with its defaults merged
+
+    The button data of the preset, resolved by :func:`buttons.templatetags.buttons_tags.btn_button` from its defaults
+    and the settings, are computed once: the calls only set the fields of their params. The calls whose params or
+    context change more than these fields, *ie.* an ``icon_position`` param or a ``title`` in the context, are
+    resolved by :func:`buttons.templatetags.buttons_tags.btn_button`.
+    """
+
+    __slots__ = ("preset", "defaults", "node", "context_params", "_output")
+
+    def __init__(self, preset: ButtonPreset):
+        self.preset = preset
+        defaults = preset.get_defaults()
+        if "icon_position" in defaults and not isinstance(defaults["icon_position"], IconPosition):
+            defaults["icon_position"] = IconPosition(defaults["icon_position"].upper())
+        self.defaults = defaults
+        self.node = BUTTON_TAGS["btn_button"].get_node()
+        #: Params read from the context, as the defaults leave them empty
+        self.context_params = tuple(key for key in CONTEXT_PARAMS if not defaults.get(key))
+        self._output: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+
+    def get_defaults_output(self) -> Dict[str, Any]:
+        """
+        Gets the button data of the preset, without params nor context, cached until a setting changes
+
+        :return: Button data, not to be modified
+        """
+        button_settings = get_button_settings()
+        cached = self._output
+        if cached is None or cached[0] is not button_settings:
+            cached = self._output = (button_settings, btn_button({}, **self.defaults))
+        return cached[1]
+
+    def get_output(self, context, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Gets the button data, as :func:`buttons.templatetags.buttons_tags.btn_button` does
+
+        :param context: Context data
+        :param overrides: Keyword args, which override the preset defaults
+        :return: Render-able dict
+        """
+        output = self.get_defaults_output()
+        fields = {}
+        for key, value in overrides.items():
+            field = OUTPUT_FIELDS.get(key)
+            if field is None or not value:
+                return btn_button(context, **{**self.defaults, **overrides})
+            fields[field] = value
+        for key in self.context_params:
+            if key in context and key not in overrides:
+                return btn_button(context, **{**self.defaults, **overrides})
+        return {**output, **fields}
+
+    def __call__(self, context, url: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Gets the button data, as :func:`buttons.templatetags.buttons_tags.btn_button` does
+
+        :param context: Context data
+        :param url: Target url, default from the preset
+        :param kwargs: Additional keyword args, which override the preset defaults
+        :return: Render-able dict
+        """
+        if url is not None:
+            kwargs["url"] = url
+        return self.get_output(context, kwargs)
+
+    def render(self, context, url: Optional[str] = None, **kwargs) -> SafeText:
+        """
+        Renders the button
+
+        :param context: Rendering context
+        :param url: Target url, default from the preset
+        :param kwargs: Additional keyword args, which override the preset defaults
+        :return: Rendered button
+        """
+        if url is not None:
+            kwargs["url"] = url
+        return self.node.render_call([context], {**self.defaults, **kwargs}, context)
+
+
+class PresetRegistry:
+    """
+    Registry of the button presets
+    """
+
+    def __init__(self):
+        self._presets: Dict[str, ButtonPreset] = {}
+        self._compiled: Dict[str, CompiledPreset] = {}
+        self._tag_names: Set[str] = set()
+        self.ready = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._presets
+
+    def __getitem__(self, name: str) -> CompiledPreset:
+        return self._compiled[name]
+
+    def __iter__(self) -> Iterator[ButtonPreset]:
+        return iter(self._presets.values())
+
+    def __len__(self) -> int:
+        return len(self._presets)
+
+    def register(self, preset: ButtonPreset) -> None:
+        """
+        Registers a preset, compiled at once if the registry is ready
+
+        :param preset: Button preset
+        :raises ImproperlyConfigured: If the tag of the preset would replace another tag, *ie.* ``btn_group``
+        """
+        builtin = any(item.name == preset.name for item in BUILTIN_PRESETS)
+        if preset.tag_name in register.tags and preset.tag_name not in self._tag_names and not builtin:
+            raise ImproperlyConfigured(f"{preset!r}: the {preset.tag_name} tag is already registered")
+        self._presets[preset.name] = preset
+        if self.ready:
+            self._compile(preset)
+
+    def compile(self) -> None:
+        """
+        Compiles all the registered presets
+        """
+        for preset in self._presets.values():
+            self._compile(preset)
+        self.ready = True
+
+    def _compile(self, preset: ButtonPreset) -> None:
+        self._compiled[preset.name] = CompiledPreset(preset)
+
+        if preset.tag_name in self._tag_names:
+            # The tag looks the compiled preset up when called
+            return
+        if preset.tag_name in BUTTON_TAGS:
+            # Built-in tag, with its own signature, which looks the compiled preset up when called
+            return
+
+        def func(context, url=None, **kwargs):
+            return self._compiled[preset.name](context, url, **kwargs)
+
+        func.__name__ = func.__qualname__ = preset.tag_name
+        func.__doc__ = f"Displays a `{preset.name}` button, from the {preset!r} preset"
+        button_tag()(func)
+        self._tag_names.add(preset.tag_name)
+        logger.debug("PresetRegistry._compile() %s registered", preset.tag_name)
+
+
+#: Built-in presets, the defaults of the built-in tags of :mod:`buttons.templatetags.buttons_tags`
+BUILTIN_PRESETS: Tuple[ButtonPreset, ...] = (
+    ButtonPreset("copy", text=ButtonText.COPY.value, icon="copy"),
+    ButtonPreset("download", text=ButtonText.DOWNLOAD.value, icon="download"),
+    ButtonPreset(
+        "back",
+        text=ButtonText.BACK.value,
+        icon="chevron-left",
+        icon_position=IconPosition.LEFT,
+        btn_css_color="btn-primary",
+        url="javascript:history.back()",
+    ),
+    ButtonPreset("link", text=ButtonText.LINK.value, icon="link", btn_css_color="btn-default"),
+    ButtonPreset(
+        "home",
+        text=ButtonText.HOME.value,
+        icon="home",
+        icon_position=IconPosition.LEFT,
+        btn_css_color="btn-primary",
+        url="/",
+    ),
+    ButtonPreset("submit", text=ButtonText.SUBMIT.value, icon="check", btn_css_color="btn-primary", btn_type="submit"),
+    ButtonPreset("list", text=ButtonText.LIST.value, icon="list", btn_css_color="btn-primary"),
+    ButtonPreset("detail", text=ButtonText.DETAIL.value, icon="info", btn_css_color="btn-primary"),
+    ButtonPreset("create", text=ButtonText.CREATE.value, icon="plus", btn_css_color="btn-primary"),
+    ButtonPreset(
+        "search", text=ButtonText.SEARCH.value, icon="search", btn_css_color="btn-default", attrs={"type": "submit"}
+    ),
+    ButtonPreset("close", icon="times", btn_css_color="btn-warning", attrs={"data_dismiss": True}),
+    ButtonPreset("login", text=ButtonText.LOGIN.value, icon="login", btn_css_color="btn-default"),
+    ButtonPreset("logout", text=ButtonText.LOGOUT.value, icon="logout", btn_css_color="btn-default"),
+    ButtonPreset("update", text=ButtonText.UPDATE.value, icon="edit", btn_css_color="btn-warning"),
+    ButtonPreset("delete", text=ButtonText.DELETE.value, icon="trash", btn_css_color="btn-danger"),
+    ButtonPreset("next", text=ButtonText.NEXT.value, icon="chevron-right", btn_css_color="btn-default"),
+    ButtonPreset(
+        "previous",
+        text=ButtonText.PREVIOUS.value,
+        icon="chevron-left",
+        icon_position=IconPosition.LEFT,
+        btn_css_color="btn-default",
+    ),
+)
+
+#: Presets registry
+presets = PresetRegistry()
+
+for _preset in BUILTIN_PRESETS:
+    presets.register(_preset)
+
+
+def register_preset(preset: ButtonPreset) -> None:
+    """
+    Registers a button preset
+
+    :param preset: Button preset
+    """
+    presets.register(preset)
+
+
+def load_presets() -> None:
+    """
+    Registers the presets declared in the ``BUTTONS_PRESETS`` setting, and compiles all the presets
+    """
+    for name, spec in settings.BUTTONS_PRESETS.items():
+        presets.register(ButtonPreset(name, **spec))
+    presets.compile()
@@ -0,0 +1,127 @@
+"""
+Compact query strings
+
+When the ``BUTTONS_QUERY_STATE`` setting is set, the query strings built by the
+:func:`buttons.templatetags.querystring_tags.query_string` tag which are longer than ``BUTTONS_QUERY_STATE_MIN_LENGTH``
+are replaced by a short state token, the compressed query string encoded in URL-safe base64:
+
+.. code::
+
+    ?tag=python&tag=django&tag=...&year=2011  ->  ?_qs=eNorSUzPL6ooyUhNKkrNS...
+
+The :class:`QueryStateMiddleware` middleware expands the token back into ``request.GET``, so that the views and the
+templates see the expanded parameters:
+
+.. code::
+
+    MIDDLEWARE = [
+        ...
+        "buttons.querystate.QueryStateMiddleware",
+    ]
+
+The views not behind the middleware can call :func:`expand_query_state` themselves.
+
+:creationdate: 19/10/2026 15:40
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.querystate
+
+"""
+
+import base64
+import binascii
+import logging
+import zlib
+
+from django.conf import settings
+from django.http import QueryDict
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.querystate")
+
+
+def encode_state(query: str) -> str:
+    """
+    Encodes a query string into a state token
+
+    :param query: Encoded query string, without the leading `?`
+    :return: State token, URL-safe
+    """
+    compressed = zlib.compress(query.encode("ascii"), 9)
+    return base64.urlsafe_b64encode(compressed).rstrip(b"=").decode("ascii")
+
+
+def decode_state(token: str, max_length: int = 0) -> str:
+    """
+    Decodes a state token
+
+    :param token: State token
+    :param max_length: Maximum length of the query string, default ``BUTTONS_QUERY_STATE_MAX_LENGTH``
+    :return: Encoded query string, without the leading `?`
+    :raises ValueError: If the token is not valid
+    """
+    max_length = max_length or settings.BUTTONS_QUERY_STATE_MAX_LENGTH
+    try:
+        compressed = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        decompressor = zlib.decompressobj()
+        # Bounded, the token may come from anywhere
+        query = decompressor.decompress(compressed, max_length)
+    except (binascii.Error, zlib.error, TypeError) as exception:
+        raise ValueError(f"Invalid state token: {exception}") from exception
+    if decompressor.unconsumed_tail or not decompressor.eof:
+        raise ValueError("Invalid state token: truncated or too long")
+    try:
+        return query.decode("ascii")
+    except UnicodeDecodeError as exception:
+        raise ValueError(f"Invalid state token: {exception}") from exception
+
+
+def compact_query_string(query_string: str) -> str:
+    """
+    Replaces a long query string by its state token, if the ``BUTTONS_QUERY_STATE`` setting is set
+
+    :param query_string: Query string, starting with `?` if not empty
+    :return: Query string, or the state token query string
+    """
+    if not settings.BUTTONS_QUERY_STATE or len(query_string) <= settings.BUTTONS_QUERY_STATE_MIN_LENGTH:
+        return query_string
+    compacted = f"?{settings.BUTTONS_QUERY_STATE_PARAM}={encode_state(query_string[1:])}"
+    return compacted if len(compacted) < len(query_string) else query_string
+
+
+def expand_query_state(request) -> QueryDict:
+    """
+    Expands the state token of the request into ``request.GET``: the other parameters are kept after the expanded
+    ones. An invalid token is dropped.
+
+    :param request: HTTP request
+    :return: Expanded ``request.GET``
+    """
+    param = settings.BUTTONS_QUERY_STATE_PARAM
+    if param not in request.GET:
+        return request.GET
+
+    query_dict = request.GET.copy()
+    tokens = query_dict.pop(param)
+    expanded = QueryDict(mutable=True)
+    for token in tokens:
+        try:
+            expanded.update(QueryDict(decode_state(token)))
+        except ValueError as exception:
+            logger.warning("expand_query_state() %s dropped: %s", param, exception)
+    expanded.update(query_dict)
+    expanded._mutable = False
+    request.GET = expanded
+    return expanded
+
+
+class QueryStateMiddleware:
+    """
+    Expands the state token of the requests into ``request.GET``, see :func:`expand_query_state`
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        expand_query_state(request)
+        return self.get_response(request)
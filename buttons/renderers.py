@@ -0,0 +1,323 @@
+"""
+Template-free renderers for the :mod:`buttons:buttons` templates
+
+Those renderers build the very same HTML than the `buttons/fontawesome-*/*.html` templates, directly in python,
+without going through the template engine. They are enabled with the ``BUTTONS_FAST_RENDERER`` setting.
+
+.. note::
+
+    The fast renderers do not honor any project-level override of the buttons templates: leave the
+    ``BUTTONS_FAST_RENDERER`` setting to ``False`` if the templates are customized.
+
+:creationdate: 17/10/2026 09:12
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.renderers
+
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from django.template.base import render_value_in_context
+from django.template.defaultfilters import escapejs_filter, yesno
+from django.utils.safestring import SafeText, mark_safe
+
+from buttons.icons import fa4_icon, fa5_icon
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.renderers")
+
+
+def _render_attr(name: str, value: Any, context) -> str:
+    """
+    Renders a `` name="value"`` attribute, as the ``{% if value %} name="{{ value }}"{% endif %}`` template construct
+
+    :param name: Attribute name
+    :param value: Attribute value
+    :param context: Rendering context
+    :return: Rendered attribute, or an empty string
+    """
+    if not value:
+        return ""
+    return f' {name}="{render_value_in_context(value, context)}"'
+
+
+def _render_content(output: Dict[str, Any], icon_html: str, context) -> str:
+    """
+    Renders the inner content of the button, according to the icon position
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_button`
+    :param icon_html: Rendered icon
+    :param context: Rendering context
+    :return: Inner content
+    """
+    icon_position = str(output.get("icon_position")).upper()
+    icon = render_value_in_context(icon_html, context)
+    if icon_position == "LEFT":
+        return f"{icon}&nbsp;{render_value_in_context(output.get('text'), context)}"
+    if icon_position == "RIGHT":
+        return f"{render_value_in_context(output.get('text'), context)}&nbsp;{icon}"
+    if icon_position == "ONLY":
+        return icon
+    return render_value_in_context(output.get("text"), context)
+
+
+def _render_attrs(output: Dict[str, Any], title: str, context) -> str:
+    """
+    Renders the ``title``, ``alt``, ``aria-label`` and ``class`` attributes of the button
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_button`
+    :param title: Rendered title
+    :param context: Rendering context
+    :return: Rendered attributes
+    """
+    return (
+        f'\ntitle="{title}" alt="{title}" aria-label="{title}"'
+        f'\nclass="btn {render_value_in_context(output.get("btn_css_color"), context)} '
+        f'{render_value_in_context(output.get("btn_css_extra"), context)}"'
+    )
+
+
+def _render_lean_attrs(output: Dict[str, Any], title: str, licon_position: str, context) -> str:
+    """
+    Renders the ``title``, ``aria-label`` and ``class`` attributes of the button, with ``BUTTONS_LEAN_MARKUP``: the
+    visible text is not repeated, only the icon-only buttons get an ``aria-label``
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_button`
+    :param title: Rendered title
+    :param licon_position: Rendered icon position, upper case
+    :param context: Rendering context
+    :return: Rendered attributes
+    """
+    icon_only = licon_position == "ONLY"
+    attrs = f' title="{title}"' if output.get("tooltip") or icon_only else ""
+    if icon_only:
+        attrs += f' aria-label="{title}"'
+    btn_css_extra = output.get("btn_css_extra")
+    css_class = render_value_in_context(output.get("btn_css_color"), context)
+    if btn_css_extra:
+        css_class += f" {render_value_in_context(btn_css_extra, context)}"
+    return f'{attrs} class="btn {css_class}"'
+
+
+def _render_button(output: Dict[str, Any], icon_html: str, context) -> SafeText:
+    """
+    Renders the button, as the `buttons/fontawesome-*/button.html` templates do
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_button`
+    :param icon_html: Rendered icon
+    :param context: Rendering context
+    :return: Button HTML
+    """
+    tooltip = output.get("tooltip")
+    title = render_value_in_context(tooltip or output.get("text"), context)
+    licon_position = render_value_in_context(str(output.get("icon_position")).upper(), context)
+    lean = output.get("lean")
+    lean_attrs = _render_lean_attrs(output, title, licon_position, context) if lean else ""
+    btn_id = output.get("btn_id")
+    flatatt = output.get("flatatt")
+    url = output.get("url")
+
+    if url:
+        tag = "a"
+        attrs = [f'<a href="{render_value_in_context(url, context)}"']
+    else:
+        tag = "button"
+        attrs = [f'<button type="{render_value_in_context(output.get("btn_type"), context)}"']
+    attrs.extend(
+        [
+            f' id="{render_value_in_context(btn_id, context)}"' if btn_id else "",
+            lean_attrs if lean else _render_attrs(output, title, context),
+            _render_attr("data-dismiss", output.get("data_dismiss"), context),
+            _render_attr("data-toggle", output.get("data_toggle"), context),
+            _render_attr("data-placement", output.get("data_placement"), context),
+            _render_attr("data-target", output.get("data_target"), context),
+        ]
+    )
+    if not url:
+        attrs.extend(
+            [
+                _render_attr("name", output.get("name"), context),
+                _render_attr("value", output.get("value"), context),
+            ]
+        )
+    attrs.append(render_value_in_context(flatatt, context) if flatatt else "")
+    html = f"{''.join(attrs)}>{_render_content(output, icon_html, context)}</{tag}>"
+
+    if lean:
+        return mark_safe(f"\n{html}\n")
+    debug = "<!-- buttons/button.html -->" if output.get("debug") else ""
+    return mark_safe(f"{debug}\n<!-- licon_position = {licon_position} -->{html}\n")
+
+
+def render_fa5_button(output: Dict[str, Any], context) -> SafeText:
+    """
+    Renders a button as the `buttons/fontawesome-5/button.html` template does
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_button`
+    :param context: Rendering context
+    :return: Button HTML
+    """
+    return _render_button(output, fa5_icon(output.get("icon")), context)
+
+
+def render_fa4_button(output: Dict[str, Any], context) -> SafeText:
+    """
+    Renders a button as the `buttons/fontawesome-4/button.html` template does
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_button`
+    :param context: Rendering context
+    :return: Button HTML
+    """
+    return _render_button(output, fa4_icon(output.get("icon")), context)
+
+
+def _render_switch(output: Dict[str, Any], icon_html: str, context) -> SafeText:
+    """
+    Renders the switch button, as the `buttons/fontawesome-*/switch-button.html` templates do
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_switch`
+    :param icon_html: Rendered icon
+    :param context: Rendering context
+    :return: Switch button HTML
+    """
+    value = output.get("value")
+    switch_colors = output.get("switch_colors")
+    switch_icons = output.get("switch_icons")
+    switch_alts = output.get("switch_alts")
+    btn_id = output.get("id")
+
+    def _js(item):
+        return render_value_in_context(escapejs_filter(item), context)
+
+    def _pair(items):
+        # `False` then `True` values
+        return f"{_text(yesno(False, items))},{_text(yesno(True, items))}"
+
+    def _text(item):
+        return render_value_in_context(item, context)
+
+    id_attr = f' id="{_text(btn_id)}"' if btn_id else ""
+    bulk_url_attr = f' data-bulk-url="{_text(output["bulk_url"])}"' if output.get("bulk_url") else ""
+    data_attrs = f' {_text(expand_data(output["data"]))}' if output.get("data") else ""
+    large = _text(yesno(output.get("large"), " fa-2x,"))
+    html = (
+        f'<span{id_attr} class="switch"\n'
+        f'data-value="{_js(value)}"\n'
+        f'data-url="{_text(output.get("switch_url"))}"{bulk_url_attr}\n'
+        f'data-switch-colors="{_pair(switch_colors)}"\n'
+        f'data-switch-icons="{_pair(switch_icons)}"\n'
+        f'data-switch-alts="{_pair(switch_alts)}"{data_attrs}>'
+        f'<span class="text-{_text(yesno(value, switch_colors))}{large} switch-icon">{_text(icon_html)}</span>'
+        f'<span class="switch-title ">{_text(output.get("title"))}</span></span>'
+    )
+    return mark_safe(f"\n{html}\n")
+
+
+def render_fa5_switch(output: Dict[str, Any], context) -> SafeText:
+    """
+    Renders a switch button as the `buttons/fontawesome-5/switch-button.html` template does
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_switch`
+    :param context: Rendering context
+    :return: Switch button HTML
+    """
+    value = output.get("value")
+    icon_html = fa5_icon(
+        yesno(value, output.get("switch_icons")), "fa-2x fa-fw", title=yesno(value, output.get("switch_alts"))
+    )
+    return _render_switch(output, icon_html, context)
+
+
+def render_fa4_switch(output: Dict[str, Any], context) -> SafeText:
+    """
+    Renders a switch button as the `buttons/fontawesome-4/switch-button.html` template does
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_switch`
+    :param context: Rendering context
+    :return: Switch button HTML
+    """
+    value = output.get("value")
+    icon_html = fa4_icon(
+        yesno(value, output.get("switch_icons")), large=True, fixed=True, title=yesno(value, output.get("switch_alts"))
+    )
+    return _render_switch(output, icon_html, context)
+
+
+def _render_single(output: Dict[str, Any], icon_html: str, context) -> SafeText:
+    """
+    Renders the single button, as the `buttons/fontawesome-*/single-button.html` templates do
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_single`
+    :param icon_html: Rendered icon
+    :param context: Rendering context
+    :return: Single button HTML
+    """
+    return mark_safe(
+        f'\n<button type="button" class="btn btn-{render_value_in_context(output.get("color"), context)} btn-sm " '
+        f'title="{render_value_in_context(output.get("alt"), context)}">'
+        f"{render_value_in_context(icon_html, context)}</button>\n"
+    )
+
+
+def render_fa5_single(output: Dict[str, Any], context) -> SafeText:
+    """
+    Renders a single button as the `buttons/fontawesome-5/single-button.html` template does
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_single`
+    :param context: Rendering context
+    :return: Single button HTML
+    """
+    return _render_single(output, fa5_icon(output.get("icon"), "fa-fw"), context)
+
+
+def render_fa4_single(output: Dict[str, Any], context) -> SafeText:
+    """
+    Renders a single button as the `buttons/fontawesome-4/single-button.html` template does
+
+    :param output: Button data, as returned by :func:`buttons.templatetags.buttons_tags.btn_single`
+    :param context: Rendering context
+    :return: Single button HTML
+    """
+    return _render_single(output, fa4_icon(output.get("icon"), fixed=True), context)
+
+
+def expand_data(data) -> SafeText:
+    """
+    Expands a dict containing (key, value) pairs into a serie of data-(key)="(value)" HTML attributes
+
+    :param data: data dict
+    :return: HTML attributes
+    """
+    if not data:
+        return ""
+
+    output = []
+    for key, value in list(data.items()):
+        if isinstance(value, bool):
+            value = str(value).lower()
+        output.append(
+            f'data-{key}="{value}"',
+        )
+    return mark_safe(" ".join(output))
+
+
+#: Fast renderers, by template name
+FAST_RENDERERS: Dict[str, Callable[[Dict[str, Any], Any], SafeText]] = {
+    "buttons/fontawesome-5/button.html": render_fa5_button,
+    "buttons/fontawesome-4/button.html": render_fa4_button,
+    "buttons/fontawesome-5/switch-button.html": render_fa5_switch,
+    "buttons/fontawesome-4/switch-button.html": render_fa4_switch,
+    "buttons/fontawesome-5/single-button.html": render_fa5_single,
+    "buttons/fontawesome-4/single-button.html": render_fa4_single,
+}
+
+
+def get_fast_renderer(template_name: str) -> Optional[Callable[[Dict[str, Any], Any], SafeText]]:
+    """
+    Gets the fast renderer for the given template name, if any
+
+    :param template_name: Template name
+    :return: Renderer or ``None``
+    """
+    return FAST_RENDERERS.get(template_name)
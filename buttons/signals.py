@@ -0,0 +1,53 @@
+"""
+Signals sent when the buttons are rendered
+
+The signals are sent by the button tags only if some receivers are connected: rendering costs nothing more when
+nobody listens. The sender is the tag function, *ie.* :func:`buttons.templatetags.buttons_tags.btn_delete`.
+
++ :data:`pre_render`: sent before rendering, with the `tag` name, the resolved tag `args` and `kwargs` and the
+  rendering `context`
++ :data:`post_render`: sent after rendering, with the `tag` name, the resolved button data as `params`, the rendered
+  `html` and the `elapsed` time, in seconds
+
+.. code::
+
+    from buttons.signals import post_render
+
+    @receiver(post_render)
+    def log_slow_buttons(sender, tag, params, html, elapsed, **kwargs):
+        if elapsed > 0.001:
+            logger.warning("%s rendered in %.3f s", tag, elapsed)
+
+:creationdate: 17/10/2026 11:02
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.signals
+
+"""
+
+import logging
+import pprint
+
+from django.dispatch import Signal
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.signals")
+
+#: Sent before a button is rendered
+pre_render = Signal()
+
+#: Sent after a button has been rendered
+post_render = Signal()
+
+
+def log_render(sender, tag, params, html, elapsed, **kwargs) -> None:
+    """
+    Logs the rendered buttons data, connected to :data:`post_render` if the `buttons` logger is enabled for ``DEBUG``
+
+    :param sender: Tag function
+    :param tag: Tag name
+    :param params: Resolved button data
+    :param html: Rendered button
+    :param elapsed: Rendering time, in seconds
+    :param kwargs: Additional keyword args
+    """
+    logger.debug("%s() rendered in %.6f s, params = %s", tag, elapsed, pprint.pformat(params, indent=2))
@@ -0,0 +1,252 @@
+"""
+SVG sprite of the icons used by the buttons
+
+The sprite is built from the SVG webfonts shipped with the installed fontawesome application: the icons names are
+mapped to their glyphs with the fontawesome stylesheet, and each glyph is converted into a ``<symbol id="icon-...">``.
+Only the icons actually used are kept: the icons of the presets, ``BUTTONS_ICON``, the switch icons and the icons
+found into the templates.
+
+.. code::
+
+    $ python manage.py buttons_sprite
+    $ python manage.py buttons_sprite --icon archive --icon file-export --output-dir static/
+
+:creationdate: 18/10/2026 14:05
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.sprite
+
+"""
+
+import hashlib
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from xml.etree import ElementTree
+
+from django.template import engines
+from django.utils.html import escape
+
+from buttons.icons import SPRITE_ID_PREFIX, get_preset_icons
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.sprite")
+
+#: Icons of the :func:`buttons.templatetags.buttons_tags.btn_switch` tag
+SWITCH_ICONS = ("toggle-on", "toggle-off")
+
+#: Static path of the sprite, formatted with its hash
+SPRITE_PATH = "buttons/icons.{hash}.svg"
+
+#: Fontawesome sources: stylesheet and SVG webfonts, by order of preference, relative to the application package
+FONT_SOURCES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "fontawesome-5": (
+        "static/fontawesome_5/css/all.min.css",
+        (
+            "static/fontawesome_5/webfonts/fa-solid-900.svg",
+            "static/fontawesome_5/webfonts/fa-regular-400.svg",
+            "static/fontawesome_5/webfonts/fa-brands-400.svg",
+        ),
+    ),
+    "fontawesome-4": (
+        "static/fontawesome/css/font-awesome.min.css",
+        ("static/fontawesome/fonts/fontawesome-webfont.svg",),
+    ),
+}
+
+_CSS_RULE_RE = re.compile(r"([^{}]+)\{\s*content\s*:\s*[\"']\\([0-9a-fA-F]+)[\"']")
+_CSS_ICON_RE = re.compile(r"\.fa-([\w-]+):{1,2}before")
+
+#: Icons references into the templates: `icon="..."`, `switch_icons="...,..."` and the first arg of the icon tags
+_TEMPLATE_ICON_RES = (
+    re.compile(r"\bicon\s*=\s*[\"']([\w-]+)[\"']"),
+    re.compile(r"\bswitch_icons\s*=\s*[\"']([\w\s,-]+)[\"']"),
+    re.compile(r"\{%\s*(?:btn_single|btn_fa5_icon|btn_fa4_icon|fa5_icon|fontawesome_icon)\s+[\"']([\w-]+)[\"']"),
+    re.compile(r"\b(?:btn_single|btn_fa5_icon|btn_fa4_icon)\(\s*[\"']([\w-]+)[\"']"),
+)
+
+_TEMPLATE_EXTENSIONS = (".html", ".htm", ".txt", ".jinja", ".jinja2", ".j2")
+
+
+class Glyph(NamedTuple):
+    """
+    Glyph of an SVG webfont
+    """
+
+    width: float
+    units_per_em: float
+    ascent: float
+    path: str
+
+    def as_symbol(self, icon: str) -> str:
+        """
+        Converts the glyph into an SVG symbol: the glyphs are drawn upward from the baseline
+
+        :param icon: Icon name
+        :return: SVG symbol
+        """
+        return (
+            f'<symbol id="{escape(SPRITE_ID_PREFIX + icon)}" viewBox="0 0 {self.width:g} {self.units_per_em:g}">'
+            f'<path transform="matrix(1 0 0 -1 0 {self.ascent:g})" d="{escape(self.path)}"/></symbol>'
+        )
+
+
+def get_font_files(package: str) -> Tuple[str, List[str]]:
+    """
+    Gets the stylesheet and the SVG webfonts of the installed fontawesome application
+
+    :param package: Fontawesome package, *ie.* ``fontawesome-5``
+    :return: Stylesheet and webfonts paths
+    """
+    import importlib
+
+    css_file, font_files = FONT_SOURCES[package]
+    module = importlib.import_module("fontawesome_5" if package == "fontawesome-5" else "fontawesome")
+    root = os.path.dirname(module.__file__)
+    return os.path.join(root, css_file), [os.path.join(root, font_file) for font_file in font_files]
+
+
+def load_codepoints(css_file: str) -> Dict[str, str]:
+    """
+    Loads the code points of the icons from the fontawesome stylesheet
+
+    :param css_file: Stylesheet path
+    :return: Code point of each icon name
+    """
+    with open(css_file, encoding="utf-8") as stream:
+        content = stream.read()
+
+    codepoints = {}
+    for selectors, codepoint in _CSS_RULE_RE.findall(content):
+        for icon in _CSS_ICON_RE.findall(selectors):
+            codepoints.setdefault(icon, chr(int(codepoint, 16)))
+    return codepoints
+
+
+def load_glyphs(font_file: str) -> Dict[str, Glyph]:
+    """
+    Loads the glyphs of an SVG webfont
+
+    :param font_file: Webfont path
+    :return: Glyph of each code point
+    """
+    root = ElementTree.parse(font_file).getroot()
+    # The fontawesome 4 webfont has no namespace
+    namespace = root.tag[: root.tag.index("}") + 1] if root.tag.startswith("{") else ""
+    glyphs = {}
+    for font in root.iter(f"{namespace}font"):
+        default_width = float(font.get("horiz-adv-x", 0))
+        face = font.find(f"{namespace}font-face")
+        units_per_em = float(face.get("units-per-em"))
+        ascent = float(face.get("ascent"))
+        for glyph in font.iter(f"{namespace}glyph"):
+            codepoint, path = glyph.get("unicode"), glyph.get("d")
+            if not codepoint or not path:
+                continue
+            width = float(glyph.get("horiz-adv-x", default_width))
+            glyphs.setdefault(codepoint, Glyph(width, units_per_em, ascent, path.strip()))
+    return glyphs
+
+
+def scan_templates(dirs: Optional[Iterable[str]] = None) -> Set[str]:
+    """
+    Finds the icons used into the templates
+
+    :param dirs: Templates directories, default the directories of all the template engines
+    :return: Icon names
+    """
+    if dirs is None:
+        dirs = [directory for engine in engines.all() for directory in engine.template_dirs]
+
+    icons = set()
+    for directory in dirs:
+        for root, _dirs, files in os.walk(directory):
+            for filename in files:
+                if not filename.endswith(_TEMPLATE_EXTENSIONS):
+                    continue
+                with open(os.path.join(root, filename), encoding="utf-8", errors="replace") as stream:
+                    content = stream.read()
+                for regex in _TEMPLATE_ICON_RES:
+                    for match in regex.findall(content):
+                        icons.update(icon.strip() for icon in match.split(",") if icon.strip())
+    return icons
+
+
+def collect_icons(extra_icons: Iterable[str] = (), scan: bool = True) -> Set[str]:
+    """
+    Collects the icons used by the buttons
+
+    :param extra_icons: Additional icons
+    :param scan: If True, the templates are scanned
+    :return: Icon names
+    """
+    icons = get_preset_icons()
+    icons.update(SWITCH_ICONS)
+    icons.update(extra_icons)
+    if scan:
+        icons.update(scan_templates())
+    return icons
+
+
+def build_sprite(icons: Iterable[str], package: str) -> Tuple[str, List[str]]:
+    """
+    Builds a minimal SVG sprite
+
+    :param icons: Icon names
+    :param package: Fontawesome package, *ie.* ``fontawesome-5``
+    :return: Sprite content and names of the icons not found into the webfonts
+    """
+    css_file, font_files = get_font_files(package)
+    codepoints = load_codepoints(css_file)
+    glyphs: Dict[str, Glyph] = {}
+    for font_file in reversed(font_files):
+        glyphs.update(load_glyphs(font_file))
+
+    symbols, missing = [], []
+    for icon in sorted(icons):
+        glyph = glyphs.get(codepoints.get(icon))
+        if glyph is None:
+            missing.append(icon)
+            continue
+        symbols.append(glyph.as_symbol(icon))
+
+    content = '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">' + "".join(symbols) + "</svg>\n"
+    return content, missing
+
+
+def write_sprite(content: str, output_dir: str) -> str:
+    """
+    Writes the sprite into the static files directory, under a name including its hash
+
+    :param content: Sprite content
+    :param output_dir: Static files directory
+    :return: Static path of the sprite
+    """
+    digest = hashlib.md5(content.encode("utf-8")).hexdigest()[:12]
+    path = SPRITE_PATH.format(hash=digest)
+    filename = os.path.join(output_dir, path)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as stream:
+        stream.write(content)
+    logger.info("write_sprite() %s written", filename)
+    return path
+
+
+@lru_cache(maxsize=None)
+def read_sprite(path: str) -> str:
+    """
+    Reads the sprite from the static files, to be inlined into the pages
+
+    :param path: Static path of the sprite
+    :return: Sprite content
+    """
+    from django.contrib.staticfiles import finders
+    from django.contrib.staticfiles.storage import staticfiles_storage
+
+    filename = finders.find(path)
+    if filename:
+        with open(filename, encoding="utf-8") as stream:
+            return stream.read()
+    with staticfiles_storage.open(path) as stream:
+        return stream.read().decode("utf-8")
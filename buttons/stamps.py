@@ -0,0 +1,196 @@
+"""
+Button stamps: buttons rendered once, with holes filled for each row
+
+A stamp renders a button once, with markers in place of some of its values, the "holes", *ie.* the url and the id of
+the row buttons. The rendered HTML is split on the markers, and the buttons of the rows are built by joining the parts
+with the escaped row values, without calling the tag function nor the template engine:
+
+.. code::
+
+    delete = stamp("btn_delete", "url", "btn_id", text=_("Remove"))
+    for obj in object_list:
+        html = delete.render(url=reverse("delete", args=[obj.pk]), btn_id=f"delete-{obj.pk}")
+
+The output is the same as the tag one. The holes must be values the tag function passes through to the template, *ie.*
+urls, ids or texts: a stamp whose markers are transformed, by the tag function or by the template filters, is not
+used, and the rows are rendered with the tag. So are the rows whose values are empty, not strings, or HTML fragments.
+
+:creationdate: 20/10/2026 09:30
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.stamps
+
+"""
+
+import logging
+import re
+import secrets
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from django.template import Context
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeData, SafeText, mark_safe
+
+from buttons.templatetags.buttons_tags import BUTTON_TAGS
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.stamps")
+
+#: Marker of the holes: the letters, the HTML special chars and the space reveal the transformations of the value
+_MARKER = "x{nonce}:{index}&<>\"' /X"
+
+
+class Hole(NamedTuple):
+    """
+    Hole of a split fragment
+    """
+
+    #: Name of the hole
+    hole: str
+    #: True if the value is escaped, False if it is rendered as is
+    escape: bool
+
+
+Part = Union[str, Hole]
+
+
+def split_holes(render: Callable[..., Any], holes: Sequence[str]) -> List[Part]:
+    """
+    Renders a fragment with markers in place of its holes, and splits it on the markers
+
+    :param render: Fragment renderer, called with the markers of the holes as keyword args
+    :param holes: Names of the holes
+    :return: Literal HTML at the even indexes, :class:`Hole` at the odd ones
+    :raises ValueError: If a marker has been transformed
+    """
+    nonce = secrets.token_hex(8)
+    markers = {key: _MARKER.format(nonce=nonce, index=index) for index, key in enumerate(holes)}
+    html = str(render(**markers))
+
+    found = {}
+    for key, marker in markers.items():
+        for rendered, escaped in ((conditional_escape(marker), True), (marker, False)):
+            if rendered in html:
+                found[rendered] = Hole(key, escaped)
+    if not found:
+        parts: List[Part] = [html]
+    else:
+        parts = re.split("(" + "|".join(re.escape(marker) for marker in found) + ")", html)
+    if any(nonce in part for part in parts[::2]):
+        raise ValueError(f"The holes of {html!r} are transformed")
+    parts[1::2] = [found[marker] for marker in parts[1::2]]
+    return parts
+
+
+def _is_substitutable(value: Any, escaped: bool) -> bool:
+    # The `{% spaceless %}` tag of the overridden templates may change the spaces around the blank values and the
+    # unescaped HTML fragments
+    if not isinstance(value, str) or not value.strip():
+        return False
+    if isinstance(value, SafeData) or not escaped:
+        return "<" not in value and ">" not in value
+    return True
+
+
+def join_holes(parts: List[Part], values: Dict[str, Any]) -> str:
+    """
+    Fills the holes of a split fragment
+
+    :param parts: Split fragment, as returned by :func:`split_holes`
+    :param values: Values of the holes
+    :return: HTML
+    """
+    return "".join(
+        part if index % 2 == 0 else (conditional_escape if part.escape else str)(values[part.hole])
+        for index, part in enumerate(parts)
+    )
+
+
+class ButtonStamp:
+    """
+    Button rendered once, with holes filled with the row values
+    """
+
+    __slots__ = ("name", "node", "holes", "kwargs", "context", "parts", "escaped")
+
+    def __init__(
+        self,
+        name: str,
+        holes: Sequence[str],
+        kwargs: Optional[Dict[str, Any]] = None,
+        context: Union[Context, Dict[str, Any], None] = None,
+    ):
+        """
+        :param name: Button tag name, *ie.* ``btn_delete``
+        :param holes: Names of the tag kwargs filled for each row
+        :param kwargs: Tag kwargs shared by all the rows
+        :param context: Rendering context, or context data
+        """
+        try:
+            tag = BUTTON_TAGS[name]
+        except KeyError:
+            raise ValueError(f"Unknown button tag: {name}") from None
+
+        self.name = name
+        self.node = tag.get_node()
+        self.holes = tuple(holes)
+        self.kwargs = dict(kwargs or {})
+        self.context = context if isinstance(context, Context) else Context(context or {})
+        #: Rendered parts, as split by :func:`split_holes`, ``None`` if not compiled
+        self.parts: Optional[List[Part]] = self._compile()
+        #: True for the holes whose values are always escaped, by hole name
+        holes = self.parts[1::2] if self.parts else []
+        self.escaped = {key: all(hole.escape for hole in holes if hole.hole == key) for key in self.holes}
+
+    def _call(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        args = [self.context] if self.node.takes_context else []
+        return self.node.func(*args, **kwargs)
+
+    def _compile(self) -> Optional[List[Part]]:
+        """
+        Renders the button with markers for the holes, and splits it on the markers
+        """
+        try:
+            return split_holes(
+                lambda **markers: self.node.render_uncached(self._call({**self.kwargs, **markers}), self.context),
+                self.holes,
+            )
+        except (TypeError, ValueError):
+            # The tag function checks or converts the values, or a marker has been transformed by the tag function
+            # or by the template filters: the rows are rendered with the tag
+            logger.debug("ButtonStamp._compile() %s cannot be compiled", self.name)
+            return None
+
+    @property
+    def compiled(self) -> bool:
+        return self.parts is not None
+
+    def render(self, **values) -> SafeText:
+        """
+        Renders the button of a row
+
+        :param values: Values of the holes
+        :return: Rendered button
+        """
+        if self.parts is None or not all(_is_substitutable(values.get(key), self.escaped[key]) for key in self.holes):
+            return self.node.render_output(self._call({**self.kwargs, **values}), self.context)
+        return mark_safe(join_holes(self.parts, values))
+
+    __call__ = render
+
+
+def stamp(tag_name: str, *holes: str, context: Union[Context, Dict[str, Any], None] = None, **kwargs) -> ButtonStamp:
+    """
+    Compiles a button stamp
+
+    .. code::
+
+        detail = stamp("btn_detail", "url")
+        detail.render(url=obj.get_absolute_url())
+
+    :param tag_name: Button tag name, *ie.* ``btn_detail``
+    :param holes: Names of the tag kwargs filled for each row
+    :param context: Rendering context, or context data
+    :param kwargs: Tag kwargs shared by all the rows, *ie.* ``name``
+    :return: Button stamp
+    """
+    return ButtonStamp(tag_name, holes, kwargs, context)
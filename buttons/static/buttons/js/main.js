@@ -1,6 +1,9 @@
 /** Functions for button */
 const DEBUG_SWITCH = true;
 
+// Switches rendered by the `btn_switch` tag, other `.switch` elements of the page are left alone
+const SWITCH_SELECTOR = '.switch[data-switch-icons]';
+
 
 if (typeof window.switchButtons === 'undefined') {
 
@@ -13,6 +16,16 @@ if (typeof window.switchButtons === 'undefined') {
         return id.replace(/-/g, '_').toUpperCase() + '_SWITCH';
     };
 
+    window.switchButtons.changeSpriteIcon = function ($btn, icon, alt) {
+        // Icons rendered as references to the SVG sprite, see BUTTONS_ICON_MODE
+        $btn.find('.switch-icon svg.btn-icon').each(function () {
+            var $use = $(this).find('use');
+            var href = $use.attr('href');
+            $use.attr('href', href.substring(0, href.indexOf('#') + 1) + 'icon-' + icon);
+            $(this).attr('aria-label', alt).find('title').text(alt);
+        });
+    };
+
     window.switchButtons.changeSwitchDisplay = function ($btn, value, colors, icons, alts) {
         // Sets the data-value attribute to the new value
         $btn.data('value', value);
@@ -30,6 +43,7 @@ if (typeof window.switchButtons === 'undefined') {
                 .find('.fa').removeClass('fa-' + icons[0]).addClass('fa-' + icons[1])
             // Change title
                 .attr('title', alts[1]);
+            window.switchButtons.changeSpriteIcon($btn, icons[1], alts[1]);
         } else {
             // Change color
             $btn.find('.switch-icon').removeClass('text-' + colors[1]).addClass('text-' + colors[0])
@@ -37,6 +51,164 @@ if (typeof window.switchButtons === 'undefined') {
                 .find('.fa').removeClass('fa-' + icons[1]).addClass('fa-' + icons[0])
             // Change title
                 .attr('title', alts[0]);
+            window.switchButtons.changeSpriteIcon($btn, icons[0], alts[0]);
         }
     };
+
+    window.switchButtons.getSwitchData = function ($btn) {
+        // Colors, icons and alts, in order "no, yes", as emitted by the `btn_switch` tag
+        return {
+            colors: ($btn.attr('data-switch-colors') || '').split(','),
+            icons: ($btn.attr('data-switch-icons') || '').split(','),
+            alts: ($btn.attr('data-switch-alts') || '').split(',')
+        };
+    };
+
+    window.switchButtons.getSwitchValue = function ($btn) {
+        var value = $btn.data('value');
+        return value === true || value === 'True' || value === 'true' || value === 1 || value === '1';
+    };
+
+    window.switchButtons.setSwitchValue = function ($btn, value) {
+        var data = window.switchButtons.getSwitchData($btn);
+        window.switchButtons.changeSwitchDisplay($btn, value, data.colors, data.icons, data.alts);
+    };
+
+    window.switchButtons.findSwitches = function (url, pk) {
+        return $(SWITCH_SELECTOR).filter('[data-bulk-url]').filter(function () {
+            return this.getAttribute('data-bulk-url') === url && this.getAttribute('data-pk') === pk;
+        });
+    };
+
+    window.switchButtons.getCookie = function (name) {
+        var match = document.cookie.match(new RegExp('(?:^|;\\s*)' + name + '=([^;]*)'));
+        return match ? decodeURIComponent(match[1]) : null;
+    };
+
+    // Delay before the queued toggles are sent, in ms
+    window.switchButtons.BULK_DELAY = 400;
+
+    // Queued toggles, by bulk url then by primary key: a switch toggled twice is not sent
+    window.switchButtons.queue = {};
+
+    window.switchButtons.queueToggle = function ($btn) {
+        var url = $btn.attr('data-bulk-url');
+        var pk = String($btn.attr('data-pk'));
+        var pending = window.switchButtons.queue[url];
+        if (typeof pending === 'undefined') {
+            pending = window.switchButtons.queue[url] = {toggles: {}, timer: null};
+        }
+
+        // The display is changed at once, and fixed with the response
+        window.switchButtons.setSwitchValue($btn, !window.switchButtons.getSwitchValue($btn));
+        if (pending.toggles[pk]) {
+            delete pending.toggles[pk];
+        } else {
+            pending.toggles[pk] = true;
+        }
+
+        clearTimeout(pending.timer);
+        pending.timer = setTimeout(function () {
+            window.switchButtons.sendToggles(url);
+        }, window.switchButtons.BULK_DELAY);
+    };
+
+    window.switchButtons.sendToggles = function (url) {
+        var pending = window.switchButtons.queue[url];
+        delete window.switchButtons.queue[url];
+        var pks = Object.keys(pending.toggles);
+        if (pks.length <= 0) {
+            return;
+        }
+
+        $.ajax({
+            url: url,
+            method: 'POST',
+            contentType: 'application/json',
+            dataType: 'json',
+            data: JSON.stringify({toggles: pks}),
+            headers: {'X-CSRFToken': window.switchButtons.getCookie('csrftoken')}
+        }).done(function (response) {
+            var values = response.values || {};
+            $.each(values, function (pk, value) {
+                // Toggles queued since the request are still displayed
+                var queued = window.switchButtons.queue[url];
+                if (queued && queued.toggles[pk]) {
+                    value = !value;
+                }
+                window.switchButtons.findSwitches(url, pk).each(function () {
+                    window.switchButtons.setSwitchValue($(this), value);
+                });
+            });
+            // Toggles not applied by the view, *ie.* unknown or forbidden objects, are flipped back
+            var missing = $.grep(pks, function (pk) {
+                return !Object.prototype.hasOwnProperty.call(values, pk);
+            });
+            if (missing.length > 0) {
+                console.warn('switchButtons.sendToggles() {0} not applied: {1}'.format(url, missing.join(', ')));
+                window.switchButtons.revertToggles(url, missing);
+            }
+        }).fail(function (xhr) {
+            console.error('switchButtons.sendToggles() {0} failed: {1}'.format(url, xhr.status));
+            window.switchButtons.revertToggles(url, pks);
+        });
+    };
+
+    window.switchButtons.revertToggles = function (url, pks) {
+        var queued = window.switchButtons.queue[url];
+        $.each(pks, function (_index, pk) {
+            // Toggled back since the request: the display is right, and the queued toggle is not needed anymore
+            if (queued && queued.toggles[pk]) {
+                delete queued.toggles[pk];
+                return;
+            }
+            window.switchButtons.findSwitches(url, pk).each(function () {
+                window.switchButtons.setSwitchValue($(this), !window.switchButtons.getSwitchValue($(this)));
+            });
+        });
+    };
+
+    window.switchButtons.getSwitchUrl = function ($btn) {
+        // A missing `switch_url` is rendered as "None"
+        var url = $btn.attr('data-url');
+        return url && url !== 'None' ? url : null;
+    };
+
+    window.switchButtons.postSwitch = function ($btn) {
+        // Flips the value with a `buttons.views.SwitchView`
+        $.ajax({
+            url: window.switchButtons.getSwitchUrl($btn),
+            method: 'POST',
+            dataType: 'json',
+            headers: {'X-CSRFToken': window.switchButtons.getCookie('csrftoken')}
+        }).done(function (response) {
+            window.switchButtons.setSwitchValue($btn, response.value);
+        }).fail(function (xhr) {
+            console.error('switchButtons.postSwitch() {0} failed: {1}'.format($btn.attr('data-url'), xhr.status));
+        });
+    };
+
+    // Single delegated handler for all the switches of the tag, including the ones added later
+    $(document).on('click', SWITCH_SELECTOR, function (evt) {
+        var $btn = $(this);
+        if ($btn.attr('data-bulk-url')) {
+            evt.preventDefault();
+            window.switchButtons.queueToggle($btn);
+            return;
+        }
+        // A project function named after the switch id, *ie.* `MY_SWITCH_SWITCH`, else the `switch_url` view
+        var _func_name = $btn.attr('id') ? window.switchButtons.getSwitchFunctionName($btn) : null;
+        if (_func_name === null || typeof window.switchButtons[_func_name] === 'undefined') {
+            if (window.switchButtons.getSwitchUrl($btn)) {
+                evt.preventDefault();
+                window.switchButtons.postSwitch($btn);
+            } else if (_func_name !== null) {
+                console.error('switchButtons Unable to find function {0}'.format(_func_name));
+            }
+            return;
+        }
+        evt.preventDefault();
+        var data = window.switchButtons.getSwitchData($btn);
+        window.switchButtons[_func_name]($btn, data.colors, data.icons, data.alts);
+    });
 }
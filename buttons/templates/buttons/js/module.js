@@ -0,0 +1,242 @@
+{% comment %}
+    Render functions of the buttons, see `buttons.jsmodule`: the functions port the fast renderers of
+    `buttons.renderers`, the data is taken from the python side when the module is built.
+{% endcomment %}// Built by `python manage.py buttons_jsmodule` from django-buttons {{ version }}, language "{{ language }}".
+// Do not edit: the module is rebuilt from the application and its settings.
+
+const DATA = {{ data }};
+
+export const VERSION = DATA.version;
+
+const ICON_POSITIONS = ["LEFT", "RIGHT", "ONLY", "NONE"];
+
+const HTML_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"};
+
+const JS_ESCAPES = /[\\'"><&=\-;`\u2028\u2029\u0000-\u001f]/g;
+
+const hasOwn = (object, key) => Object.prototype.hasOwnProperty.call(object, key);
+
+const isIconPosition = (value) => typeof value === "object" && value !== null && hasOwn(value, "IconPosition");
+
+// Python `str()`
+function str(value) {
+    if (value === null || value === undefined) {
+        return "None";
+    }
+    if (typeof value === "boolean") {
+        return value ? "True" : "False";
+    }
+    if (isIconPosition(value)) {
+        return `IconPosition.${value.IconPosition}`;
+    }
+    return String(value);
+}
+
+// `django.utils.html.escape()`
+function escape(value) {
+    return str(value).replace(/[&<>"']/g, (char) => HTML_ESCAPES[char]);
+}
+
+// `django.utils.html.escapejs()`
+function escapejs(value) {
+    return str(value).replace(JS_ESCAPES, (char) => "\\u" + char.charCodeAt(0).toString(16).toUpperCase().padStart(4, "0"));
+}
+
+// `yesno` template filter
+function yesno(value, arg) {
+    const bits = str(arg).split(",");
+    if (bits.length < 2) {
+        return value;
+    }
+    const [yes, no] = bits;
+    const maybe = bits.length === 3 ? bits[2] : no;
+    if (value === null || value === undefined) {
+        return maybe;
+    }
+    return value ? yes : no;
+}
+
+// `django.forms.utils.flatatt()`
+function flatatt(attrs) {
+    const keyValues = [];
+    const booleans = [];
+    for (const [key, value] of Object.entries(attrs)) {
+        if (typeof value === "boolean") {
+            if (value) {
+                booleans.push(key);
+            }
+        } else if (value !== null && value !== undefined) {
+            keyValues.push(key);
+        }
+    }
+    return (
+        keyValues.sort().map((key) => ` ${escape(key)}="${escape(attrs[key])}"`).join("") +
+        booleans.sort().map((key) => ` ${escape(key)}`).join("")
+    );
+}
+
+// `buttons.renderers.expand_data()`
+function expandData(data) {
+    return Object.entries(data)
+        .map(([key, value]) => `data-${key}="${typeof value === "boolean" ? String(value) : str(value)}"`)
+        .join(" ");
+}
+
+// Fills the holes of the fragments split by `buttons.stamps.split_holes()`
+function joinHoles(parts, values) {
+    return parts
+        .map((part, index) => (index % 2 ? (part.escape ? escape : str)(values[part.hole]) : part))
+        .join("");
+}
+
+function iconPosition(value) {
+    if (isIconPosition(value)) {
+        return value.IconPosition;
+    }
+    if (!ICON_POSITIONS.includes(value)) {
+        throw new RangeError(`${str(value)} is not a valid IconPosition`);
+    }
+    return value;
+}
+
+function renderAttr(name, value) {
+    return value ? ` ${name}="${escape(value)}"` : "";
+}
+
+/**
+ * Renders a button, as the `btn_button` tag does
+ *
+ * @param {Object} params - Keyword args of the tag: `text`, `url`, `icon`, `btn_id`...
+ * @returns {string} Button HTML
+ */
+export function btnButton(params = {}) {
+    const kwargs = {...params};
+    const pop = (key) => {
+        const value = kwargs[key];
+        delete kwargs[key];
+        return value;
+    };
+
+    const text = pop("text") || null;
+    const title = pop("title") || null;
+    const url = pop("url") || null;
+    const btnType = kwargs.btn_type !== null && kwargs.btn_type !== undefined ? pop("btn_type") : "button";
+    const btnId = kwargs.id || kwargs.btn_id || null;
+    const btnName = pop("btn_name") || pop("name") || null;
+    const btnValue = pop("btn_value") || pop("value") || null;
+    const icon = pop("icon") || DATA.defaults.icon;
+    const position = iconPosition(kwargs.icon_position || DATA.defaults.icon_position);
+    pop("icon_css_extra");
+    const btnCssColor = pop("btn_css_color") || DATA.defaults.btn_css_color;
+    const btnCssExtra = pop("btn_css_extra") || DATA.defaults.btn_css_extra;
+    const data = ["dismiss", "toggle", "placement", "target"].map((name) => [name, pop(`data_${name}`) || null]);
+    if (DATA.lean) {
+        ["id", "btn_id", "icon_position"].forEach(pop);
+    }
+
+    const label = escape(title || text);
+    let html = url ? `<a href="${escape(url)}"` : `<button type="${escape(btnType)}"`;
+    html += btnId ? ` id="${escape(btnId)}"` : "";
+    if (DATA.lean) {
+        const iconOnly = position === "ONLY";
+        html += title || iconOnly ? ` title="${label}"` : "";
+        html += iconOnly ? ` aria-label="${label}"` : "";
+        html += ` class="btn ${escape(btnCssColor)}${btnCssExtra ? ` ${escape(btnCssExtra)}` : ""}"`;
+    } else {
+        html += `\ntitle="${label}" alt="${label}" aria-label="${label}"`;
+        html += `\nclass="btn ${escape(btnCssColor)} ${escape(btnCssExtra)}"`;
+    }
+    html += data.map(([name, value]) => renderAttr(`data-${name}`, value)).join("");
+    if (!url) {
+        html += renderAttr("name", btnName) + renderAttr("value", btnValue);
+    }
+    html += flatatt(kwargs);
+
+    const iconHtml = hasOwn(DATA.icons, icon) ? DATA.icons[icon] : joinHoles(DATA.parts.button, {icon});
+    let content = escape(text);
+    if (position === "LEFT") {
+        content = `${iconHtml}&nbsp;${escape(text)}`;
+    } else if (position === "RIGHT") {
+        content = `${escape(text)}&nbsp;${iconHtml}`;
+    } else if (position === "ONLY") {
+        content = iconHtml;
+    }
+    html += `>${content}</${url ? "a" : "button"}>`;
+
+    if (DATA.lean) {
+        return `\n${html}\n`;
+    }
+    const debug = DATA.debug ? "<!-- buttons/button.html -->" : "";
+    return `${debug}\n<!-- licon_position = ${escape(position)} -->${html}\n`;
+}
+
+/**
+ * Renders the button of a preset, as the `btn_<name>` tags of the presets do
+ *
+ * @param {string} name - Preset name, *ie.* `delete`
+ * @param {?string} url - Target url, default from the preset
+ * @param {Object} params - Keyword args, which override the preset defaults
+ * @returns {string} Button HTML
+ */
+export function renderPreset(name, url = null, params = {}) {
+    if (!hasOwn(DATA.presets, name)) {
+        throw new Error(`Unknown preset: ${name}`);
+    }
+    const kwargs = url === null || url === undefined ? params : {...params, url};
+    return btnButton({...DATA.presets[name], ...kwargs});
+}
+
+/**
+ * Render functions of the presets, by preset name: `presets.delete(url, params)`
+ */
+export const presets = Object.fromEntries(
+    Object.keys(DATA.presets).map((name) => [name, (url = null, params = {}) => renderPreset(name, url, params)])
+);
+
+/**
+ * Renders a switch, as the `btn_switch` tag does
+ *
+ * @param {*} value - Switched value
+ * @param {string} switchAlts - Alt texts, "yes,no"
+ * @param {Object} params - Other keyword args of the tag: `switch_url`, `btn_id`, `data_*`...
+ * @returns {string} Switch HTML
+ */
+export function btnSwitch(value, switchAlts, params = {}) {
+    const kwargs = {...DATA.switch, ...params};
+    const colors = kwargs.switch_colors;
+    const icons = kwargs.switch_icons;
+    const pair = (items) => `${escape(yesno(false, items))},${escape(yesno(true, items))}`;
+    const data = Object.fromEntries(
+        Object.entries(params)
+            .filter(([key]) => key.startsWith("data_"))
+            .map(([key, item]) => [key.slice(5), item])
+    );
+
+    const idAttr = kwargs.btn_id ? ` id="${escape(kwargs.btn_id)}"` : "";
+    const bulkUrlAttr = kwargs.bulk_url ? ` data-bulk-url="${escape(kwargs.bulk_url)}"` : "";
+    const dataAttrs = Object.keys(data).length ? ` ${expandData(data)}` : "";
+    const iconHtml = joinHoles(DATA.parts.switch, {icon: yesno(value, icons), title: yesno(value, switchAlts)});
+    const html =
+        `<span${idAttr} class="switch"\n` +
+        `data-value="${escapejs(value)}"\n` +
+        `data-url="${escape(kwargs.switch_url)}"${bulkUrlAttr}\n` +
+        `data-switch-colors="${pair(colors)}"\n` +
+        `data-switch-icons="${pair(icons)}"\n` +
+        `data-switch-alts="${pair(switchAlts)}"${dataAttrs}>` +
+        `<span class="text-${escape(yesno(value, colors))}${escape(yesno(kwargs.large, " fa-2x,"))} switch-icon">${iconHtml}</span>` +
+        `<span class="switch-title ">${escape(kwargs.title)}</span></span>`;
+    return `\n${html}\n`;
+}
+
+/**
+ * Renders a single button, as the `btn_single` tag does
+ *
+ * @param {string} icon - Icon name
+ * @param {string} color - Bootstrap color, *ie.* `primary`
+ * @param {string} alt - Alt text
+ * @returns {string} Button HTML
+ */
+export function btnSingle(icon, color, alt) {
+    const iconHtml = joinHoles(DATA.parts.single, {icon});
+    return `\n<button type="button" class="btn btn-${escape(color)} btn-sm " title="${escape(alt)}">${iconHtml}</button>\n`;
+}
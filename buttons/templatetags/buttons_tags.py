@@ -8,34 +8,261 @@ Template tags to display buttons in pages
 
 import enum
 import logging
-import pprint
-from typing import Any, Dict, Optional, Union
+import time
+from functools import lru_cache, wraps
+from inspect import getfullargspec, unwrap
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
 
 from django import template
 from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.forms.utils import flatatt
+from django.template import Engine, TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.base import token_kwargs
+from django.template.library import InclusionNode, parse_bits
+from django.utils.html import format_html
 from django.utils.safestring import SafeText, mark_safe
-from django.utils.translation import gettext as _
+from django.utils.translation import gettext_lazy as _
+
+from buttons import icons, renderers
+from buttons.cache import get_button_cache, make_group_key, make_key
+from buttons.fragments import get_fragment_store
+from buttons.renderers import get_fast_renderer
+from buttons.signals import post_render, pre_render
 
 logger = logging.getLogger("buttons.templatetags.buttons_tags")
 
 register = template.Library()
 
 
-def get_filename(filename_template: str = settings.BUTTONS_DEFAULT_TEMPLATE_PATH) -> str:
+@lru_cache(maxsize=None)
+def get_filename(filename_template: Optional[str] = None) -> str:
     """
-    Gets the filename according to the presence of fontawesome 5
+    Gets the filename according to the presence of fontawesome 5, cached until a setting changes
 
-    :param filename_template: filename template
+    :param filename_template: filename template, default ``BUTTONS_DEFAULT_TEMPLATE_PATH``
     :return:
     """
+    if filename_template is None:
+        filename_template = settings.BUTTONS_DEFAULT_TEMPLATE_PATH
     if settings.BUTTONS_FONTAWESOME_VERSION == 5 or "fontawesome_5" in settings.INSTALLED_APPS:
-        logger.info("get_filename() fontawesome_5 detected...")
         return filename_template.format(package="fontawesome-5")
 
     return filename_template.format(package="fontawesome-4")
 
 
+@lru_cache(maxsize=None)
+def get_button_settings() -> Dict[str, Any]:
+    """
+    Gets the defaults of the buttons from the settings, cached until a setting changes: they are read at each button
+
+    :return: Defaults, by button param, not to be modified
+    """
+    return {
+        "icon": settings.BUTTONS_ICON,
+        "icon_position": settings.BUTTONS_ICON_POSITION,
+        "icon_css_extra": settings.BUTTONS_ICON_CSS_EXTRA,
+        "btn_css_color": settings.BUTTONS_BTN_CSS_COLOR,
+        "btn_css_extra": settings.BUTTONS_BTN_CSS_EXTRA,
+        "debug": settings.DEBUG,
+        "lean": settings.BUTTONS_LEAN_MARKUP,
+    }
+
+
+@receiver(setting_changed)
+def clear_filenames(**kwargs) -> None:
+    """
+    Drops the template filenames and the defaults of the buttons when a setting changes
+    """
+    get_filename.cache_clear()
+    get_button_settings.cache_clear()
+
+
+class ButtonNode(InclusionNode):
+    """
+    Inclusion node for the buttons
+
+    + The rendered buttons are cached with :mod:`buttons.cache` when ``BUTTONS_CACHE_SIZE`` is set
+    + The buttons are rendered with :mod:`buttons.renderers` when ``BUTTONS_FAST_RENDERER`` is set
+    + The :mod:`buttons.signals` are sent if some receivers are connected
+    + The precompiled buttons are read from :mod:`buttons.fragments` when ``BUTTONS_FRAGMENTS`` is set
+    + The template filename is resolved at the first render, see :func:`get_filename`
+    """
+
+    @property
+    def filename(self) -> str:
+        return get_filename(self.filename_template)
+
+    @filename.setter
+    def filename(self, value: Optional[str]) -> None:
+        #: Template filename, which may contain a `{package}` placeholder, default ``BUTTONS_DEFAULT_TEMPLATE_PATH``
+        self.filename_template = value
+
+    def render(self, context):
+        html = get_fragment_store().get(self, context)
+        if html is not None and not self.has_listeners():
+            return html
+        resolved_args, resolved_kwargs = self.get_resolved_arguments(context)
+        return self.render_call(resolved_args, resolved_kwargs, context)
+
+    def has_listeners(self) -> bool:
+        return pre_render.has_listeners(self.func) or post_render.has_listeners(self.func)
+
+    def render_call(self, resolved_args, resolved_kwargs: Dict[str, Any], context) -> SafeText:
+        """
+        Calls the tag function and renders its output
+
+        :param resolved_args: Tag function args, including the context if the tag takes it
+        :param resolved_kwargs: Tag function kwargs
+        :param context: Rendering context
+        :return: Rendered button
+        """
+        if not self.has_listeners():
+            return self.render_output(self.func(*resolved_args, **resolved_kwargs), context)
+
+        tag = self.func.__name__
+        args = resolved_args[1:] if self.takes_context else resolved_args
+        pre_render.send(sender=self.func, tag=tag, args=args, kwargs=resolved_kwargs, context=context)
+        start = time.perf_counter()
+        output = self.func(*resolved_args, **resolved_kwargs)
+        html = self.render_output(output, context)
+        elapsed = time.perf_counter() - start
+        post_render.send(sender=self.func, tag=tag, params=output, html=html, elapsed=elapsed)
+        return html
+
+    def render_output(self, output: Dict[str, Any], context) -> SafeText:
+        """
+        Renders the button data, from the cache if available
+
+        :param output: Button data, as returned by the tag function
+        :param context: Rendering context
+        :return: Rendered button
+        """
+        button_cache = get_button_cache()
+        key = make_key(self.filename, output, context) if button_cache.enabled else None
+        if key is not None:
+            html = button_cache.get(key)
+            if html is not None:
+                return html
+
+        html = self.render_uncached(output, context)
+        if key is not None:
+            button_cache.set(key, html)
+        return html
+
+    def render_uncached(self, output: Dict[str, Any], context) -> SafeText:
+        """
+        Renders the button data, with the fast renderer if enabled, or with the template
+
+        :param output: Button data, as returned by the tag function
+        :param context: Rendering context
+        :return: Rendered button
+        """
+        renderer = get_fast_renderer(self.filename) if settings.BUTTONS_FAST_RENDERER else None
+        if renderer is not None:
+            return renderer(output, context)
+
+        # Same as :meth:`django.template.library.InclusionNode.render`
+        template_ = context.render_context.get(self)
+        if template_ is None:
+            engine = context.template.engine if context.template is not None else Engine.get_default()
+            template_ = engine.get_template(self.filename)
+            context.render_context[self] = template_
+        new_context = context.new(output)
+        csrf_token = context.get("csrf_token")
+        if csrf_token is not None:
+            new_context["csrf_token"] = csrf_token
+        return template_.render(new_context)
+
+
+class ButtonTag(NamedTuple):
+    """
+    Registered button tag
+    """
+
+    func: Callable[..., Dict[str, Any]]
+    #: Template filename, which may contain a `{package}` placeholder, resolved with :func:`get_filename`
+    filename: Optional[str]
+    takes_context: bool
+
+    def get_node(self) -> ButtonNode:
+        """
+        Gets a node to render the button data returned by the tag function, outside of any template
+
+        :return: Button node
+        """
+        return ButtonNode(self.func, self.takes_context, [], {}, self.filename)
+
+
+#: Registered button tags, by name
+BUTTON_TAGS: Dict[str, ButtonTag] = {}
+
+
+def button_tag(filename: Optional[str] = None, takes_context: bool = True):
+    """
+    Registers a button tag, as :meth:`django.template.Library.inclusion_tag` does, with a :class:`ButtonNode` node
+
+    :param filename: Template filename, which may contain a `{package}` placeholder, default
+        ``BUTTONS_DEFAULT_TEMPLATE_PATH``
+    :param takes_context: If True, the context is passed to the tag function
+    :return: Decorator
+    """
+
+    def dec(func):
+        params, varargs, varkw, defaults, kwonly, kwonly_defaults, _annotations = getfullargspec(unwrap(func))
+        function_name = func.__name__
+
+        @wraps(func)
+        def compile_func(parser, token):
+            bits = token.split_contents()[1:]
+            args, kwargs = parse_bits(
+                parser,
+                bits,
+                params,
+                varargs,
+                varkw,
+                defaults,
+                kwonly,
+                kwonly_defaults,
+                takes_context,
+                function_name,
+            )
+            return ButtonNode(func, takes_context, args, kwargs, filename)
+
+        register.tag(function_name, compile_func)
+        BUTTON_TAGS[function_name] = ButtonTag(func, filename, takes_context)
+        return func
+
+    return dec
+
+
+def warm_templates() -> int:
+    """
+    Loads and parses the templates of the button tags into the caches of the template loaders, *ie.* at startup: the
+    parsed templates are shared by the workers forked after the application is loaded
+
+    :return: Number of loaded templates
+    """
+    filenames = sorted({get_filename(tag.filename) for tag in BUTTON_TAGS.values()})
+    count = 0
+    for backend in engines.all():
+        engine = getattr(backend, "engine", None)
+        if engine is None:
+            # Not a django template engine, *ie.* jinja2
+            continue
+        for filename in filenames:
+            try:
+                engine.get_template(filename)
+            except (TemplateDoesNotExist, TemplateSyntaxError) as exception:
+                logger.warning("warm_templates() unable to load %s: %s", filename, exception)
+            else:
+                count += 1
+    logger.debug("warm_templates() %d templates loaded", count)
+    return count
+
+
 class IconPosition(enum.Enum):
     """
     Icon positions enumeration
@@ -49,7 +276,7 @@ class IconPosition(enum.Enum):
 
 class ButtonText(enum.Enum):
     """
-    Default texts for buttons
+    Default texts for buttons, translated when rendered
     """
 
     BACK = _("Back")
@@ -92,22 +319,60 @@ def get_param(key, kwargs, context, default=None):
 
 def _get_btn_id(context, **kwargs) -> str:
     btn_id = kwargs.pop("id", None) or context.get("id") or kwargs.pop("btn_id", None) or context.get("btn_id")
-    logger.debug(f"_get_btn_id() btn_id = {btn_id}")
+    logger.debug("_get_btn_id() btn_id = %s", btn_id)
     return btn_id
 
 
 def _get_icon_position(context, **kwargs) -> str:
-    icon_position = kwargs.pop("icon_position", None) or context.get("icon_position", settings.BUTTONS_ICON_POSITION)
+    icon_position = kwargs.pop("icon_position", None) or context.get(
+        "icon_position", get_button_settings()["icon_position"]
+    )
 
     if isinstance(icon_position, IconPosition):
         icon_position = icon_position.value
     else:
         icon_position = IconPosition(icon_position).value
-    logger.debug(f"_get_icon_position() btn_id = {icon_position}")
+    logger.debug("_get_icon_position() icon_position = %s", icon_position)
     return icon_position
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+#: Params of :func:`btn_button` read from the context when they are not given, or empty
+CONTEXT_PARAMS = (
+    "text",
+    "title",
+    "url",
+    "btn_type",
+    "id",
+    "btn_id",
+    "icon",
+    "icon_position",
+    "icon_css_extra",
+    "btn_css_color",
+    "btn_css_extra",
+    "data_dismiss",
+    "data_toggle",
+    "data_target",
+    "data_placement",
+)
+
+#: Fields of the button data set as they are by the params of :func:`btn_button`, when the params are not empty
+OUTPUT_FIELDS: Dict[str, str] = {
+    "text": "text",
+    "title": "tooltip",
+    "url": "url",
+    "btn_type": "btn_type",
+    "icon": "icon",
+    "icon_css_extra": "icon_css_extra",
+    "btn_css_color": "btn_css_color",
+    "btn_css_extra": "btn_css_extra",
+    "data_dismiss": "data_dismiss",
+    "data_toggle": "data_toggle",
+    "data_target": "data_target",
+    "data_placement": "data_placement",
+}
+
+
+@button_tag()
 def btn_button(
     context,
     **kwargs,
@@ -135,6 +400,7 @@ def btn_button(
     """
     # logger.debug('btn_button() kwargs = %s', kwargs)
 
+    defaults = get_button_settings()
     text = kwargs.pop("text", None) or context.get("text")
     title = kwargs.pop("title", None) or context.get("title")
     url = kwargs.pop("url", None) or context.get("url")
@@ -146,22 +412,22 @@ def btn_button(
 
     icon = kwargs.pop("icon", None) or context.get(
         "icon",
-        settings.BUTTONS_ICON,
+        defaults["icon"],
     )
 
     icon_position = _get_icon_position(context, **kwargs)
 
     icon_css_extra = kwargs.pop("icon_css_extra", None) or context.get(
         "icon_css_extra",
-        settings.BUTTONS_ICON_CSS_EXTRA,
+        defaults["icon_css_extra"],
     )
     btn_css_color = kwargs.pop("btn_css_color", None) or context.get(
         "btn_css_color",
-        settings.BUTTONS_BTN_CSS_COLOR,
+        defaults["btn_css_color"],
     )
     btn_css_extra = kwargs.pop("btn_css_extra", None) or context.get(
         "btn_css_extra",
-        settings.BUTTONS_BTN_CSS_EXTRA,
+        defaults["btn_css_extra"],
     )
 
     # data-* items
@@ -191,8 +457,13 @@ def btn_button(
         "data_toggle": data_toggle,
         "data_target": data_target,
         "data_placement": data_placement,
-        "debug": settings.DEBUG,
+        "debug": defaults["debug"],
+        "lean": defaults["lean"],
     }
+    if defaults["lean"]:
+        # Already rendered as the `id` attribute and as the icon, not repeated into the additional attributes
+        for key in ("id", "btn_id", "icon_position"):
+            kwargs.pop(key, None)
     if kwargs:
         output.update(
             {"flatatt": flatatt(kwargs)},
@@ -201,18 +472,37 @@ def btn_button(
     if btn_value:
         output.update({"value": btn_value})
 
-    logger.debug(f"btn_button() output = {pprint.pformat(output, indent=2)}")
-
     return output
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+def _preset_button(name: str, context, kwargs: Dict[str, Any], **params) -> Dict[str, Any]:
+    """
+    Gets the button data of a built-in tag from its preset, see :mod:`buttons.presets`: the named params left to
+    ``None`` take the defaults of the preset
+
+    :param name: Preset name
+    :param context: Context data
+    :param kwargs: Additional keyword args of the tag
+    :param params: Named params of the tag
+    :return: Render-able dict
+    """
+    from buttons.presets import presets
+
+    overrides = {key: value for key, value in params.items() if value is not None}
+    overrides.update(kwargs)
+    if "url" in overrides and overrides["url"] is None:
+        # As the `url` arg of the presets: the default url of the preset
+        del overrides["url"]
+    return presets[name].get_output(context, overrides)
+
+
+@button_tag()
 def btn_copy(
     context,
     url,
-    text=ButtonText.COPY.value,
-    icon="copy",
-    icon_position=IconPosition.RIGHT,
+    text=None,
+    icon=None,
+    icon_position=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -229,23 +519,16 @@ def btn_copy(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context,
-        url=url,
-        text=text,
-        icon=icon,
-        icon_position=icon_position,
-        **kwargs,
-    )
+    return _preset_button("copy", context, kwargs, url=url, text=text, icon=icon, icon_position=icon_position)
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_download(
     context,
     url,
-    text=ButtonText.DOWNLOAD.value,
-    icon="download",
-    icon_position=IconPosition.RIGHT,
+    text=None,
+    icon=None,
+    icon_position=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -262,23 +545,16 @@ def btn_download(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context,
-        url=url,
-        text=text,
-        icon=icon,
-        icon_position=icon_position,
-        **kwargs,
-    )
+    return _preset_button("download", context, kwargs, url=url, text=text, icon=icon, icon_position=icon_position)
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_back(
     context,
-    text=ButtonText.BACK.value,
-    icon="chevron-left",
-    icon_position=IconPosition.LEFT,
-    btn_css_color="btn-primary",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -295,25 +571,19 @@ def btn_back(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context,
-        text=text,
-        icon=icon,
-        icon_position=icon_position,
-        btn_css_color=btn_css_color,
-        url="javascript:history.back()",
-        **kwargs,
+    return _preset_button(
+        "back", context, kwargs, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_link(
     context,
     url,
-    text=ButtonText.LINK.value,
-    icon="link",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-default",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -330,25 +600,19 @@ def btn_link(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context,
-        url=url,
-        text=text,
-        icon=icon,
-        icon_position=icon_position,
-        btn_css_color=btn_css_color,
-        **kwargs,
+    return _preset_button(
+        "link", context, kwargs, url=url, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_home(
     context,
-    url: str = "/",
-    text: str = ButtonText.HOME.value,
-    icon: str = "home",
-    icon_position: Union[IconPosition, str] = IconPosition.LEFT,
-    btn_css_color="btn-primary",
+    url: Optional[str] = None,
+    text: Optional[str] = None,
+    icon: Optional[str] = None,
+    icon_position: Optional[Union[IconPosition, str]] = None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -364,24 +628,18 @@ def btn_home(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context,
-        url=url,
-        text=text,
-        icon=icon,
-        icon_position=icon_position,
-        btn_css_color=btn_css_color,
-        **kwargs,
+    return _preset_button(
+        "home", context, kwargs, url=url, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_submit(
     context,
-    text=ButtonText.SUBMIT.value,
-    icon="check",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-primary",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -396,25 +654,19 @@ def btn_submit(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context,
-        text=text,
-        btn_type="submit",
-        icon=icon,
-        btn_css_color=btn_css_color,
-        icon_position=icon_position,
-        **kwargs,
+    return _preset_button(
+        "submit", context, kwargs, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_list(
     context,
     url,
-    text=ButtonText.LIST.value,
-    icon="list",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-primary",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -430,19 +682,19 @@ def btn_list(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context, url=url, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color, **kwargs
+    return _preset_button(
+        "list", context, kwargs, url=url, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_detail(
     context,
     url,
-    text=ButtonText.DETAIL.value,
-    icon="info",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-primary",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -458,25 +710,26 @@ def btn_detail(
 
     :return: Render-able dict
     """
-    return btn_button(
+    return _preset_button(
+        "detail",
         context,
+        kwargs,
         url=url,
         text=text,
         icon=icon,
         icon_position=icon_position,
         btn_css_color=btn_css_color,
-        **kwargs,
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_create(
     context,
     url,
-    text=ButtonText.CREATE.value,
-    icon="plus",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-primary",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -493,24 +746,25 @@ def btn_create(
     :return: Render-able dict
     """
     logger.debug("btn_create() url = *%s*", url)
-    return btn_button(
+    return _preset_button(
+        "create",
         context,
+        kwargs,
         url=url,
         text=text,
         icon=icon,
         icon_position=icon_position,
         btn_css_color=btn_css_color,
-        **kwargs,
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_search(
     context,
-    text=ButtonText.SEARCH.value,
-    icon="search",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-default",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -525,25 +779,19 @@ def btn_search(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context,
-        type="submit",
-        text=text,
-        icon=icon,
-        icon_position=icon_position,
-        btn_css_color=btn_css_color,
-        **kwargs,
+    return _preset_button(
+        "search", context, kwargs, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_close(
     context,
     text,
-    icon="times",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-warning",
-    data_dismiss=True,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
+    data_dismiss=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -559,25 +807,26 @@ def btn_close(
 
     :return: Render-able dict
     """
-    return btn_button(
+    return _preset_button(
+        "close",
         context,
+        kwargs,
         text=text,
         icon=icon,
         icon_position=icon_position,
         btn_css_color=btn_css_color,
         data_dismiss=data_dismiss,
-        **kwargs,
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_login(
     context,
     url,
-    text=ButtonText.LOGIN.value,
-    icon="login",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-default",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -593,25 +842,26 @@ def btn_login(
 
     :return: Render-able dict
     """
-    return btn_button(
+    return _preset_button(
+        "login",
         context,
+        kwargs,
         url=url,
         text=text,
         icon=icon,
         icon_position=icon_position,
         btn_css_color=btn_css_color,
-        **kwargs,
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_logout(
     context,
     url,
-    text=ButtonText.LOGOUT.value,
-    icon="logout",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-default",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -627,19 +877,26 @@ def btn_logout(
 
     :return: Render-able dict
     """
-    return btn_button(
-        context, url=url, text=text, icon=icon, icon_position=icon_position, btn_css_color=btn_css_color, **kwargs
+    return _preset_button(
+        "logout",
+        context,
+        kwargs,
+        url=url,
+        text=text,
+        icon=icon,
+        icon_position=icon_position,
+        btn_css_color=btn_css_color,
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_update(
     context,
     url,
-    text=ButtonText.UPDATE.value,
-    icon="edit",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-warning",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -655,25 +912,26 @@ def btn_update(
 
     :return: Render-able dict
     """
-    return btn_button(
+    return _preset_button(
+        "update",
         context,
+        kwargs,
         url=url,
         text=text,
         icon=icon,
         icon_position=icon_position,
         btn_css_color=btn_css_color,
-        **kwargs,
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_delete(
     context,
     url,
-    text=ButtonText.DELETE.value,
-    icon="trash",
-    icon_position=IconPosition.RIGHT,
-    btn_css_color="btn-danger",
+    text=None,
+    icon=None,
+    icon_position=None,
+    btn_css_color=None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -689,23 +947,24 @@ def btn_delete(
 
     :return: Render-able dict
     """
-    return btn_button(
+    return _preset_button(
+        "delete",
         context,
+        kwargs,
         url=url,
         text=text,
         icon=icon,
         icon_position=icon_position,
         btn_css_color=btn_css_color,
-        **kwargs,
     )
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_next(
     context,
     url,
-    text=ButtonText.NEXT.value,
-    btn_css_color="btn-default",
+    text=None,
+    btn_css_color=None,
 ) -> Dict[str, Any]:
     """
     Renders a ``Next`` button
@@ -717,24 +976,16 @@ def btn_next(
 
     :return: Render-able dict
     """
-
     logger.debug("btn_next() url = %s", url)
-    return btn_button(
-        context,
-        url=url,
-        icon="chevron-right",
-        text=text,
-        icon_position=IconPosition.RIGHT,
-        btn_css_color=btn_css_color,
-    )
+    return _preset_button("next", context, {}, url=url, text=text, btn_css_color=btn_css_color)
 
 
-@register.inclusion_tag(get_filename(), takes_context=True)
+@button_tag()
 def btn_previous(
     context,
     url,
-    text=ButtonText.PREVIOUS.value,
-    btn_css_color="btn-default",
+    text=None,
+    btn_css_color=None,
 ) -> Dict[str, Any]:
     """
     Renders a ``Previous`` button
@@ -747,17 +998,10 @@ def btn_previous(
     :return: Render-able dict
     """
     logger.debug("btn_previous() url = %s", url)
-    return btn_button(
-        context,
-        url=url,
-        icon="chevron-left",
-        text=text,
-        icon_position=IconPosition.LEFT,
-        btn_css_color=btn_css_color,
-    )
+    return _preset_button("previous", context, {}, url=url, text=text, btn_css_color=btn_css_color)
 
 
-@register.inclusion_tag(get_filename("buttons/%s/switch-button.html"), takes_context=False)
+@button_tag("buttons/{package}/switch-button.html", takes_context=False)
 def btn_switch(
     value: Any,
     switch_alts: str,
@@ -767,6 +1011,7 @@ def btn_switch(
     switch_url: Optional[str] = None,
     title: Optional[str] = None,
     btn_id: Optional[str] = None,
+    bulk_url: Optional[str] = None,
     **kwargs,
 ) -> Dict[str, Any]:
     """
@@ -783,6 +1028,8 @@ def btn_switch(
     :param switch_url: Address to invoke to swirch the value.
     :param title: Main title in the button.
     :param btn_id: Identifier for the button
+    :param bulk_url: Address of a :class:`buttons.views.BulkSwitchView`: the toggles are queued and sent together,
+                     with the `data_pk` value of the switches
     :param kwargs: Additional kwargs
 
     :return: Render-able dict
@@ -796,6 +1043,8 @@ def btn_switch(
         "title": title,
         "switch_url": switch_url,
     }
+    if bulk_url:
+        output.update({"bulk_url": bulk_url})
     if btn_id is not None:
         output.update({"id": btn_id})
 
@@ -806,28 +1055,205 @@ def btn_switch(
     if data:
         output.update({"data": data})
 
-    logger.debug(f"btn_switch() output = {pprint.pformat(output, indent=2)}")
     return output
 
 
-@register.inclusion_tag(get_filename("buttons/%s/single-button.html"), takes_context=False)
+@button_tag("buttons/{package}/single-button.html", takes_context=False)
 def btn_single(
     icon,
     color,
     alt,
     title=None,
 ) -> Dict[str, Any]:
-
     output = {
         "icon": icon,
         "color": color,
         "alt": alt,
         "title": title,
     }
-    logger.debug(f"btn_single() output = {pprint.pformat(output, indent=2)}")
     return output
 
 
+@register.simple_tag(takes_context=True)
+def btn_row_actions(context, rows, actions):
+    """
+    Renders the action buttons of all the rows at once, see :func:`buttons.batch.render_row_actions`
+
+    .. code::
+
+        {% btn_row_actions object_list actions as rows %}
+        {% for row in rows %}
+            <tr><td>{{ row.row }}</td><td>{{ row.html }}</td></tr>
+        {% endfor %}
+
+    :param context: Context data
+    :param rows: Iterable of rows
+    :param actions: Actions specification
+    :return: List of :class:`buttons.batch.RowActions`
+    """
+    from buttons.batch import render_row_actions
+
+    return render_row_actions(rows, actions, context)
+
+
+class ButtonGroupNode(template.Node):
+    """
+    Node of the :func:`btn_group` tag
+    """
+
+    def __init__(self, nodelist, kwargs: Dict[str, Any], vary_on: List[Any]):
+        self.nodelist = nodelist
+        self.kwargs = kwargs
+        self.vary_on = vary_on
+
+    def get_name(self) -> str:
+        # Template and position of the tag, as set by the template parser
+        origin = getattr(self, "origin", None)
+        token = getattr(self, "token", None)
+        return f"{getattr(origin, 'name', '')}:{getattr(token, 'lineno', '')}:{getattr(token, 'position', '')}"
+
+    def render(self, context):
+        options = {name: value.resolve(context) for name, value in self.kwargs.items()}
+        timeout = options.get("timeout")
+        if timeout is None:
+            return self.render_group(options, context)
+
+        try:
+            timeout = int(timeout)
+        except (ValueError, TypeError):
+            raise template.TemplateSyntaxError(f"btn_group timeout must be a number, got {timeout!r}")
+        using = options.get("using") or settings.BUTTONS_GROUP_CACHE
+        try:
+            cache = caches[using]
+        except InvalidCacheBackendError:
+            raise template.TemplateSyntaxError(f"Invalid cache name specified for btn_group: {using}")
+
+        # The group element is part of the cached HTML
+        vary_on = [options.get("css_class", "btn-group"), options.get("label")]
+        vary_on.extend(value.resolve(context) for value in self.vary_on)
+        key = make_group_key(options.get("name") or self.get_name(), vary_on, context)
+        html = cache.get(key)
+        if html is None:
+            html = self.render_group(options, context)
+            cache.set(key, str(html), timeout)
+        return mark_safe(html)
+
+    def render_group(self, options: Dict[str, Any], context) -> SafeText:
+        """
+        Renders the buttons of the group, into a ``<div class="btn-group">`` element if its class is not empty
+
+        :param options: Resolved options of the tag
+        :param context: Rendering context
+        :return: Rendered group
+        """
+        content = self.nodelist.render(context)
+        css_class = options.get("css_class", "btn-group")
+        if not css_class:
+            return mark_safe(content)
+        attrs = {"class": css_class, "role": "group", "aria-label": options.get("label") or None}
+        return format_html("<div{}>{}</div>", flatatt(attrs), mark_safe(content))
+
+
+#: Options of the :func:`btn_group` tag
+BUTTON_GROUP_OPTIONS = ("name", "timeout", "using", "css_class", "label")
+
+
+@register.tag
+def btn_group(parser, token):
+    """
+    Renders a group of buttons, *ie.* a toolbar, optionally stored into a django cache backend
+
+    .. code::
+
+        {% btn_group timeout=600 label=_("Actions") vary_on object.pk request.user.pk %}
+            {% btn_update object.get_update_url %}
+            {% btn_delete object.get_delete_url %}
+        {% endbtn_group %}
+
+    Options:
+
+    + `timeout`: Cache timeout, in seconds, the group is not cached if not set
+    + `using`: Cache backend, default ``BUTTONS_GROUP_CACHE``
+    + `name`: Cache name of the group, default the template and the position of the tag
+    + `css_class`: Class of the group element, default ``btn-group``, no element if empty
+    + `label`: ``aria-label`` of the group element
+
+    As with the ``{% cache %}`` tag, the ``vary_on`` values are the values the buttons depend on, *ie.* the urls
+    objects and the permissions: the cache keys also vary on the options of the group, the active language and the
+    ``BUTTONS_*`` settings, see :func:`buttons.cache.make_group_key`. The ``vary_on`` values are required with a
+    `timeout`, a bare ``vary_on`` declares a group which depends on nothing else. The :mod:`buttons.signals` are not
+    sent for the cached groups.
+    """
+    bits = token.split_contents()[1:]
+    vary_on = None
+    if "vary_on" in bits:
+        index = bits.index("vary_on")
+        bits, vary_bits = bits[:index], bits[index:]
+        vary_on = [parser.compile_filter(bit) for bit in vary_bits[1:]]
+    kwargs = token_kwargs(bits, parser)
+    if bits:
+        raise template.TemplateSyntaxError(f"Malformed arguments to btn_group tag: {' '.join(bits)}")
+    for name in kwargs:
+        if name not in BUTTON_GROUP_OPTIONS:
+            raise template.TemplateSyntaxError(f"Unknown btn_group option: {name}")
+    if "timeout" in kwargs and vary_on is None:
+        # The cached group would be served for any object, user or permission
+        raise template.TemplateSyntaxError(
+            "btn_group timeout requires vary_on values, ie. `vary_on object.pk request.user.pk`, or a bare `vary_on`"
+        )
+
+    nodelist = parser.parse(("endbtn_group",))
+    parser.delete_first_token()
+    return ButtonGroupNode(nodelist, kwargs, vary_on or [])
+
+
+@register.simple_tag
+def btn_fa5_icon(icon, style_prefix: str = "fas", **kwargs) -> SafeText:
+    """
+    Renders a fontawesome 5 icon, as ``{% fa5_icon %}`` does, through the :mod:`buttons.icons` cache
+
+    :param icon: Icon name
+    :param style_prefix: Icon style prefix, default ``fas``
+    :param kwargs: Additional icon keyword args
+    :return: Icon HTML
+    """
+    return icons.fa5_icon(icon, style_prefix, **kwargs)
+
+
+@register.simple_tag
+def btn_fa4_icon(icon, **kwargs) -> SafeText:
+    """
+    Renders a fontawesome 4 icon, as ``{% fontawesome_icon %}`` does, through the :mod:`buttons.icons` cache
+
+    :param icon: Icon name
+    :param kwargs: Additional icon keyword args
+    :return: Icon HTML
+    """
+    return icons.fa4_icon(icon, **kwargs)
+
+
+@register.simple_tag
+def btn_icon_sprite() -> SafeText:
+    """
+    Inlines the SVG sprite into the page, when the icons are rendered as references to its symbols
+
+    .. code::
+
+        <body>
+            {% btn_icon_sprite %}
+            ...
+
+    :return: Sprite content
+    """
+    if settings.BUTTONS_ICON_MODE != "sprite" or not settings.BUTTONS_ICON_SPRITE:
+        return mark_safe("")
+    if not settings.BUTTONS_ICON_SPRITE_INLINE:
+        return mark_safe("")
+    from buttons.sprite import read_sprite
+
+    return mark_safe(read_sprite(settings.BUTTONS_ICON_SPRITE))
+
+
 @register.filter
 def expand_data(data) -> SafeText:
     """
@@ -842,15 +1268,6 @@ def expand_data(data) -> SafeText:
 
     :return: HTML attributes
     """
-    if not data:
-        return ""
-
-    output = []
-    for key, value in list(data.items()):
-        if isinstance(value, bool):
-            value = str(value).lower()
-        output.append(
-            f'data-{key}="{value}"',
-        )
+    output = renderers.expand_data(data)
     logger.debug("expand_data(%s) output = %s", data, output)
-    return mark_safe(" ".join(output))
+    return output
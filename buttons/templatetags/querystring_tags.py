@@ -10,15 +10,25 @@ Template tags to create smart querystrings
 
 import logging
 import re
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
 
 from django import template
 from django.http import QueryDict
 from django.utils.encoding import smart_str
 
+from buttons.querystate import compact_query_string
+
 __author__ = "fguerin"
 logger = logging.getLogger("buttons.templatetags.querystring_tags")
 register = template.Library()
 
+# matches 'tagname1+val1', 'tagname1=val1' or 'tagname1^val1' but not 'anyoldvalue'
+MODIFIER_RE = re.compile(r"^(\w+)(=|\+|-|\^)(.*)$")
+
+#: Key of the parse cache in the request or the render context
+_PARSE_CACHE_ATTR = "_query_string_cache"
+
 
 @register.tag
 def query_string(parser, token):
@@ -28,7 +38,7 @@ def query_string(parser, token):
     Syntax:
         {% query_string  [<base_querystring>] [modifier]* [as <var_name>] %}
 
-        modifier is <name><op><value> where op in {=, +, -}
+        modifier is <name><op><value> where op in {=, +, -, ^}
 
     Parameters:
         - base_querystring: literal query string, e.g. '?tag=python&tag=django&year=2011',
@@ -40,10 +50,11 @@ def query_string(parser, token):
         - modifiers may be repeated and have the form <name><op><value>.
                            They are processed in the order they appear.
                            name is taken as is for a parameter name.
-                           op is one of {=, +, -}.
+                           op is one of {=, +, -, ^}.
                            = replace all existing values of name with value(s)
                            + add value(s) to existing values for name
                            - remove value(s) from existing values if present
+                           ^ toggle value(s): remove them if present, else add them
                            value is either a literal parameter value
                              or a context variable. If it is a context variable
                              it may also be bound to a list.
@@ -62,9 +73,12 @@ def query_string(parser, token):
         {% query_string qs tag+tags month=m %}
 
         Result: '?tag=a&tag=b&tag=c&tag=d&year=2011&month=4
+
+    3.  {% query_string '?tag=a&tag=b' tag^'b' tag^'c' %}
+
+        Result: '?tag=a&tag=c'
     """
-    # matches 'tagname1+val1' or 'tagname1=val1' but not 'anyoldvalue'
-    mod_re = re.compile(r"^(\w+)(=|\+|-)(.*)$")
+    mod_re = MODIFIER_RE
     bits = token.split_contents()
     query_dict = None
     mods = []
@@ -87,29 +101,60 @@ def query_string(parser, token):
     return QueryStringNode(query_dict, mods, as_var)
 
 
+@register.tag
+def query_string_range(parser, token):
+    """
+    Template tag for creating the query strings of a parameter, for a sequence of values, *ie.* for pagination or
+    facets links. The query strings are the same as :func:`query_string` ones, but the other parameters are encoded
+    only once.
+
+    Syntax:
+        {% query_string_range <base_querystring> <name> <values> [modifier]* as <var_name> %}
+
+    Parameters:
+        - base_querystring: as :func:`query_string` one, may be '' or None.
+        - name: parameter name, which may end with an operator in {=, +, -, ^}, default '='.
+        - values: context variable bound to a sequence of values.
+        - modifiers: as :func:`query_string` ones, applied before the values.
+        - as <var name>: bind the list of the (value, query string) pairs to a context variable.
+
+    Example:
+        {% query_string_range request.GET "page" page_obj.paginator.page_range as pages %}
+        {% for number, qs in pages %}<a href="{{ qs }}">{{ number }}</a>{% endfor %}
+    """
+    bits = token.split_contents()
+    if len(bits) < 6 or bits[-2] != "as":
+        raise template.TemplateSyntaxError(
+            "query_string_range syntax is {% query_string_range base name values [modifier]* as var %}"
+        )
+    as_var = bits[-1]
+    query_dict, name, values = (parser.compile_filter(bit) for bit in bits[1:4])
+    mods = []
+    for bit in bits[4:-2]:
+        match = MODIFIER_RE.match(bit)
+        if not match:
+            raise template.TemplateSyntaxError("Malformed arguments to query_string_range tag")
+        k, op, value = match.groups()
+        mods.append((k, op, parser.compile_filter(value)))
+    return QueryStringRangeNode(query_dict, name, values, mods, as_var)
+
+
 class QueryStringNode(template.Node):
     def __init__(self, query_dict, modifiers, as_var):
         self.query_dict = query_dict
         self.modifiers = modifiers
         self.as_var = as_var
+        self.plan = compile_modifiers(modifiers)
 
     def render(self, context):
-        modifiers = [(smart_str(k, "ascii"), op, v.resolve(context)) for k, op, v in self.modifiers]
+        modifiers = [(k, op, v.resolve(context) if resolve else v) for k, op, v, resolve in self.plan]
 
         if self.query_dict:
             query_dict = self.query_dict.resolve(context)
         else:
             query_dict = None
 
-        # Internally work only with QueryDict
-        query_dict = self._get_initial_query_dict(query_dict)
-        # assert isinstance(query_dict, QueryDict)
-        for k, op, v in modifiers:
-            query_dict.setlist(k, self._process_modifiers_list(query_dict.getlist(k), op, v))
-
-        _query_string = query_dict.urlencode()
-        if _query_string:
-            _query_string = "?" + _query_string
+        _query_string = get_parsed_query(query_dict, get_parse_cache(context)).apply(modifiers)
 
         if self.as_var:
             context[self.as_var] = _query_string
@@ -155,6 +200,14 @@ class QueryStringNode(template.Node):
 
     @staticmethod
     def _process_modifiers_list(current_list, op, val):
+        """
+        Applies a modifier to the values of a parameter, in linear time: the order of the values is kept
+
+        :param current_list: Current values
+        :param op: Operator, in {=, +, -, ^}
+        :param val: Modifier value, or list of values
+        :return: New values
+        """
         if not val:
             if op == "=":
                 return []
@@ -168,18 +221,239 @@ class QueryStringNode(template.Node):
 
         # Remove
         if op == "-":
-            for v in val:
-                while v in current_list:
-                    current_list.remove(v)
-            return current_list
+            removed = set(val)
+            return [v for v in current_list if v not in removed]
 
         # Replace
         if op == "=":
-            current_list = val
-            return current_list
+            return val
 
         # Add
         if op == "+":
-            for v in val:
-                current_list.append(v)
+            current_list.extend(val)
             return current_list
+
+        # Toggle: present values are removed, the others are added once
+        if op == "^":
+            present = set(current_list)
+            removed = present.intersection(val)
+            current_list = [v for v in current_list if v not in removed] if removed else current_list
+            current_list.extend(v for v in dict.fromkeys(val) if v not in present)
+            return current_list
+
+
+class QueryStringRangeNode(template.Node):
+    def __init__(self, query_dict, name, values, modifiers, as_var):
+        self.query_dict = query_dict
+        self.name = name
+        self.values = values
+        self.plan = compile_modifiers(modifiers)
+        self.as_var = as_var
+
+    def render(self, context):
+        modifiers = [(k, op, v.resolve(context) if resolve else v) for k, op, v, resolve in self.plan]
+        name, op = split_range_name(self.name.resolve(context))
+        values = list(self.values.resolve(context) or ())
+        parsed = get_parsed_query(self.query_dict.resolve(context), get_parse_cache(context))
+        context[self.as_var] = list(zip(values, parsed.apply_range(name, op, values, modifiers)))
+        return ""
+
+
+def split_range_name(name: str) -> Tuple[str, str]:
+    """
+    Splits the parameter name of :func:`query_string_range` into the name and the operator
+
+    :param name: Parameter name, which may end with an operator in {=, +, -, ^}
+    :return: Name and operator
+    """
+    name = smart_str(name, "ascii")
+    if name[-1:] in ("=", "+", "-", "^"):
+        return name[:-1], name[-1]
+    return name, "="
+
+
+def compile_modifiers(modifiers) -> List[Tuple[str, str, Any, bool]]:
+    """
+    Compiles the modifiers of a :func:`query_string` tag, at parse time: the names are converted once, and the
+    literal values are resolved once
+
+    :param modifiers: Modifiers, as ``(name, op, FilterExpression)`` tuples
+    :return: Modifiers plan, as ``(name, op, value or FilterExpression, to resolve)`` tuples
+    """
+    plan = []
+    for k, op, v in modifiers:
+        k = smart_str(k, "ascii")
+        var = v.var
+        if v.filters or isinstance(var, template.Variable) and (var.lookups is not None or var.translate):
+            plan.append((k, op, v, True))
+        else:
+            plan.append((k, op, v.resolve({}), False))
+    return plan
+
+
+class ParsedQuery:
+    """
+    Base query string of a :func:`query_string` tag, parsed and encoded once: the modified parameters are spliced
+    into the encoded parameters
+
+    The output is the same as :meth:`django.http.QueryDict.urlencode` of the modified query dict, or its state token
+    if it is long and the ``BUTTONS_QUERY_STATE`` setting is set, see :mod:`buttons.querystate`.
+    """
+
+    __slots__ = ("source", "lists", "encoding", "segments", "encoded")
+
+    def __init__(self, query_dict: QueryDict, source: Any = None):
+        #: Parsed object, kept alive while its `id()` is used as a cache key
+        self.source = source
+        self.lists: Dict[str, List[str]] = dict(query_dict.lists())
+        self.encoding = query_dict.encoding
+        self.segments: Dict[str, str] = {k: self.encode(k, list_) for k, list_ in self.lists.items()}
+        self.encoded = self.join(self.segments.values())
+
+    def encode(self, k: str, list_: Sequence[Any]) -> str:
+        """
+        Encodes the values of a parameter, as :meth:`django.http.QueryDict.urlencode` does
+
+        :param k: Parameter name
+        :param list_: Parameter values
+        :return: Encoded parameter
+        """
+        k = k.encode(self.encoding)
+        return "&".join(urlencode({k: str(v).encode(self.encoding)}) for v in list_)
+
+    @staticmethod
+    def join(segments) -> str:
+        _query_string = "&".join(segment for segment in segments if segment)
+        if _query_string:
+            _query_string = "?" + _query_string
+        return _query_string
+
+    def _get_changed(self, modifiers) -> Dict[str, List[str]]:
+        changed: Dict[str, List[str]] = {}
+        for k, op, v in modifiers:
+            current_list = changed[k] if k in changed else list(self.lists.get(k, ()))
+            changed[k] = QueryStringNode._process_modifiers_list(current_list, op, v)
+        return changed
+
+    def _get_segments(self, changed: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+        segments = [
+            (k, self.encode(k, changed[k]) if k in changed else segment) for k, segment in self.segments.items()
+        ]
+        segments.extend((k, self.encode(k, list_)) for k, list_ in changed.items() if k not in self.lists)
+        return segments
+
+    def apply(self, modifiers) -> str:
+        """
+        Applies the modifiers to the base query
+
+        :param modifiers: Resolved modifiers, as ``(name, op, value)`` tuples
+        :return: Query string, starting with `?` if not empty
+        """
+        if not modifiers:
+            return compact_query_string(self.encoded)
+        return compact_query_string(
+            self.join(segment for _k, segment in self._get_segments(self._get_changed(modifiers)))
+        )
+
+    def apply_range(self, name: str, op: str, values, modifiers=()) -> List[str]:
+        """
+        Applies the ``(name, op, value)`` modifier for each of the values, after the other modifiers: the other
+        parameters are encoded only once
+
+        :param name: Parameter name
+        :param op: Operator, in {=, +, -, ^}
+        :param values: Parameter values
+        :param modifiers: Resolved modifiers applied before, as ``(name, op, value)`` tuples
+        :return: Query strings, one for each value
+        """
+        changed = self._get_changed(modifiers)
+        current_list = changed[name] if name in changed else list(self.lists.get(name, ()))
+        # Placeholder of the parameter, at its position in the query dict
+        changed[name] = current_list
+        segments = self._get_segments(changed)
+        index = [k for k, _segment in segments].index(name)
+        prefix = "&".join(segment for i, (_k, segment) in enumerate(segments) if segment and i < index)
+        suffix = "&".join(segment for i, (_k, segment) in enumerate(segments) if segment and i > index)
+
+        query_strings = []
+        for value in values:
+            segment = self.encode(name, QueryStringNode._process_modifiers_list(list(current_list), op, value))
+            query_strings.append(compact_query_string(self.join((prefix, segment, suffix))))
+        return query_strings
+
+
+def get_parse_cache(context) -> Dict[Hashable, ParsedQuery]:
+    """
+    Gets the parse cache of the request, or of the rendering if there is no request into the context
+
+    :param context: Rendering context
+    :return: Parse cache
+    """
+    request = context.get("request")
+    if request is not None:
+        try:
+            return request.__dict__.setdefault(_PARSE_CACHE_ATTR, {})
+        except AttributeError:
+            pass
+    return context.render_context.setdefault(_PARSE_CACHE_ATTR, {})
+
+
+def get_parsed_query(query_dict, cache: Optional[Dict[Hashable, ParsedQuery]] = None) -> ParsedQuery:
+    """
+    Gets the parsed base query, from the cache if available
+
+    Immutable query dicts, *ie.* ``request.GET``, are cached by identity and strings by content. Other bases, which
+    may change between two calls, are parsed each time.
+
+    :param query_dict: Base query string, dict or QueryDict, may be ``None``
+    :param cache: Parse cache
+    :return: Parsed query
+    """
+    if cache is None:
+        return ParsedQuery(QueryStringNode._get_initial_query_dict(query_dict))
+
+    if not query_dict:
+        key = None
+    elif isinstance(query_dict, QueryDict) and not query_dict._mutable:
+        key = ("id", id(query_dict))
+    elif isinstance(query_dict, str):
+        key = ("str", query_dict)
+    else:
+        return ParsedQuery(QueryStringNode._get_initial_query_dict(query_dict))
+
+    parsed = cache.get(key)
+    if parsed is None:
+        parsed = cache[key] = ParsedQuery(QueryStringNode._get_initial_query_dict(query_dict), query_dict)
+    return parsed
+
+
+def build_query_string(query_dict, modifiers) -> str:
+    """
+    Builds a query string, as the :func:`query_string` tag does
+
+    :param query_dict: Base query string, dict or QueryDict, may be ``None``
+    :param modifiers: Resolved modifiers, as ``(name, op, value)`` tuples, with `op` in {=, +, -, ^}
+    :return: Query string, starting with `?` if not empty
+    """
+    modifiers = [(smart_str(k, "ascii"), op, v) for k, op, v in modifiers]
+    return get_parsed_query(query_dict).apply(modifiers)
+
+
+def build_query_string_range(query_dict, name: str, values, modifiers=()) -> List[str]:
+    """
+    Builds the query strings of a parameter for a sequence of values, as the :func:`query_string_range` tag does
+
+    .. code::
+
+        build_query_string_range(request.GET, "page", range(1, 11))
+        # == [build_query_string(request.GET, [("page", "=", page)]) for page in range(1, 11)]
+
+    :param query_dict: Base query string, dict or QueryDict, may be ``None``
+    :param name: Parameter name, which may end with an operator in {=, +, -, ^}, default '='
+    :param values: Parameter values
+    :param modifiers: Resolved modifiers applied before, as ``(name, op, value)`` tuples
+    :return: Query strings, one for each value
+    """
+    name, op = split_range_name(name)
+    modifiers = [(smart_str(k, "ascii"), mod_op, v) for k, mod_op, v in modifiers]
+    return get_parsed_query(query_dict).apply_range(name, op, list(values), modifiers)
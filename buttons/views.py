@@ -0,0 +1,378 @@
+"""
+Server-side views of the :func:`buttons.templatetags.buttons_tags.btn_switch` switches
+
+The :class:`SwitchView` view, or its :class:`AsyncSwitchView` async variant, flips a boolean field of an object, and
+is called by `buttons/js/main.js` with the ``switch_url`` of the switch:
+
+.. code::
+
+    # urls.py
+    path("articles/<int:pk>/published/", SwitchView.as_view(model=Article, field="published"), name="article-published")
+
+.. code::
+
+    {% url "article-published" article.pk as switch_url %}
+    {% btn_switch article.published "Published,Draft" switch_url=switch_url %}
+
+The :class:`BulkSwitchView` view flips a boolean field of many objects at once: the toggles of the switches are
+queued and debounced by `buttons/js/main.js`, and sent as a single request.
+
+.. code::
+
+    # urls.py
+    path(
+        "articles/published/switch/",
+        BulkSwitchView.as_view(model=Article, field="published"),
+        name="article-published-switch",
+    )
+
+.. code::
+
+    {% url "article-published-switch" as bulk_url %}
+    {% for article in articles %}
+        {% btn_switch article.published "Published,Draft" btn_id=article.slug bulk_url=bulk_url data_pk=article.pk %}
+    {% endfor %}
+
+The :class:`ButtonFragmentsView` view renders many buttons at once, for the rows loaded by HTMX or by scripts: the
+button specs, a preset name and its params, are sent as JSON, with a ``GET`` request, cacheable, or a ``POST`` one, and
+the rendered fragments are returned as a JSON map:
+
+.. code::
+
+    # urls.py
+    path("buttons/fragments/", ButtonFragmentsView.as_view(), name="button-fragments")
+
+.. code::
+
+    GET /buttons/fragments/?buttons=[{"key":"del-1","name":"delete","params":{"url":"/articles/1/delete/"}}]
+
+    {"fragments": {"del-1": "\\n<a href=\\"/articles/1/delete/\\" ..."}}
+
+.. note::
+
+    The views do not check any permission: use them with the django access mixins, *ie.*
+    :class:`django.contrib.auth.mixins.PermissionRequiredMixin`, and restrict the objects with
+    :meth:`SwitchMixin.get_queryset`.
+
+:creationdate: 19/10/2026 09:10
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: buttons.views
+
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Type
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import models, transaction
+from django.db.models import BooleanField, Case, Value, When
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
+from django.template import Context
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views import View
+
+from buttons.templatetags.buttons_tags import BUTTON_TAGS
+
+__author__ = "fguerin"
+logger = logging.getLogger("buttons.views")
+
+
+def flip_expression(field: str) -> Case:
+    """
+    Gets the SQL expression of the negation of a boolean field, ``NULL`` values are set to ``True``
+
+    :param field: Boolean field name
+    :return: Expression, to be used in :meth:`django.db.models.QuerySet.update`
+    """
+    return Case(When(**{field: True}, then=Value(False)), default=Value(True), output_field=BooleanField())
+
+
+class SwitchMixin:
+    """
+    Boolean field of a model switched by the views
+    """
+
+    #: Model of the switched objects
+    model: Optional[Type[models.Model]] = None
+
+    #: Name of the switched boolean field
+    field: Optional[str] = None
+
+    def get_queryset(self) -> models.QuerySet:
+        """
+        Gets the objects which can be switched
+
+        :return: Queryset
+        """
+        if self.model is None or self.field is None:
+            raise ImproperlyConfigured(f"{self.__class__.__name__} requires the `model` and `field` attributes")
+        return self.model._default_manager.all()
+
+    def flip(self, pks: Iterable[Any]) -> Dict[str, bool]:
+        """
+        Flips the field of the objects, with a single ``UPDATE`` query
+
+        :param pks: Primary keys of the objects
+        :return: New values, by primary key
+        """
+        queryset = self.get_queryset().filter(pk__in=list(pks))
+        with transaction.atomic():
+            queryset.update(**{self.field: flip_expression(self.field)})
+            return {str(pk): value for pk, value in queryset.values_list("pk", self.field)}
+
+
+class BulkSwitchView(SwitchMixin, View):
+    """
+    Flips the field of many objects, in a single transaction
+
+    The request body is a JSON object, with the primary keys of the objects to flip:
+
+    .. code::
+
+        {"toggles": [1, 2, 5]}
+
+    The response contains the new values of the objects:
+
+    .. code::
+
+        {"values": {"1": true, "2": false, "5": true}}
+
+    Each object is flipped once, whatever the number of its toggles. Objects which cannot be switched, *ie.* excluded
+    by :meth:`get_queryset`, are missing from the response.
+    """
+
+    http_method_names = ["post"]
+
+    #: Maximum number of toggles of a request
+    max_toggles = 1000
+
+    def post(self, request, *args, **kwargs):
+        try:
+            toggles = json.loads(request.body)["toggles"]
+        except (ValueError, KeyError, TypeError):
+            return HttpResponseBadRequest("Invalid request body")
+        if not isinstance(toggles, list) or len(toggles) > self.max_toggles:
+            return HttpResponseBadRequest("Invalid toggles")
+
+        try:
+            values = self.flip(toggles)
+        except (ValueError, TypeError, ValidationError):
+            return HttpResponseBadRequest("Invalid toggles")
+        logger.debug("BulkSwitchView.post() %d %s.%s switched", len(values), self.model.__name__, self.field)
+        return JsonResponse({"values": values})
+
+
+class SwitchView(SwitchMixin, View):
+    """
+    Flips the field of an object, with a single ``UPDATE`` query: concurrent switches are not lost
+
+    The response contains the new value of the object:
+
+    .. code::
+
+        {"value": true}
+    """
+
+    http_method_names = ["post"]
+
+    #: Name of the URL keyword argument of the primary key
+    pk_url_kwarg = "pk"
+
+    def switch(self) -> bool:
+        """
+        Flips the field of the object
+
+        :return: New value
+        """
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        try:
+            values = self.flip([pk])
+        except (ValueError, TypeError, ValidationError):
+            values = {}
+        if not values:
+            raise Http404(f"No {self.model._meta.verbose_name} found for {pk!r}")
+        return next(iter(values.values()))
+
+    def post(self, request, *args, **kwargs):
+        return JsonResponse({"value": self.switch()})
+
+
+class AsyncSwitchView(SwitchView):
+    """
+    Async variant of :class:`SwitchView`: the transaction runs in the thread of the synchronous database connections
+    """
+
+    async def post(self, request, *args, **kwargs):
+        value = await sync_to_async(self.switch)()
+        return JsonResponse({"value": value})
+
+
+#: Params read by :func:`buttons.templatetags.buttons_tags.btn_button` from its additional keyword args
+BUTTON_PARAMS = (
+    "text",
+    "title",
+    "url",
+    "icon",
+    "icon_position",
+    "icon_css_extra",
+    "btn_type",
+    "btn_id",
+    "btn_name",
+    "name",
+    "btn_value",
+    "value",
+    "btn_css_color",
+    "btn_css_extra",
+    "data_dismiss",
+    "data_toggle",
+    "data_target",
+    "data_placement",
+)
+
+
+@lru_cache(maxsize=None)
+def get_named_params(func: Callable) -> FrozenSet[str]:
+    """
+    Gets the named params of a tag function, without the context and the variable args
+
+    :param func: Tag function
+    :return: Param names
+    """
+    kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    parameters = inspect.signature(func).parameters.values()
+    return frozenset(parameter.name for parameter in parameters if parameter.kind in kinds) - {"context"}
+
+
+class ButtonFragmentsView(View):
+    """
+    Renders many buttons at once, with the ``btn_*`` tag functions, into a JSON map of HTML fragments
+
+    The button specs are a JSON list, sent as the ``buttons`` parameter of a ``GET`` request, or as the ``buttons``
+    member of the JSON body of a ``POST`` one. Each spec gives the name of a preset, *ie.* ``delete`` for the
+    ``btn_delete`` tag, its params, and the key of its fragment, default its position in the list:
+
+    .. code::
+
+        {"buttons": [{"key": "del-1", "name": "delete", "params": {"url": "/articles/1/delete/", "btn_id": "del-1"}}]}
+
+    The response maps the keys to the rendered buttons, the very same as the tags render:
+
+    .. code::
+
+        {"fragments": {"del-1": "\\n<a href=\\"/articles/1/delete/\\" id=\\"del-1\\" ..."}}
+
+    The params are the named params of the tag function and the :attr:`allowed_params`: the other ones would be
+    rendered as HTML attributes of the button, *ie.* ``onclick``, and are rejected.
+
+    The ``GET`` responses have a strong ``ETag``, the hash of their content, and the requests whose ``If-None-Match``
+    header matches it are answered with a ``304 Not Modified``, so that the HTTP caches can serve the repeated specs.
+    The ``POST`` responses have no ``ETag`` and no ``Cache-Control`` header.
+    """
+
+    http_method_names = ["get", "head", "post"]
+
+    #: Params of the buttons besides the named params of the tag functions, *ie.* ``("data_pk",)`` may be added
+    allowed_params: Sequence[str] = BUTTON_PARAMS
+
+    #: Maximum number of buttons of a request
+    max_buttons = 1000
+
+    #: `max-age` of the ``Cache-Control`` header of the responses, in seconds
+    max_age = 600
+
+    def get_specs(self, request) -> Any:
+        """
+        Gets the button specs of the request
+
+        :param request: HTTP request
+        :return: Decoded button specs, not checked
+        :raises ValueError: If the specs cannot be decoded
+        """
+        if request.method == "POST":
+            return json.loads(request.body)["buttons"]
+        return json.loads(request.GET["buttons"])
+
+    def get_context(self) -> Context:
+        """
+        Gets the rendering context of the buttons: the tags read their missing params from it
+
+        :return: Rendering context
+        """
+        return Context()
+
+    def render_fragment(self, spec: Dict[str, Any], context: Context) -> str:
+        """
+        Renders a button with its tag function
+
+        :param spec: Button spec
+        :param context: Rendering context
+        :return: Rendered button
+        :raises ValueError: If the spec is not valid
+        """
+        name, params = spec.get("name"), spec.get("params", {})
+        tag = BUTTON_TAGS.get(f"btn_{name}") if isinstance(name, str) else None
+        if tag is None:
+            raise ValueError(f"Unknown button: {name!r}")
+        if not isinstance(params, dict) or not all(
+            isinstance(value, (str, int, float, bool)) or value is None for value in params.values()
+        ):
+            raise ValueError(f"Invalid params of {name!r}")
+        unknown = set(params).difference(get_named_params(tag.func), self.allowed_params)
+        if unknown:
+            raise ValueError(f"Unknown params of {name!r}: {', '.join(sorted(unknown))}")
+
+        node = tag.get_node()
+        args = [context] if node.takes_context else []
+        try:
+            return node.render_call(args, params, context)
+        except Exception as exception:
+            # Unexpected or missing params of the tag function, or params of the wrong type, *ie.* a number as the
+            # `switch_alts` of a switch
+            raise ValueError(f"Invalid params of {name!r}: {exception!r}") from exception
+
+    def render_fragments(self, specs: List[Any]) -> Dict[str, str]:
+        """
+        Renders the buttons of the specs
+
+        :param specs: Button specs
+        :return: Rendered buttons, by key
+        :raises ValueError: If a spec is not valid
+        """
+        context = self.get_context()
+        fragments = {}
+        for index, spec in enumerate(specs):
+            if not isinstance(spec, dict):
+                raise ValueError(f"Invalid button spec: {spec!r}")
+            fragments[str(spec.get("key", index))] = self.render_fragment(spec, context)
+        return fragments
+
+    def get(self, request, *args, **kwargs):
+        try:
+            specs = self.get_specs(request)
+        except (ValueError, KeyError, TypeError):
+            return HttpResponseBadRequest("Invalid buttons")
+        if not isinstance(specs, list) or len(specs) > self.max_buttons:
+            return HttpResponseBadRequest("Invalid buttons")
+
+        try:
+            fragments = self.render_fragments(specs)
+        except ValueError as exception:
+            logger.debug("ButtonFragmentsView.get() %s", exception)
+            return HttpResponseBadRequest("Invalid buttons")
+
+        response = JsonResponse({"fragments": fragments})
+        if request.method not in ("GET", "HEAD"):
+            # The POST responses are not cacheable
+            return response
+        etag = quote_etag(hashlib.md5(response.content).hexdigest())
+        response["ETag"] = etag
+        patch_cache_control(response, max_age=self.max_age)
+        return get_conditional_response(request, etag=etag, response=response)
+
+    post = get
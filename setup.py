@@ -47,6 +47,9 @@ setup(
         "fa5": [
             "django-fontawesome-5",
         ],
+        "jinja2": [
+            "Jinja2>=3.0",
+        ],
     },
     # Source files
     packages=find_packages("."),
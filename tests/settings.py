@@ -0,0 +1,25 @@
+"""
+Settings of the test suite of the :mod:`buttons:buttons` application
+
+The fontawesome applications are not installed: the fontawesome version is chosen by the
+``BUTTONS_FONTAWESOME_VERSION`` setting, which the tests override.
+
+:creationdate: 22/10/2026 09:10
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.settings
+
+"""
+
+SECRET_KEY = "tests"
+
+DEBUG = False
+
+INSTALLED_APPS = ["buttons"]
+
+DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
+
+TEMPLATES = [{"BACKEND": "django.template.backends.django.DjangoTemplates", "APP_DIRS": True}]
+
+USE_TZ = True
+
+BUTTONS_FONTAWESOME_VERSION = 5
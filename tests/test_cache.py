@@ -0,0 +1,56 @@
+"""
+Tests of the in-process button cache of :mod:`buttons.cache`
+
+:creationdate: 23/10/2026 14:10
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_cache
+
+"""
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from buttons.cache import get_button_cache
+
+
+class Article:
+    """
+    Equal to the articles of the same pk, as the model instances
+    """
+
+    def __init__(self, pk: int, title: str):
+        self.pk = pk
+        self.title = title
+
+    def __eq__(self, other):
+        return isinstance(other, Article) and other.pk == self.pk
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return self.title
+
+
+@override_settings(BUTTONS_CACHE_SIZE=100)
+class ButtonCacheTestCase(SimpleTestCase):
+    """
+    Tests of the rendered buttons cache
+    """
+
+    template = Template("{% load buttons_tags %}{% btn_button text=text url='/a/' %}")
+
+    def setUp(self):
+        get_button_cache().clear()
+
+    def test_cached(self):
+        first = self.template.render(Context({"text": "Article"}))
+        self.assertEqual(self.template.render(Context({"text": "Article"})), first)
+        self.assertEqual(get_button_cache().info().hits, 1)
+
+    def test_objects(self):
+        article = Article(1, "First")
+        self.assertIn("First", self.template.render(Context({"text": article})))
+        article.title = "Renamed"
+        self.assertIn("Renamed", self.template.render(Context({"text": article})))
+        self.assertEqual(get_button_cache().info().currsize, 0)
@@ -0,0 +1,73 @@
+"""
+Tests of the :func:`buttons.templatetags.buttons_tags.btn_group` tag
+
+:creationdate: 22/10/2026 11:40
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_group
+
+"""
+
+from typing import Any, Dict
+
+from django.core.cache import cache
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import SimpleTestCase
+
+
+def render(source: str, context: Dict[str, Any]) -> str:
+    """
+    Renders a template source, with the buttons tags loaded
+
+    :param source: Template source
+    :param context: Rendering context
+    :return: Rendered template
+    """
+    return Template("{% load buttons_tags %}" + source).render(Context(context))
+
+
+class ButtonGroupTestCase(SimpleTestCase):
+    """
+    Tests of the cached button groups
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_group(self):
+        output = render("{% btn_group label=label %}{% btn_home %}{% endbtn_group %}", {"label": "A & B"})
+        self.assertTrue(output.startswith('<div aria-label="A &amp; B" class="btn-group" role="group">'))
+        self.assertNotIn("<div", render("{% btn_group css_class='' %}{% btn_home %}{% endbtn_group %}", {}))
+
+    def test_timeout_requires_vary_on(self):
+        with self.assertRaisesMessage(TemplateSyntaxError, "btn_group timeout requires vary_on"):
+            Template("{% load buttons_tags %}{% btn_group timeout=60 %}{% btn_home %}{% endbtn_group %}")
+
+    def test_bare_vary_on(self):
+        source = "{% btn_group timeout=60 name='static' vary_on %}{% btn_update url %}{% endbtn_group %}"
+        first = render(source, {"url": "/objects/1/"})
+        self.assertIn("/objects/1/", first)
+        # Cached: the group declares it depends on nothing
+        self.assertEqual(render(source, {"url": "/objects/2/"}), first)
+
+    def test_vary_on(self):
+        source = "{% btn_group timeout=60 name='object' vary_on url %}{% btn_update url %}{% endbtn_group %}"
+        self.assertIn("/objects/1/", render(source, {"url": "/objects/1/"}))
+        self.assertIn("/objects/2/", render(source, {"url": "/objects/2/"}))
+
+    def test_vary_on_options(self):
+        source = (
+            "{% btn_group timeout=60 name='options' css_class=css_class label=label vary_on %}"
+            "{% btn_home %}{% endbtn_group %}"
+        )
+        outputs = [
+            render(source, {"css_class": "btn-group", "label": "Actions"}),
+            render(source, {"css_class": "btn-toolbar", "label": "Actions"}),
+            render(source, {"css_class": "btn-group", "label": "Tools"}),
+            render(source, {"css_class": "btn-group", "label": None}),
+            render(source, {"css_class": "", "label": "Actions"}),
+        ]
+        self.assertEqual(len(set(outputs)), len(outputs))
+        self.assertIn('class="btn-toolbar"', outputs[1])
+        self.assertIn('aria-label="Tools"', outputs[2])
+        self.assertNotIn("aria-label", outputs[3].split(">")[0])
+        self.assertNotIn("<div", outputs[4])
@@ -0,0 +1,212 @@
+"""
+Tests of the JavaScript render functions of :mod:`buttons.jsmodule`, and of the ``buttons_jsmodule`` command
+
+The module is run with `node`, if installed, on the presets, the ``btn_button`` tag, the switches and the single
+buttons, with a set of params, and its output is compared to the output of the tags.
+
+:creationdate: 23/10/2026 10:20
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_jsmodule
+
+"""
+
+import io
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import skipUnless
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.template import Context
+from django.test import SimpleTestCase, override_settings
+
+from buttons.jsmodule import build_module
+from buttons.presets import presets
+from buttons.templatetags.buttons_tags import BUTTON_TAGS
+
+#: Checked variants: name, settings overrides
+VARIANTS: List[Tuple[str, Dict[str, Any]]] = [
+    ("default", {}),
+    ("lean", {"BUTTONS_LEAN_MARKUP": True}),
+    ("debug", {"DEBUG": True}),
+]
+
+#: Params of the buttons
+BUTTON_PARAMS: List[Dict[str, Any]] = [
+    {},
+    {"btn_id": "delete-1"},
+    {"id": "i1", "btn_id": "i2"},
+    {"title": "It's <b>"},
+    {"text": "A & B", "icon": "home"},
+    {"text": ""},
+    {"icon_position": "LEFT"},
+    {"icon_position": "ONLY"},
+    {"icon_position": "NONE"},
+    {"icon_position": "left"},
+    {"data_toggle": "modal", "data_target": "#modal", "data_placement": "top", "data_dismiss": True},
+    {"name": "action", "value": "1", "foo": "bar", "flag": True, "off": False, "nil": None},
+    {"btn_name": "n", "name": "m", "btn_value": 0, "value": "v"},
+    {"btn_css_color": "btn-info", "btn_css_extra": ""},
+    {"btn_type": "submit", "icon_css_extra": "fa-lg"},
+    {"btn_type": None},
+]
+
+#: Urls of the buttons
+URLS: List[Optional[str]] = [None, "/objects/1/?a=1&b=<2>"]
+
+#: Params of the switches: value, alts, other params
+SWITCH_PARAMS: List[Tuple[Any, str, Dict[str, Any]]] = [
+    (True, "Yes,No", {}),
+    (False, "Published,Draft", {"switch_url": "/s/?a&b", "btn_id": "s1", "title": "Published"}),
+    (None, "Yes,No,Maybe", {"large": False, "bulk_url": "/bulk/", "data_pk": 3, "data_on": True, "other": 1}),
+    ("<x>", "yes", {"switch_icons": "check,times", "switch_colors": "primary,default", "btn_id": ""}),
+]
+
+#: Params of the single buttons: icon, color, alt
+SINGLE_PARAMS: List[Tuple[str, str, str]] = [("home", "primary", "Home"), ("trash", "d<", 'a"lt')]
+
+#: Runs the cases with the module, reading them from stdin
+DRIVER = """
+import {readFileSync} from "fs";
+import * as buttons from "./buttons.mjs";
+
+const cases = JSON.parse(readFileSync(0, "utf-8"));
+const outputs = cases.map(([func, args]) => {
+    try {
+        return buttons[func](...args);
+    } catch (error) {
+        return "Error";
+    }
+});
+process.stdout.write(JSON.stringify(outputs));
+"""
+
+
+def get_cases() -> List[Tuple[str, list]]:
+    """
+    Gets the checked cases
+
+    :return: Name of the module function and its args
+    """
+    cases = []
+    for url, params in itertools.product(URLS, BUTTON_PARAMS):
+        cases.append(("btnButton", [{**params, "url": url} if url else params]))
+        cases.extend(("renderPreset", [preset.name, url, params]) for preset in presets)
+    cases.extend(("btnSwitch", [value, alts, params]) for value, alts, params in SWITCH_PARAMS)
+    cases.extend(("btnSingle", list(params)) for params in SINGLE_PARAMS)
+    return cases
+
+
+def render_case(func: str, args: list) -> str:
+    """
+    Renders a case with the tags
+
+    :param func: Name of the module function
+    :param args: Args of the module function
+    :return: Rendered button, or ``"Error"``
+    """
+    context = Context()
+    try:
+        if func == "renderPreset":
+            name, url, params = args
+            return str(presets[name].render(context, url, **params))
+        if func == "btnButton":
+            return str(BUTTON_TAGS["btn_button"].get_node().render_call([context], args[0], context))
+        if func == "btnSwitch":
+            value, alts, params = args
+            kwargs = {"value": value, "switch_alts": alts, **params}
+            return str(BUTTON_TAGS["btn_switch"].get_node().render_call([], kwargs, context))
+        return str(BUTTON_TAGS["btn_single"].get_node().render_call(args, {}, context))
+    except (TypeError, ValueError):
+        return "Error"
+
+
+def run_module(node: str, content: str, cases: List[Tuple[str, list]]) -> List[str]:
+    """
+    Runs the cases with the module
+
+    :param node: `node` executable
+    :param content: Module source
+    :param cases: Checked cases
+    :return: Rendered buttons
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for name, source in (("buttons.mjs", content), ("driver.mjs", DRIVER)):
+            with open(os.path.join(directory, name), "w", encoding="utf-8") as stream:
+                stream.write(source)
+        process = subprocess.run(
+            [node, os.path.join(directory, "driver.mjs")],
+            input=json.dumps(cases),
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    return json.loads(process.stdout)
+
+
+@skipUnless(shutil.which("node"), "node is not installed")
+class JsModuleTestCase(SimpleTestCase):
+    """
+    Compares the output of the module with the output of the tags
+    """
+
+    def test_module(self):
+        for variant, overrides in VARIANTS:
+            with self.subTest(variant=variant):
+                with override_settings(**overrides):
+                    cases = get_cases()
+                    content = build_module(settings.LANGUAGE_CODE)
+                    expected = [render_case(func, args) for func, args in cases]
+                outputs = run_module(shutil.which("node"), content, cases)
+
+                differences = [(case, want, got) for case, want, got in zip(cases, expected, outputs) if want != got]
+                self.assertEqual(differences, [])
+                self.assertIn("<button", "".join(outputs))
+
+
+@override_settings(LANGUAGE_CODE="fr")
+class JsModuleCommandTestCase(SimpleTestCase):
+    """
+    Tests of the languages of the ``buttons_jsmodule`` command
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output_dir = directory.name
+
+    def call(self, *args: str) -> str:
+        stdout = io.StringIO()
+        call_command("buttons_jsmodule", "--output-dir", self.output_dir, *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def get_modules(self):
+        return sorted(os.listdir(os.path.join(self.output_dir, "buttons", "js")))
+
+    def test_default(self):
+        self.call()
+        self.assertEqual(self.get_modules(), ["buttons.fr.js"])
+        self.assertIn("Modules up to date for fr", self.call("--check"))
+
+    def test_languages(self):
+        self.call("--language", "de", "--language", "en")
+        self.assertEqual(self.get_modules(), ["buttons.de.js", "buttons.en.js"])
+
+    def test_translated_presets(self):
+        # The defaults of the presets are translated into the language of each module
+        self.assertIn('"text": "Retour"', build_module("fr"))
+        self.assertIn('"text": "Back"', build_module("en"))
+
+    def test_all_languages(self):
+        with self.assertRaisesMessage(CommandError, "LANGUAGES is not set in the settings"):
+            self.call("--all-languages")
+        with override_settings(LANGUAGES=[("fr", "Français"), ("en", "English")]):
+            self.call("--all-languages")
+            with self.assertRaisesMessage(CommandError, "Modules not up to date for de"):
+                self.call("--all-languages", "--language", "de", "--check")
+        self.assertEqual(self.get_modules(), ["buttons.en.js", "buttons.fr.js"])
@@ -0,0 +1,70 @@
+"""
+Tests of the ``BUTTONS_LEAN_MARKUP`` setting: size budgets of the buttons of the presets
+
+:creationdate: 23/10/2026 15:00
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_lean
+
+"""
+
+import itertools
+from typing import Dict
+
+from django.template import Context
+from django.test import SimpleTestCase, override_settings
+
+from buttons.presets import BUILTIN_PRESETS, presets
+from buttons.templatetags.buttons_tags import BUTTON_TAGS
+
+#: Upper bounds of the size of the lean buttons of the built-in presets, in bytes
+BUDGETS: Dict[str, int] = {
+    "copy": 112,
+    "download": 120,
+    "back": 120,
+    "link": 112,
+    "home": 112,
+    "submit": 112,
+    "list": 112,
+    "detail": 112,
+    "create": 112,
+    "search": 128,
+    "close": 136,
+    "login": 112,
+    "logout": 120,
+    "update": 112,
+    "delete": 112,
+    "next": 120,
+    "previous": 128,
+}
+
+#: Target url of the rendered buttons
+URL = "/objects/1/"
+
+
+@override_settings(BUTTONS_LEAN_MARKUP=True, DEBUG=True)
+class LeanMarkupTestCase(SimpleTestCase):
+    """
+    Checks the size of the lean buttons against their budgets, so that the markup does not grow unnoticed
+    """
+
+    def test_all_presets(self):
+        self.assertEqual(set(BUDGETS), {preset.name for preset in BUILTIN_PRESETS})
+
+    def test_budgets(self):
+        for name, budget in BUDGETS.items():
+            with self.subTest(name=name):
+                html = str(presets[name].render(Context(), url=URL))
+                self.assertLessEqual(len(html.encode("utf-8")), budget, html)
+                self.assertNotIn("<!--", html)
+
+    @override_settings(BUTTONS_ICON_MODE="sprite", BUTTONS_FAST_RENDERER=False)
+    def test_comments(self):
+        calls = {
+            "btn_switch": {"value": True, "switch_alts": "Yes,No"},
+            "btn_single": {"icon": "home", "color": "info", "alt": "Home"},
+        }
+        for version, (name, kwargs) in itertools.product((4, 5), calls.items()):
+            with self.subTest(version=version, name=name), override_settings(BUTTONS_FONTAWESOME_VERSION=version):
+                node = BUTTON_TAGS[name].get_node()
+                output = {**node.func(**kwargs), "debug": True, "lean": True}
+                self.assertNotIn("<!--", node.render_uncached(output, Context()))
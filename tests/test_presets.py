@@ -0,0 +1,126 @@
+"""
+Tests of the :mod:`buttons.presets` presets
+
+:creationdate: 22/10/2026 15:30
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_presets
+
+"""
+
+import inspect
+import itertools
+
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from buttons.presets import BUILTIN_PRESETS, ButtonPreset, presets, register_preset
+from buttons.templatetags.buttons_tags import BUTTON_TAGS, btn_button
+
+#: Params of the preset calls
+OVERRIDES = [
+    {},
+    {"url": "/u/", "text": "T", "title": "Ti", "btn_css_color": "btn-x", "data_toggle": "modal"},
+    {"url": "/u/", "text": ""},
+    {"icon_position": "LEFT", "btn_id": "b1", "foo": "bar"},
+]
+
+#: Contexts of the preset calls
+CONTEXTS = [{}, {"object": 1}, {"title": "Ti", "url": "/c/"}, {"btn_id": "c1", "icon": "cog"}]
+
+
+def render(source: str, **context) -> str:
+    """
+    Renders a template source, with the buttons tags loaded
+
+    :param source: Template source
+    :param context: Rendering context
+    :return: Rendered template
+    """
+    return Template("{% load buttons_tags %}" + source).render(Context(context))
+
+
+class PresetTestCase(SimpleTestCase):
+    """
+    Tests of the presets and of the built-in tags rendering them
+    """
+
+    def register(self, preset: ButtonPreset) -> None:
+        # Restores the replaced preset
+        if preset.name in presets:
+            self.addCleanup(register_preset, next(item for item in presets if item.name == preset.name))
+        register_preset(preset)
+
+    def test_builtin_tags(self):
+        # Each built-in tag renders its preset
+        values = {"url": "/objects/1/", "text": "Close"}
+        for preset in BUILTIN_PRESETS:
+            with self.subTest(preset=preset.name):
+                tag = BUTTON_TAGS[preset.tag_name]
+                parameters = list(inspect.signature(tag.func).parameters.values())[1:]
+                kwargs = {
+                    item.name: values[item.name]
+                    for item in parameters
+                    if item.default is item.empty and item.kind is item.POSITIONAL_OR_KEYWORD
+                }
+                context = Context()
+                self.assertEqual(
+                    tag.get_node().render_call([context], kwargs, context),
+                    presets[preset.name].render(context, **kwargs),
+                )
+
+    def test_fixed_defaults(self):
+        self.assertIn('href="javascript:history.back()"', render("{% btn_back %}"))
+        self.assertIn('href="/"', render("{% btn_home %}"))
+        self.assertIn('type="submit"', render("{% btn_submit %}"))
+        self.assertIn('type="submit"', render("{% btn_search %}"))
+        self.assertIn('data-dismiss="True"', render("{% btn_close 'Close' %}"))
+
+    def test_override_params(self):
+        output = render("{% btn_delete '/d/' text='Remove' btn_css_color='btn-warning' %}")
+        self.assertIn('class="btn btn-warning btn-sm"', output)
+        self.assertIn(">Remove&nbsp;", output)
+        self.assertIn('href="/b/"', render("{% btn_back url='/b/' %}"))
+
+    def test_override_preset(self):
+        self.register(ButtonPreset("delete", text="Remove", icon="times", btn_css_color="btn-warning"))
+        output = render("{% btn_delete '/d/' %}")
+        self.assertIn('class="btn btn-warning btn-sm"', output)
+        self.assertIn(">Remove&nbsp;", output)
+
+    def test_custom_preset(self):
+        self.register(ButtonPreset("archive", text="Archive", icon="archive", btn_css_color="btn-info"))
+        output = render("{% btn_archive '/a/' %}")
+        self.assertEqual(output, presets["archive"].render(Context(), "/a/"))
+        self.assertIn('class="btn btn-info btn-sm"', output)
+
+    def test_colliding_names(self):
+        for name in ("group", "switch", "row_actions"):
+            with self.subTest(name=name):
+                with self.assertRaisesMessage(ImproperlyConfigured, f"the btn_{name} tag is already registered"):
+                    register_preset(ButtonPreset(name, text="Text"))
+                self.assertNotIn(name, presets)
+        # The custom presets can be registered again
+        self.register(ButtonPreset("archive", text="Archive"))
+        self.register(ButtonPreset("archive", text="Archive", icon="archive"))
+        self.assertEqual(presets["archive"].defaults["icon"], "archive")
+
+    def test_output(self):
+        # The button data computed once for the preset, as resolved at each call
+        for preset, overrides, context in itertools.product(BUILTIN_PRESETS, OVERRIDES, CONTEXTS):
+            with self.subTest(preset=preset.name, overrides=overrides, context=context):
+                compiled = presets[preset.name]
+                expected = btn_button(Context(context), **{**compiled.defaults, **overrides})
+                self.assertEqual(compiled.get_output(Context(context), dict(overrides)), expected)
+
+    def test_defaults_output(self):
+        compiled = presets["delete"]
+        self.assertIs(compiled.get_defaults_output(), compiled.get_defaults_output())
+        with override_settings(BUTTONS_LEAN_MARKUP=True):
+            self.assertTrue(compiled.get_defaults_output()["lean"])
+        self.assertFalse(compiled.get_defaults_output()["lean"])
+
+    def test_settings(self):
+        with override_settings(BUTTONS_BTN_CSS_EXTRA="btn-lg"):
+            self.assertIn('class="btn btn-danger btn-lg"', render("{% btn_delete '/d/' %}"))
+        self.assertIn('class="btn btn-danger btn-sm"', render("{% btn_delete '/d/' %}"))
@@ -0,0 +1,196 @@
+"""
+Tests of the :func:`buttons.templatetags.querystring_tags.query_string` tags and of the :mod:`buttons.querystate`
+state tokens
+
+:creationdate: 22/10/2026 10:30
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_querystring
+
+"""
+
+import itertools
+from typing import Any, Dict, List, Tuple
+
+from django.http import QueryDict
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from buttons.querystate import compact_query_string, decode_state, encode_state, expand_query_state
+from buttons.templatetags.querystring_tags import QueryStringNode, build_query_string, build_query_string_range
+
+#: Base query strings, with multi-valued parameters
+BASES: List[Any] = [
+    None,
+    "",
+    "?tag=a&m=1&m=3&tag=b",
+    "tag=a&tag=b&tag=a&year=2011&q=caf%C3%A9+cr%C3%A8me",
+    QueryDict("tag=b&tag=a&page=2&x=%26%3D"),
+    {"tag": ["a", "b"], "year": 2011, "month": 2},
+    [("tag", "a"), ("m", 1), ("tag", "c")],
+]
+
+#: Modifiers, as ``(name, op, value)`` tuples
+MODIFIERS: List[List[Tuple[str, str, Any]]] = [
+    [],
+    [("tag", "+", "c")],
+    [("tag", "+", ["c", "a"]), ("m", "=", 2)],
+    [("tag", "-", "a")],
+    [("tag", "-", ["a", "b", "z"]), ("year", "=", None)],
+    [("tag", "=", ["x", "y", "x"]), ("page", "-", "2")],
+    [("m", "+", 3), ("m", "-", "1"), ("new", "+", ["é", "&="])],
+    [("tag", "=", ""), ("month", "+", 4)],
+    [("year", "-", 2011), ("tag", "+", "b")],
+]
+
+
+def reference_query_string(query_dict, modifiers) -> str:
+    """
+    Builds a query string as the original :func:`query_string` tag did, by modifying a
+    :class:`django.http.QueryDict`, with the ``^`` toggle operator added
+
+    :param query_dict: Base query string, dict or QueryDict
+    :param modifiers: Modifiers, as ``(name, op, value)`` tuples
+    :return: Query string
+    """
+    query_dict = QueryStringNode._get_initial_query_dict(query_dict)
+    for k, op, v in modifiers:
+        current_list = query_dict.getlist(k)
+        values = [str(item) for item in (v if isinstance(v, (list, tuple)) else [v])]
+        if not v:
+            current_list = [] if op == "=" else current_list
+        elif op == "=":
+            current_list = values
+        elif op == "+":
+            current_list = current_list + values
+        elif op == "-":
+            for item in values:
+                while item in current_list:
+                    current_list.remove(item)
+        elif op == "^":
+            for item in dict.fromkeys(values):
+                if item in current_list:
+                    current_list = [current for current in current_list if current != item]
+                else:
+                    current_list.append(item)
+        query_dict.setlist(k, current_list)
+    query_string = query_dict.urlencode()
+    return "?" + query_string if query_string else query_string
+
+
+def render(source: str, context: Dict[str, Any]) -> str:
+    """
+    Renders a template source, with the query string tags loaded
+
+    :param source: Template source
+    :param context: Rendering context
+    :return: Rendered template
+    """
+    return Template("{% load querystring_tags %}" + source).render(Context(context))
+
+
+class QueryStringTestCase(SimpleTestCase):
+    """
+    Tests of the :func:`buttons.templatetags.querystring_tags.query_string` tag
+    """
+
+    def test_reference(self):
+        for base, modifiers in itertools.product(BASES, MODIFIERS):
+            with self.subTest(base=base, modifiers=modifiers):
+                self.assertEqual(build_query_string(base, modifiers), reference_query_string(base, modifiers))
+
+    def test_reference_toggle(self):
+        toggles = [[("tag", "^", "b")], [("tag", "^", ["a", "c", "c"])], [("tag", "^", "z"), ("tag", "^", "z")]]
+        for base, modifiers in itertools.product(BASES, toggles):
+            with self.subTest(base=base, modifiers=modifiers):
+                self.assertEqual(build_query_string(base, modifiers), reference_query_string(base, modifiers))
+
+    def test_tag(self):
+        context = {"qs": {"tag": ["a", "b"], "year": 2011, "month": 2}, "tags": ["c", "d"], "m": 4}
+        self.assertEqual(
+            render("{% query_string qs tag+tags month=m %}", context), "?tag=a&tag=b&tag=c&tag=d&year=2011&month=4"
+        )
+        self.assertEqual(
+            render("{% query_string '?tag=a&m=1&m=3&tag=b' tag+'c' m=2 tag-'b' as myqs %}{{ myqs }}", {}),
+            "?tag=a&amp;tag=c&amp;m=2",
+        )
+
+    def test_remove(self):
+        self.assertEqual(build_query_string("?tag=a&tag=b&tag=a", [("tag", "-", "a")]), "?tag=b")
+        self.assertEqual(build_query_string("?tag=a&year=1", [("tag", "-", ["a", "z"])]), "?year=1")
+        self.assertEqual(build_query_string("?page=2", [("page", "-", 2)]), "")
+
+    def test_toggle(self):
+        self.assertEqual(render("{% query_string '?tag=a&tag=b' tag^'b' tag^'c' %}", {}), "?tag=a&tag=c")
+        self.assertEqual(build_query_string("?tag=a&tag=a", [("tag", "^", "a")]), "")
+        self.assertEqual(build_query_string("?tag=a", [("tag", "^", ["b", "b"])]), "?tag=a&tag=b")
+
+    def test_range(self):
+        base = QueryDict("tag=a&page=1&tag=b&q=x")
+        for name, values in (("page", range(1, 5)), ("tag+", ["c", "a"]), ("tag-", ["a", "z"]), ("tag^", ["b", "d"])):
+            op = name[-1] if name[-1] in "+-^" else "="
+            expected = [build_query_string(base, [("year", "=", 2011), (name.rstrip("+-^"), op, v)]) for v in values]
+            with self.subTest(name=name):
+                self.assertEqual(build_query_string_range(base, name, values, [("year", "=", 2011)]), expected)
+
+    def test_range_tag(self):
+        source = (
+            "{% query_string_range qs 'page' pages as links %}"
+            "{% for page, link in links %}{{ page }}:{{ link }} {% endfor %}"
+        )
+        output = render(source, {"qs": "?tag=a&page=1&tag=b", "pages": [1, 2]})
+        self.assertEqual(output, "1:?tag=a&amp;tag=b&amp;page=1 2:?tag=a&amp;tag=b&amp;page=2 ")
+
+    def test_mutable_base(self):
+        # Mutable bases are parsed at each rendering
+        qs = {"tag": ["a"]}
+        template = Template("{% load querystring_tags %}{% query_string qs %}|")
+        context = Context({"qs": qs})
+        first = template.render(context)
+        qs["tag"].append("b")
+        self.assertEqual((first, template.render(context)), ("?tag=a|", "?tag=a&tag=b|"))
+
+
+class QueryStateTestCase(SimpleTestCase):
+    """
+    Tests of the :mod:`buttons.querystate` state tokens
+    """
+
+    def test_round_trip(self):
+        query = "tag=" + "&tag=".join(str(i) for i in range(200))
+        self.assertEqual(decode_state(encode_state(query)), query)
+
+    def test_max_length(self):
+        query = "a=" + "b" * 998
+        token = encode_state(query)
+        self.assertEqual(decode_state(token, max_length=1000), query)
+        with self.assertRaisesMessage(ValueError, "too long"):
+            decode_state(token, max_length=999)
+        with override_settings(BUTTONS_QUERY_STATE_MAX_LENGTH=100):
+            with self.assertRaises(ValueError):
+                decode_state(token)
+
+    def test_invalid(self):
+        for token in ("", "not a token", encode_state("a=1")[:-2], "eJzLtDJUqH4d5gxAA"):
+            with self.subTest(token=token):
+                with self.assertRaises(ValueError):
+                    decode_state(token)
+
+    @override_settings(BUTTONS_QUERY_STATE=True, BUTTONS_QUERY_STATE_MIN_LENGTH=64)
+    def test_compact(self):
+        short = "?tag=a"
+        self.assertEqual(compact_query_string(short), short)
+        long = "?" + "&".join(f"tag={i}" for i in range(100))
+        compacted = compact_query_string(long)
+        self.assertTrue(compacted.startswith("?_qs="))
+        self.assertEqual(decode_state(compacted[5:]), long[1:])
+        self.assertEqual(build_query_string(long, []), compacted)
+
+    @override_settings(BUTTONS_QUERY_STATE_MAX_LENGTH=64)
+    def test_expand(self):
+        token = encode_state("tag=a&tag=b")
+        request = RequestFactory().get(f"/?page=2&_qs={token}")
+        self.assertEqual(list(expand_query_state(request).lists()), [("tag", ["a", "b"]), ("page", ["2"])])
+
+        # Too long once expanded: dropped
+        request = RequestFactory().get(f"/?page=2&_qs={encode_state('a=' + 'b' * 100)}")
+        self.assertEqual(list(expand_query_state(request).lists()), [("page", ["2"])])
@@ -0,0 +1,176 @@
+"""
+Differential tests of the fast renderers of :mod:`buttons.renderers`
+
+Every ``btn_*`` tag is rendered through the templates and through the fast renderers, with the fontawesome 4 and 5
+packages, the webfont and sprite icons, the autoescaping on and off, and ``DEBUG`` on and off: both outputs must be
+the same, byte for byte.
+
+:creationdate: 22/10/2026 09:20
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_renderers
+
+"""
+
+import importlib
+import itertools
+from typing import Any, Dict, List, Tuple
+
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import SimpleTestCase, override_settings
+from django.utils.safestring import mark_safe
+
+from buttons.presets import BUILTIN_PRESETS, presets
+from buttons.templatetags.buttons_tags import BUTTON_TAGS
+
+#: Calls of the button tags, without their additional params
+BUTTON_CALLS: Dict[str, str] = {
+    "btn_button": "btn_button",
+    "btn_copy": "btn_copy '/copy/'",
+    "btn_download": "btn_download url",
+    "btn_back": "btn_back",
+    "btn_link": "btn_link url",
+    "btn_home": "btn_home",
+    "btn_submit": "btn_submit",
+    "btn_list": "btn_list url",
+    "btn_detail": "btn_detail url",
+    "btn_create": "btn_create url",
+    "btn_search": "btn_search",
+    "btn_close": "btn_close 'Close'",
+    "btn_login": "btn_login url",
+    "btn_logout": "btn_logout url",
+    "btn_update": "btn_update url",
+    "btn_delete": "btn_delete '/delete/?a=1&b=2'",
+    "btn_next": "btn_next '/next/'",
+    "btn_previous": "btn_previous '/previous/'",
+}
+
+#: Additional params of the button tags
+BUTTON_PARAMS: List[str] = [
+    "",
+    "btn_id='button-1'",
+    "title='It<s'",
+    "text=text",
+    "icon_position='ONLY'",
+    "icon_position='NONE'",
+    "icon_position='left'",
+    "data_toggle='modal' data_target='#modal' data_placement='top'",
+    "name='action' value='1' foo='bar'",
+    "icon=''",
+    "btn_css_extra='' btn_css_color='btn-info'",
+]
+
+#: Calls of the other tags
+OTHER_CALLS: Dict[str, List[str]] = {
+    "btn_switch": [
+        "btn_switch value 'Yes,No'",
+        "btn_switch value 'Yes,No,Maybe' large=False btn_id='switch' data_pk=3 data_on=True switch_url='/s/?a&b'",
+        "btn_switch value 'Published,Draft' switch_icons='check,times' switch_colors='primary,default' title=text",
+    ],
+    "btn_single": [
+        "btn_single 'home' 'primary' 'a\"lt'",
+        "btn_single icon 'info' text",
+    ],
+}
+
+#: Rendering contexts
+CONTEXTS: List[Dict[str, Any]] = [
+    {"url": "/objects/<1>/", "text": "A & B", "value": True},
+    {"url": "/objects/1/", "text": mark_safe("<b>A</b>  <i>B</i>"), "icon": "home", "value": None},
+]
+
+#: Fontawesome packages: name, settings overrides
+PACKAGES: List[Tuple[str, Dict[str, Any]]] = [
+    ("fontawesome-5", {"BUTTONS_FONTAWESOME_VERSION": 5}),
+    ("fontawesome-4", {"BUTTONS_FONTAWESOME_VERSION": 4}),
+]
+
+#: Modules rendering the webfont icons, by package
+FONT_MODULES: Dict[str, str] = {
+    "fontawesome-5": "fontawesome_5",
+    "fontawesome-4": "fontawesome.templatetags.fontawesome",
+}
+
+
+def has_font_icons(package: str) -> bool:
+    """
+    Checks that the webfont icons of a package can be rendered
+
+    :param package: Fontawesome package
+    :return: True if the icons module can be imported
+    """
+    try:
+        importlib.import_module(FONT_MODULES[package])
+    except ImportError:
+        return False
+    return True
+
+
+def get_sources() -> List[str]:
+    """
+    Gets the template sources of the tags calls
+
+    :return: Template sources
+    """
+    calls = [
+        "{% " + f"{call} {params}".strip() + " %}"
+        for call, params in itertools.product(BUTTON_CALLS.values(), BUTTON_PARAMS)
+    ]
+    calls += ["{% " + call + " %}" for other in OTHER_CALLS.values() for call in other]
+    return calls
+
+
+def render(source: str, context: Dict[str, Any], autoescape: bool) -> str:
+    """
+    Renders a tag call
+
+    :param source: Template source of the call
+    :param context: Rendering context
+    :param autoescape: Autoescaping
+    :return: Rendered HTML, or the exception class name
+    """
+    try:
+        template = Template("{% load buttons_tags %}" + source)
+        return template.render(Context(context, autoescape=autoescape))
+    except (TemplateSyntaxError, TypeError, ValueError) as exception:
+        return type(exception).__name__
+
+
+class FastRendererTestCase(SimpleTestCase):
+    """
+    Compares the output of the fast renderers to the output of the templates
+    """
+
+    def test_all_tags(self):
+        # The tags of the project presets render `btn_button`
+        preset_tags = {preset.tag_name for preset in presets if preset not in BUILTIN_PRESETS}
+        self.assertEqual(set(BUTTON_CALLS) | set(OTHER_CALLS), set(BUTTON_TAGS) - preset_tags)
+
+    def render_all(self, autoescape: bool) -> Dict[Tuple[str, int], Tuple[str, str]]:
+        """
+        Renders all the calls with the templates and with the fast renderers
+
+        :param autoescape: Autoescaping
+        :return: Outputs of the templates and of the fast renderers, by call and context index
+        """
+        outputs = {}
+        for source, (index, context) in itertools.product(get_sources(), enumerate(CONTEXTS)):
+            with override_settings(BUTTONS_FAST_RENDERER=False):
+                expected = render(source, context, autoescape)
+            with override_settings(BUTTONS_FAST_RENDERER=True):
+                output = render(source, context, autoescape)
+            outputs[(source, index)] = (expected, output)
+        return outputs
+
+    def test_fast_renderers(self):
+        variants = itertools.product(PACKAGES, ["font", "sprite"], [True, False], [False, True], [False, True])
+        for (package, overrides), icon_mode, autoescape, debug, lean in variants:
+            with self.subTest(package=package, icon_mode=icon_mode, autoescape=autoescape, debug=debug, lean=lean):
+                if icon_mode == "font" and not has_font_icons(package):
+                    self.skipTest(f"The webfont icons of {package} cannot be rendered")
+
+                with override_settings(**overrides, BUTTONS_ICON_MODE=icon_mode, DEBUG=debug, BUTTONS_LEAN_MARKUP=lean):
+                    outputs = self.render_all(autoescape)
+                differences = {key: values for key, values in outputs.items() if values[0] != values[1]}
+                self.assertEqual(differences, {})
+                # The calls are rendered, not only failing the same way on both paths
+                self.assertIn("<button", "".join(expected for expected, _output in outputs.values()))
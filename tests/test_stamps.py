@@ -0,0 +1,115 @@
+"""
+Tests of the button stamps of :mod:`buttons.stamps`, and of the row actions of :mod:`buttons.batch` built on them
+
+:creationdate: 23/10/2026 09:15
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_stamps
+
+"""
+
+import itertools
+from typing import Any, Dict, List, Tuple
+
+from django.template import Context, Template
+from django.test import SimpleTestCase
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from buttons.batch import render_row_actions
+from buttons.stamps import Hole, join_holes, split_holes, stamp
+
+#: Stamps: tag name, holes, shared kwargs
+STAMPS: List[Tuple[str, List[str], Dict[str, Any]]] = [
+    ("btn_delete", ["url", "btn_id"], {"text": "Remove"}),
+    ("btn_update", ["url", "text"], {}),
+    ("btn_button", ["url", "data_pk", "foo"], {"text": "T"}),
+    ("btn_button", ["title", "value"], {"name": "n"}),
+    ("btn_switch", ["btn_id", "data_pk"], {"value": True, "switch_alts": "Yes,No"}),
+    ("btn_single", ["alt"], {"icon": "home", "color": "primary"}),
+]
+
+#: Values of the holes
+VALUES: List[Any] = ["/a/1/?x=1&y=2", "A & B", "it's", mark_safe("<b>x</b>"), "a<b", "", "  ", 3, True, None]
+
+
+def render_tag(name: str, kwargs: Dict[str, Any], autoescape: bool) -> str:
+    """
+    Renders a button tag through the template engine
+
+    :param name: Button tag name
+    :param kwargs: Tag kwargs, passed as context variables
+    :param autoescape: Autoescaping
+    :return: Rendered button
+    """
+    # The context variables are prefixed: the tags resolve their empty values from the context
+    params = " ".join(f"{key}=param_{key}" for key in kwargs)
+    template = Template("{% load buttons_tags %}{% " + f"{name} {params}" + " %}")
+    context = {f"param_{key}": value for key, value in kwargs.items()}
+    return template.render(Context(context, autoescape=autoescape))
+
+
+class SplitHolesTestCase(SimpleTestCase):
+    """
+    Tests of :func:`buttons.stamps.split_holes`
+    """
+
+    def test_split(self):
+        parts = split_holes(lambda a, b: f'<a href="{escape(a)}">{b}</a>', ["a", "b"])
+        self.assertEqual(parts, ['<a href="', Hole("a", True), '">', Hole("b", False), "</a>"])
+        self.assertEqual(join_holes(parts, {"a": "&", "b": "B"}), '<a href="&amp;">B</a>')
+
+    def test_no_holes(self):
+        self.assertEqual(split_holes(lambda: "<i></i>", []), ["<i></i>"])
+        self.assertEqual(split_holes(lambda a: "<i></i>", ["a"]), ["<i></i>"])
+
+    def test_transformed(self):
+        with self.assertRaises(ValueError):
+            split_holes(lambda a: a.replace("&", "and"), ["a"])
+
+
+class ButtonStampTestCase(SimpleTestCase):
+    """
+    Compares the output of the stamps to the output of the tags
+    """
+
+    def test_stamps(self):
+        for (name, holes, kwargs), autoescape in itertools.product(STAMPS, [True, False]):
+            context = Context(autoescape=autoescape)
+            button = stamp(name, *holes, context=context, **kwargs)
+            for value in VALUES:
+                values = {key: value for key in holes}
+                with self.subTest(name=name, holes=holes, autoescape=autoescape, value=value):
+                    self.assertEqual(button.render(**values), render_tag(name, {**kwargs, **values}, autoescape))
+
+    def test_compiled(self):
+        self.assertTrue(stamp("btn_delete", "url", "btn_id").compiled)
+        # The value of the switches is transformed by `escapejs`
+        button = stamp("btn_switch", "value", switch_alts="Yes,No")
+        self.assertFalse(button.compiled)
+        self.assertEqual(
+            button.render(value="x"), render_tag("btn_switch", {"value": "x", "switch_alts": "Yes,No"}, True)
+        )
+
+    def test_unknown_tag(self):
+        with self.assertRaisesMessage(ValueError, "Unknown button tag"):
+            stamp("btn_unknown", "url")
+
+
+class RowActionsTestCase(SimpleTestCase):
+    """
+    Compares the row actions to the output of the tags
+    """
+
+    def test_row_actions(self):
+        rows = [{"pk": 1, "url": "/a/1/", "text": "A & B"}, {"pk": 2, "url": "", "text": mark_safe("<b>x</b>")}]
+        actions = [
+            ("btn_delete", {"url": lambda row: row["url"], "btn_id": lambda row: f"delete-{row['pk']}"}),
+            ("btn_update", {"url": lambda row: row["url"], "text": lambda row: row["text"]}),
+            ("btn_switch", {"value": True, "switch_alts": "Yes,No", "data_pk": lambda row: row["pk"]}),
+        ]
+        for row_actions, row in zip(render_row_actions(rows, actions), rows):
+            expected = [
+                render_tag(name, {key: value(row) if callable(value) else value for key, value in kwargs.items()}, True)
+                for name, kwargs in actions
+            ]
+            self.assertEqual(row_actions.buttons, expected)
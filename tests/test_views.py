@@ -0,0 +1,76 @@
+"""
+Tests of the :class:`buttons.views.ButtonFragmentsView` view
+
+:creationdate: 22/10/2026 14:05
+:moduleauthor: François GUÉRIN <fguerin@ville-tourcoing.fr>
+:modulename: tests.test_views
+
+"""
+
+import json
+from typing import Any, Dict, List
+
+from django.template import Context, Template
+from django.test import RequestFactory, SimpleTestCase
+
+from buttons.views import ButtonFragmentsView
+
+
+class ButtonFragmentsViewTestCase(SimpleTestCase):
+    """
+    Tests of the fragments endpoint
+    """
+
+    def get(self, specs: List[Dict[str, Any]], view=ButtonFragmentsView.as_view(), **headers):
+        request = RequestFactory().get("/buttons/fragments/", {"buttons": json.dumps(specs)}, **headers)
+        return view(request)
+
+    def test_fragments(self):
+        params = {"url": "/articles/1/delete/", "btn_id": "del-1", "text": "Remove <1>"}
+        response = self.get([{"key": "del-1", "name": "delete", "params": params}, {"name": "home"}])
+        self.assertEqual(response.status_code, 200)
+        fragments = json.loads(response.content)["fragments"]
+
+        source = "{% load buttons_tags %}{% btn_delete url btn_id=btn_id text=text %}"
+        self.assertEqual(fragments["del-1"], Template(source).render(Context(params)))
+        self.assertEqual(fragments["1"], Template("{% load buttons_tags %}{% btn_home %}").render(Context()))
+
+    def test_named_params(self):
+        spec = {"name": "switch", "params": {"value": True, "switch_alts": "Yes,No", "switch_url": "/s/"}}
+        response = self.get([spec])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('data-url="/s/"', json.loads(response.content)["fragments"]["0"])
+
+    def test_unknown_params(self):
+        for params in ({"url": "/", "onclick": "alert(1)"}, {"style": "x"}, {"context": "x"}, {"data_pk": 1}):
+            with self.subTest(params=params):
+                self.assertEqual(self.get([{"name": "delete", "params": params}]).status_code, 400)
+
+    def test_allowed_params(self):
+        view = ButtonFragmentsView.as_view(allowed_params=(*ButtonFragmentsView.allowed_params, "data_pk"))
+        response = self.get([{"name": "update", "params": {"url": "/u/", "data_pk": 3}}], view=view)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('data_pk="3"', json.loads(response.content)["fragments"]["0"])
+
+    def test_invalid_specs(self):
+        switches = [
+            {"name": "switch", "params": {"value": True, "switch_alts": 5}},
+            {"name": "switch", "params": {"value": True, "switch_alts": "Yes,No", "switch_icons": 1.5}},
+        ]
+        for specs in ([{"name": "unknown"}], [{"name": "delete", "params": {"url": ["/"]}}], ["delete"], switches):
+            with self.subTest(specs=specs):
+                self.assertEqual(self.get(specs).status_code, 400)
+
+    def test_etag(self):
+        specs = [{"name": "home"}]
+        etag = self.get(specs)["ETag"]
+        self.assertEqual(self.get(specs, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_post(self):
+        body = json.dumps({"buttons": [{"name": "home"}]})
+        request = RequestFactory().post("/buttons/fragments/", body, content_type="application/json")
+        response = ButtonFragmentsView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("<a", json.loads(response.content)["fragments"]["0"])
+        self.assertFalse(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Cache-Control"))